@@ -0,0 +1,234 @@
+"""benchmarks/carga_servidor.py
+
+Generador de carga para la API HTTP/JSON (modulos/servidor.py) contra
+localhost. Levanta el servidor en un proceso aparte con clientes
+sintéticos y lo consulta desde muchas conexiones keep-alive a la vez con
+una mezcla de búsquedas por email (parte sobre unos pocos emails
+"calientes", para que se noten las búsquedas coalescidas), listados
+paginados, altas y modificaciones.
+
+Informa peticiones/s y latencia p50/p99 por operación, y las tandas de
+búsqueda y escritura del servidor. Con --importar, una conexión aparte
+sube además un CSV por /importar mientras dura la carga.
+
+Uso (desde la raíz del proyecto):
+
+    python -m benchmarks.carga_servidor [--clientes 100k] [--peticiones 50k] [--conexiones 64] [--importar 50k]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import random
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from benchmarks.datos_sinteticos import escribir_csv, filas_sinteticas, leer_cantidad
+from benchmarks.suite import percentil
+from modulos.archivos import importar_csv
+from modulos.concurrencia import GestorConcurrente
+from modulos.logger_config import obtener_logger
+from modulos.servidor import servir
+
+
+HOST = "127.0.0.1"
+# Fracción de cada operación en la mezcla
+MEZCLA = (("buscar", 0.8), ("listar", 0.1), ("alta", 0.05), ("modificar", 0.05))
+# Fracción de búsquedas sobre los emails calientes
+FRACCION_CALIENTES = 0.3
+CALIENTES = 10
+
+
+# -------- Servidor (proceso aparte) --------
+def _proceso_servidor(puerto: int, clientes: int, carpeta: str) -> None:
+    obtener_logger().disabled = True  # medir la API, no el log
+    ruta_csv = Path(carpeta) / "base.csv"
+    escribir_csv(ruta_csv, clientes)
+    gestor = GestorConcurrente()
+    importar_csv(gestor, ruta_csv)
+    try:
+        asyncio.run(servir(gestor, HOST, puerto))
+    except KeyboardInterrupt:
+        pass
+
+
+async def _esperar_servidor(puerto: int, proceso, segundos: float = 120.0) -> None:
+    limite = time.perf_counter() + segundos
+    while time.perf_counter() < limite:
+        if not proceso.is_alive():
+            raise RuntimeError("El servidor terminó antes de empezar a atender.")
+        try:
+            _, escritor = await asyncio.open_connection(HOST, puerto)
+        except OSError:
+            await asyncio.sleep(0.1)
+            continue
+        escritor.close()
+        return
+    raise RuntimeError("El servidor no empezó a atender a tiempo.")
+
+
+# -------- Cliente HTTP mínimo --------
+class Conexion:
+    def __init__(self, lector, escritor):
+        self.lector = lector
+        self.escritor = escritor
+
+    @classmethod
+    async def abrir(cls, puerto: int) -> "Conexion":
+        return cls(*await asyncio.open_connection(HOST, puerto))
+
+    async def pedir(self, metodo: str, ruta: str, cuerpo: bytes = b"", tipo: str = "application/json"):
+        """Envía una petición y retorna (estado, cuerpo)."""
+        cabecera = f"{metodo} {ruta} HTTP/1.1\r\nHost: {HOST}\r\nContent-Length: {len(cuerpo)}\r\n"
+        if cuerpo:
+            cabecera += f"Content-Type: {tipo}\r\n"
+        self.escritor.write(cabecera.encode("latin-1") + b"\r\n" + cuerpo)
+        respuesta = await self.lector.readuntil(b"\r\n\r\n")
+        lineas = respuesta.decode("latin-1").split("\r\n")
+        estado = int(lineas[0].split(" ", 2)[1])
+        largo = next(int(l.split(":", 1)[1]) for l in lineas if l.lower().startswith("content-length:"))
+        return estado, await self.lector.readexactly(largo)
+
+    def cerrar(self) -> None:
+        self.escritor.close()
+
+
+class Carga:
+    """Reparte las peticiones entre las conexiones y junta las latencias."""
+
+    def __init__(self, args):
+        self.args = args
+        self.restantes = args.peticiones
+        self.latencias = defaultdict(list)
+        self.errores = defaultdict(int)
+        self.altas = 0
+        self.importando = False
+        self.durante_importacion = 0
+
+    def _peticion(self, azar: random.Random):
+        operacion = azar.choices([nombre for nombre, _ in MEZCLA], [peso for _, peso in MEZCLA])[0]
+        clientes = self.args.clientes
+        if operacion == "buscar":
+            i = azar.randrange(CALIENTES) if azar.random() < FRACCION_CALIENTES else azar.randrange(clientes)
+            return operacion, "GET", f"/clientes/cliente{i}@correo.cl", b""
+        if operacion == "listar":
+            return operacion, "GET", f"/clientes?pagina={azar.randint(1, 50)}&por_pagina=20", b""
+        if operacion == "alta":
+            self.altas += 1
+            n = self.altas
+            datos = {
+                "tipo": "premium", "nombre": f"Carga {n}", "email": f"carga{n}@servidor.cl",
+                "telefono": f"+56 9 {n:08d}", "direccion": f"Calle {n} Carga",
+            }
+            return operacion, "POST", "/clientes", json.dumps(datos).encode()
+        i = azar.randrange(CALIENTES, clientes)
+        datos = {"telefono": f"+56 2 {azar.randrange(10**8):08d}", "tipo": azar.choice(("regular", "premium"))}
+        return operacion, "PUT", f"/clientes/cliente{i}@correo.cl", json.dumps(datos).encode()
+
+    async def trabajar(self, puerto: int, semilla: int) -> None:
+        azar = random.Random(semilla)
+        conexion = await Conexion.abrir(puerto)
+        try:
+            while self.restantes > 0:
+                self.restantes -= 1
+                operacion, metodo, ruta, cuerpo = self._peticion(azar)
+                inicio = time.perf_counter_ns()
+                estado, _ = await conexion.pedir(metodo, ruta, cuerpo)
+                self.latencias[operacion].append(time.perf_counter_ns() - inicio)
+                if estado >= 400:
+                    self.errores[f"{operacion} {estado}"] += 1
+                if self.importando:
+                    self.durante_importacion += 1
+        finally:
+            conexion.cerrar()
+
+    async def importar(self, puerto: int, filas: int) -> float:
+        """Sube un CSV por /importar y retorna cuánto tardó."""
+        # Emails distintos de los de la base (la base usa cliente<i>@correo.cl)
+        lineas = (linea.replace("@correo.cl", "@importado.cl") for linea in filas_sinteticas(filas, semilla=7))
+        cuerpo = ("tipo,nombre,email,telefono,direccion\n" + "".join(lineas)).encode()
+        conexion = await Conexion.abrir(puerto)
+        self.importando = True
+        inicio = time.perf_counter()
+        try:
+            estado, respuesta = await conexion.pedir("POST", "/importar", cuerpo, "text/csv")
+        finally:
+            self.importando = False
+            conexion.cerrar()
+        if estado != 200:
+            raise RuntimeError(f"/importar respondió {estado}: {respuesta[:200]!r}")
+        return time.perf_counter() - inicio
+
+
+async def _medir(args, puerto: int, proceso) -> int:
+    await _esperar_servidor(puerto, proceso)
+    carga = Carga(args)
+    tareas = [carga.trabajar(puerto, semilla) for semilla in range(args.conexiones)]
+    if args.importar:
+        tareas.append(carga.importar(puerto, args.importar))
+
+    inicio = time.perf_counter()
+    resultados = await asyncio.gather(*tareas)
+    segundos = time.perf_counter() - inicio
+
+    conexion = await Conexion.abrir(puerto)
+    _, estado_servidor = await conexion.pedir("GET", "/estado")
+    conexion.cerrar()
+    estadisticas = json.loads(estado_servidor)
+
+    total = sum(len(muestras) for muestras in carga.latencias.values())
+    print(f"Clientes en el servidor: {args.clientes}; conexiones: {args.conexiones}")
+    print(f"Peticiones: {total} en {segundos:.2f} s -> {total / segundos:,.0f} peticiones/s")
+    print(f"{'operación':<10} {'cantidad':>9} {'p50 ms':>8} {'p99 ms':>8}")
+    for operacion, muestras in sorted(carga.latencias.items()):
+        muestras.sort()
+        print(
+            f"{operacion:<10} {len(muestras):>9} {percentil(muestras, 0.5) / 1e6:>8.2f} "
+            f"{percentil(muestras, 0.99) / 1e6:>8.2f}"
+        )
+    print(
+        f"Búsquedas: {estadisticas['busquedas']} en {estadisticas['tandas_busqueda']} tandas "
+        f"({estadisticas['coalescidas']} coalescidas); escrituras: {estadisticas['escrituras']} "
+        f"en {estadisticas['tandas_escritura']} tandas"
+    )
+    if args.importar:
+        segundos_importacion = resultados[-1]
+        print(
+            f"Importación de {args.importar} filas: {segundos_importacion:.2f} s; mientras tanto "
+            f"{carga.durante_importacion / segundos_importacion:,.0f} peticiones/s"
+        )
+    if carga.errores:
+        print("Errores: " + ", ".join(f"{clave}={n}" for clave, n in sorted(carga.errores.items())))
+        return 1
+    return 0
+
+
+def main(argumentos=None) -> int:
+    parser = argparse.ArgumentParser(description="Carga sobre la API HTTP/JSON de clientes en localhost")
+    parser.add_argument("--clientes", type=leer_cantidad, default=100_000, help="Clientes precargados")
+    parser.add_argument("--peticiones", type=leer_cantidad, default=50_000)
+    parser.add_argument("--conexiones", type=int, default=64, help="Conexiones simultáneas")
+    parser.add_argument("--importar", type=leer_cantidad, help="Filas a subir por /importar durante la carga")
+    parser.add_argument("--puerto", type=int, default=8765)
+    args = parser.parse_args(argumentos)
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        proceso = multiprocessing.Process(
+            target=_proceso_servidor, args=(args.puerto, args.clientes, carpeta), daemon=True
+        )
+        proceso.start()
+        try:
+            return asyncio.run(_medir(args, args.puerto, proceso))
+        finally:
+            proceso.terminate()  # SIGTERM: el servidor cierra ordenadamente
+            proceso.join(10)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
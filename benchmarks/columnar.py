@@ -0,0 +1,106 @@
+"""benchmarks/columnar.py
+
+Compara los conteos de GestorClientes.agrupar sobre AlmacenMemoria (un
+Cliente por cliente, recorriendo sus filas) contra AlmacenColumnar, con
+NumPy y sin él (array y Counter).
+
+Por cada tamaño informa la memoria de la carga (tracemalloc) y el tiempo
+de tres consultas: clientes por comuna, por comuna entre los premium con
+celular (prefijo 9) y la selección de esos clientes.
+
+Uso (desde la raíz del proyecto):
+
+    python -m benchmarks.columnar [--clientes 100k,1M]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+import tracemalloc
+
+import modulos.columnar as columnar
+from benchmarks.datos_sinteticos import leer_cantidad
+from modulos.almacenes import AlmacenMemoria
+from modulos.columnar import AlmacenColumnar
+from modulos.gestor_clientes import GestorClientes
+from modulos.logger_config import obtener_logger
+from modulos.tipos_cliente import clase_tipo, tipos_registrados
+
+
+NOMBRES = ("Ana", "Luis", "María", "José", "Carla", "Pedro", "Sofía", "Diego", "Camila", "Jorge")
+APELLIDOS = ("Pérez", "González", "Muñoz", "Rojas", "Díaz", "Soto", "Contreras", "Silva", "Tapia")
+CALLES = ("Los Nogales", "Av. Providencia", "Las Rosas", "Calle Larga", "Av. Grecia", "San Martín")
+COMUNAS = (
+    "Santiago", "Ñuñoa", "Maipú", "La Florida", "Puente Alto", "La Cisterna", "Providencia",
+    "Las Condes", "Valparaíso", "Viña del Mar", "Concepción", "Temuco", "Antofagasta",
+)
+
+
+def _datos(clientes: int, semilla: int = 42) -> list[str]:
+    """Líneas "tipo|nombre|email|teléfono|dirección" de tipos y comunas al azar."""
+    azar = random.Random(semilla)
+    tipos = tipos_registrados()
+    return [
+        f"{azar.choice(tipos)}|{azar.choice(NOMBRES)} {azar.choice(APELLIDOS)}|cliente{i}@correo.cl|"
+        f"+56 {azar.choice('92')} {azar.randrange(10**8):08d}|"
+        f"{azar.choice(CALLES)} {azar.randrange(1, 999)}, {azar.choice(COMUNAS)}"
+        for i in range(clientes)
+    ]
+
+
+def _clientes(datos):
+    # Los textos se separan aquí, como al importar: cada almacén guarda los suyos.
+    for linea in datos:
+        tipo, *campos = linea.split("|")
+        yield clase_tipo(tipo)(*campos)
+
+
+def _cargar(almacen, datos) -> tuple[GestorClientes, float]:
+    """Gestor con los clientes cargados y los MB que ocupó la carga."""
+    tracemalloc.start()
+    almacen.insertar_lote(_clientes(datos))
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return GestorClientes(almacen), memoria / 1024**2
+
+
+def _segundos(funcion) -> float:
+    inicio = time.perf_counter()
+    funcion()
+    return time.perf_counter() - inicio
+
+
+def medir(nombre: str, gestor: GestorClientes, memoria: float) -> None:
+    por_comuna = _segundos(lambda: gestor.agrupar("comuna"))
+    filtrado = _segundos(lambda: gestor.agrupar("comuna", tipo="premium", prefijo_telefono="9"))
+    seleccion = _segundos(lambda: gestor.seleccionar(tipo="premium", prefijo_telefono="9"))
+    print(f"{nombre:<22} {memoria:>8.1f} {por_comuna:>10.3f} {filtrado:>10.3f} {seleccion:>10.3f}")
+
+
+def main(argumentos=None) -> None:
+    parser = argparse.ArgumentParser(description="Conteos por columna: AlmacenMemoria vs AlmacenColumnar")
+    parser.add_argument("--clientes", default="100k,1M", help="Tamaños separados por coma (ej: 100k,1M)")
+    args = parser.parse_args(argumentos)
+    tamanos = [leer_cantidad(texto) for texto in args.clientes.split(",")]
+
+    obtener_logger().disabled = True  # medir los conteos, no el log
+    numpy = columnar.np
+    for clientes in tamanos:
+        datos = _datos(clientes)
+        print(f"\n{clientes:,} clientes")
+        print(f"{'almacén':<22} {'MB carga':>8} {'comuna':>10} {'filtrado':>10} {'selección':>10}")
+        medir("AlmacenMemoria", *_cargar(AlmacenMemoria(), datos))
+        gestor, memoria = _cargar(AlmacenColumnar(), datos)
+        if numpy is not None:
+            medir("AlmacenColumnar+NumPy", gestor, memoria)
+        columnar.np = None
+        try:
+            medir("AlmacenColumnar", gestor, memoria)
+        finally:
+            columnar.np = numpy
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""benchmarks/creacion_clientes.py
+
+Micro-benchmark de creación de clientes: la cadena de if con imports
+locales que usaba GestorClientes (réplica abajo) contra el registro de
+tipos (crear_cliente) y la creación por lote (crear_clientes).
+
+Uso (desde la raíz del proyecto):
+
+    python -m benchmarks.creacion_clientes [filas]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from modulos.excepciones import TipoClienteInvalidoError
+from modulos.tipos_cliente import crear_cliente, crear_clientes
+
+
+# ---- Réplica de la fábrica original (if por tipo + import en cada llamada) ----
+def _crear_original(tipo: str, nombre: str, email: str, telefono: str, direccion: str):
+    t = (tipo or "").strip().lower()
+
+    if t == "regular":
+        from modulos.cliente_regular import ClienteRegular
+
+        return ClienteRegular(nombre, email, telefono, direccion)
+
+    if t == "premium":
+        from modulos.cliente_premium import ClientePremium
+
+        return ClientePremium(nombre, email, telefono, direccion)
+
+    if t == "corporativo":
+        from modulos.cliente_corporativo import ClienteCorporativo
+
+        return ClienteCorporativo(nombre, email, telefono, direccion)
+
+    raise TipoClienteInvalidoError("Tipo de cliente inválido. Use: regular / premium / corporativo")
+
+
+def _filas(filas: int):
+    """Filas ya validadas, como las recibe la importación (tipo normalizado)."""
+    return [
+        (
+            ("regular", "premium", "corporativo")[i % 3],
+            f"Cliente {i}",
+            f"cliente{i}@correo.cl",
+            f"+56 9 {i:08d}",
+            f"Calle {i}, Santiago",
+        )
+        for i in range(filas)
+    ]
+
+
+def _medir(nombre: str, funcion, filas: int) -> None:
+    inicio = time.perf_counter()
+    creados = len(funcion())
+    segundos = time.perf_counter() - inicio
+    print(f"{nombre:<28} {segundos * 1000:9.1f} ms  {filas / segundos:12,.0f} filas/s  (creados={creados})")
+
+
+def main(filas: int = 200_000) -> None:
+    datos = _filas(filas)
+    premium = [fila[1:] for fila in datos]
+    print(f"Filas: {filas}")
+    _medir("if por tipo (original)", lambda: [_crear_original(*fila) for fila in datos], filas)
+    _medir("registro (crear_cliente)", lambda: [crear_cliente(*fila) for fila in datos], filas)
+    _medir("lote mixto (crear_clientes)", lambda: crear_clientes(datos), filas)
+    _medir("lote de un tipo", lambda: crear_clientes(premium, "premium"), filas)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
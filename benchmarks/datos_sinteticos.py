@@ -0,0 +1,136 @@
+"""benchmarks/datos_sinteticos.py
+
+Generador de CSV de clientes sintéticos para las mediciones, desde miles
+hasta decenas de millones de filas. Con la misma semilla se obtiene
+siempre el mismo archivo, así dos corridas miden exactamente lo mismo.
+
+Una fracción de las filas repite el email de una fila anterior
+(`duplicados`) y otra trae un dato inválido (`invalidos`): email sin @,
+teléfono corto, dirección corta o tipo desconocido, en rotación.
+
+Uso (desde la raíz del proyecto):
+
+    python -m benchmarks.datos_sinteticos salida.csv [--filas 1M] [--duplicados 0.05] [--invalidos 0.02]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+
+
+ENCABEZADO = "tipo,nombre,email,telefono,direccion\n"
+# Distintas formas de escribir el tipo, como llegan en archivos reales
+TIPOS = ("regular", "Premium", "ClienteCorporativo", "premium", "Regular")
+NOMBRES = ("Ana", "Luis", "María", "José", "Carla", "Pedro", "Sofía", "Diego")
+APELLIDOS = ("Pérez", "González", "Muñoz", "Rojas", "Díaz", "Soto", "Contreras", "Silva")
+FILAS_POR_ESCRITURA = 10_000
+
+
+@dataclass
+class ResumenSintetico:
+    """Qué se generó, para contrastarlo con lo que informa la importación."""
+
+    filas: int = 0
+    duplicados: int = 0
+    invalidos: int = 0
+
+    @property
+    def unicos(self) -> int:
+        return self.filas - self.duplicados - self.invalidos
+
+
+def leer_cantidad(texto: str) -> int:
+    """Convierte "1k", "250k", "10M" o "5000" en un número de filas."""
+    texto = texto.strip().lower().replace("_", "")
+    factor = {"k": 1_000, "m": 1_000_000}.get(texto[-1:], 1)
+    if factor > 1:
+        texto = texto[:-1]
+    try:
+        cantidad = int(float(texto) * factor)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Cantidad de filas inválida: {texto!r}") from None
+    if cantidad <= 0:
+        raise argparse.ArgumentTypeError("La cantidad de filas debe ser mayor a cero.")
+    return cantidad
+
+
+def _fila_invalida(i: int, nombre: str) -> str:
+    falla = i % 4
+    if falla == 0:
+        return f"regular,{nombre},cliente{i}-correo.cl,+56 9 {i:08d},Calle {i} Santiago\n"
+    if falla == 1:
+        return f"premium,{nombre},cliente{i}@correo.cl,12,Calle {i} Santiago\n"
+    if falla == 2:
+        return f"regular,{nombre},cliente{i}@correo.cl,+56 9 {i:08d},C{i % 10}\n"
+    return f"platino,{nombre},cliente{i}@correo.cl,+56 9 {i:08d},Calle {i} Santiago\n"
+
+
+def filas_sinteticas(
+    filas: int, duplicados: float = 0.0, invalidos: float = 0.0, semilla: int = 42, resumen=None
+):
+    """Genera las líneas del CSV (sin encabezado).
+
+    Si se pasa un ResumenSintetico, se va completando con lo generado.
+    """
+    if not (0 <= duplicados < 1 and 0 <= invalidos < 1 and duplicados + invalidos < 1):
+        raise ValueError("Las tasas de duplicados e inválidos deben sumar menos de 1.")
+    azar = random.Random(semilla)
+    resumen = resumen if resumen is not None else ResumenSintetico()
+    for i in range(filas):
+        nombre = f"{NOMBRES[i % 8]} {APELLIDOS[(i // 8) % 8]} {i}"
+        sorteo = azar.random()
+        resumen.filas += 1
+        if sorteo < invalidos:
+            resumen.invalidos += 1
+            yield _fila_invalida(i, nombre)
+        elif sorteo < invalidos + duplicados and i > 0:
+            # Repite (con otras mayúsculas) el email de una fila anterior.
+            resumen.duplicados += 1
+            n = azar.randrange(i)
+            yield f"regular,{nombre},Cliente{n}@Correo.cl,+56 9 {i:08d},Calle {i} Santiago\n"
+        else:
+            yield f"{TIPOS[i % 5]},{nombre},cliente{i}@correo.cl,+56 9 {i:08d},Calle {i} Santiago\n"
+
+
+def escribir_csv(
+    ruta: Path | str, filas: int, duplicados: float = 0.0, invalidos: float = 0.0, semilla: int = 42
+) -> ResumenSintetico:
+    """Escribe el CSV sintético en `ruta` por bloques (no lo arma en memoria).
+
+    Un "duplicado" que apunta a una fila inválida o a otro duplicado se
+    importa como nuevo, así que los duplicados del resumen son una cota
+    superior de los que informará la importación.
+    """
+    resumen = ResumenSintetico()
+    lineas = filas_sinteticas(filas, duplicados, invalidos, semilla, resumen)
+    with open(ruta, mode="w", newline="", encoding="utf-8") as archivo:
+        archivo.write(ENCABEZADO)
+        while True:
+            bloque = list(islice(lineas, FILAS_POR_ESCRITURA))
+            if not bloque:
+                return resumen
+            archivo.writelines(bloque)
+
+
+def main(argumentos=None) -> None:
+    parser = argparse.ArgumentParser(description="Genera un CSV de clientes sintéticos")
+    parser.add_argument("salida", type=Path)
+    parser.add_argument("--filas", type=leer_cantidad, default=100_000, help="Ej: 1k, 250k, 10M")
+    parser.add_argument("--duplicados", type=float, default=0.05, help="Fracción de emails repetidos")
+    parser.add_argument("--invalidos", type=float, default=0.02, help="Fracción de filas inválidas")
+    parser.add_argument("--semilla", type=int, default=42)
+    args = parser.parse_args(argumentos)
+
+    resumen = escribir_csv(args.salida, args.filas, args.duplicados, args.invalidos, args.semilla)
+    print(
+        f"{args.salida}: filas={resumen.filas} duplicados={resumen.duplicados} "
+        f"invalidos={resumen.invalidos} ({args.salida.stat().st_size / 1e6:.1f} MB)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""benchmarks/duplicados.py
+
+Mide buscar_duplicados (modulos/duplicados.py) sobre clientes sintéticos
+con nombres, teléfonos y direcciones que se repiten como en datos
+reales, más una fracción de "parecidos" sembrados: la misma persona con
+otro email, el nombre en otro orden y otro número de casa, o con otro
+teléfono.
+
+Por cada tamaño informa tiempo, comparaciones hechas frente a las n²/2
+de comparar todos contra todos, grupos encontrados y cuántos de los
+parecidos sembrados quedaron en un grupo (recuperados).
+
+Uso (desde la raíz del proyecto):
+
+    python -m benchmarks.duplicados [--clientes 10k,100k,1M] [--parecidos 0.02]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+
+from benchmarks.datos_sinteticos import leer_cantidad
+from modulos.almacenes import AlmacenMemoria
+from modulos.duplicados import buscar_duplicados
+from modulos.gestor_clientes import GestorClientes
+from modulos.logger_config import obtener_logger
+from modulos.tipos_cliente import clase_tipo, tipos_registrados
+
+
+NOMBRES = (
+    "Ana", "Luis", "María", "José", "Carla", "Pedro", "Sofía", "Diego", "Camila", "Jorge",
+    "Valentina", "Matías", "Isidora", "Tomás", "Fernanda", "Cristóbal", "Josefa", "Benjamín",
+)
+APELLIDOS = (
+    "Pérez", "González", "Muñoz", "Rojas", "Díaz", "Soto", "Contreras", "Silva", "Martínez",
+    "Sepúlveda", "Morales", "Rodríguez", "López", "Fuentes", "Hernández", "Torres", "Araya",
+    "Flores", "Espinoza", "Valenzuela", "Castillo", "Tapia", "Reyes", "Gutiérrez", "Castro",
+)
+CALLES = (
+    "Los Nogales", "Av. Providencia", "Pasaje Las Rosas", "Calle Larga", "Av. Grecia",
+    "Los Aromos", "San Martín", "Av. Matta", "Los Cerezos", "Camino del Alba", "Gran Avenida",
+)
+COMUNAS = ("Santiago", "Ñuñoa", "Maipú", "La Florida", "Puente Alto", "Valparaíso", "Temuco")
+
+
+def _cliente(azar: random.Random, i: int) -> tuple[str, str, str, str]:
+    nombre = f"{azar.choice(NOMBRES)} {azar.choice(APELLIDOS)} {azar.choice(APELLIDOS)}"
+    telefono = f"+56 9 {azar.randrange(10**8):08d}"
+    direccion = f"{azar.choice(CALLES)} {azar.randint(1, 9999)}, {azar.choice(COMUNAS)}"
+    return nombre, f"cliente{i}@correo.cl", telefono, direccion
+
+
+def _parecido(azar: random.Random, original: tuple, i: int) -> tuple[str, str, str, str]:
+    """La misma persona cargada de nuevo con otro email y algún dato cambiado."""
+    nombre, _, telefono, direccion = original
+    email = f"cliente{i}@otro.cl"
+    cambio = azar.randrange(3)
+    if cambio == 0:
+        # Apellidos primero y otro número de casa
+        palabras = nombre.split()
+        nombre = " ".join(palabras[1:] + palabras[:1])
+        calle, _, comuna = direccion.rpartition(" ")
+        direccion = f"{calle.rsplit(' ', 1)[0]} {azar.randint(1, 9999)}, {comuna}"
+    elif cambio == 1:
+        # Otro teléfono, mismos nombre y dirección
+        telefono = f"+56 2 {azar.randrange(10**8):08d}"
+    else:
+        # Sin el segundo apellido y el teléfono escrito de otra forma
+        nombre = " ".join(nombre.split()[:2])
+        telefono = telefono.replace(" ", "")
+    return nombre, email, telefono, direccion
+
+
+def _gestor(clientes: int, parecidos: float, semilla: int = 42) -> tuple[GestorClientes, int]:
+    """Gestor en memoria con `clientes` clientes; retorna también cuántos son parecidos sembrados."""
+    azar = random.Random(semilla)
+    clases = [clase_tipo(tipo) for tipo in tipos_registrados()]
+    datos = []
+    sembrados = 0
+    for i in range(clientes):
+        if datos and azar.random() < parecidos:
+            datos.append(_parecido(azar, datos[azar.randrange(len(datos))], i))
+            sembrados += 1
+        else:
+            datos.append(_cliente(azar, i))
+    almacen = AlmacenMemoria()
+    almacen.insertar_lote(clases[i % len(clases)](*fila) for i, fila in enumerate(datos))
+    return GestorClientes(almacen), sembrados
+
+
+def medir(clientes: int, parecidos: float) -> None:
+    gestor, sembrados = _gestor(clientes, parecidos)
+    resultado = buscar_duplicados(gestor)
+    en_grupos = {email for grupo in resultado.grupos for email in grupo.emails}
+    recuperados = sum(1 for email in en_grupos if email.endswith("@otro.cl"))
+    todos_contra_todos = clientes * (clientes - 1) // 2
+    print(
+        f"{clientes:>10,} {resultado.segundos:>8.2f} {clientes / resultado.segundos:>12,.0f} "
+        f"{resultado.comparaciones:>14,} {resultado.comparaciones / todos_contra_todos:>10.2e} "
+        f"{len(resultado.grupos):>8,} {resultado.bloques_saturados:>10,} "
+        f"{recuperados:>8,}/{sembrados:<8,}"
+    )
+
+
+def main(argumentos=None) -> None:
+    parser = argparse.ArgumentParser(description="Detección de posibles duplicados por bloques")
+    parser.add_argument(
+        "--clientes", default="10k,100k,1M", help="Tamaños separados por coma (ej: 10k,100k,1M)"
+    )
+    parser.add_argument("--parecidos", type=float, default=0.02, help="Fracción de parecidos sembrados")
+    args = parser.parse_args(argumentos)
+    tamanos = [leer_cantidad(texto) for texto in args.clientes.split(",")]
+
+    obtener_logger().disabled = True  # medir la búsqueda, no el log
+    print(
+        f"{'clientes':>10} {'segundos':>8} {'clientes/s':>12} {'comparaciones':>14} "
+        f"{'vs n²/2':>10} {'grupos':>8} {'saturados':>10} {'recuperados':>17}"
+    )
+    for clientes in tamanos:
+        medir(clientes, args.parecidos)
+
+
+if __name__ == "__main__":
+    main()
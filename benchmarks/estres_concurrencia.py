@@ -0,0 +1,241 @@
+"""benchmarks/estres_concurrencia.py
+
+Prueba de estrés del GestorConcurrente: varios hilos lectores consultan
+(buscar_por_email, contar_por_tipo, paginar_clientes, consultar)
+mientras otros escriben (importar_csv de un CSV sintético, altas, bajas y
+cambios de tipo por lote). Cada lectura verifica invariantes:
+
+- cada cliente encontrado es un objeto completo de la clase de su tipo;
+- dentro de `with gestor.lectura():`, len(gestor) == suma del conteo por tipo;
+- un cambiar_tipo_varios se ve entero: todos los clientes del lote con el
+  mismo tipo, nunca la mitad;
+- ningún hilo termina con una excepción.
+
+Al final compara el total y el conteo por tipo con un recuento a mano.
+Con --sin-candado usa el GestorClientes común para ver las fallas que
+aparecen sin sincronización.
+
+Uso (desde la raíz del proyecto):
+
+    python -m benchmarks.estres_concurrencia [--filas 50k] [--lectores 4] [--sqlite] [--sin-candado]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from collections import Counter
+from pathlib import Path
+
+from benchmarks.datos_sinteticos import escribir_csv, leer_cantidad
+from modulos.almacenes import AlmacenSQLite
+from modulos.archivos import importar_csv
+from modulos.concurrencia import GestorConcurrente
+from modulos.gestor_clientes import ELIMINADO, GestorClientes
+from modulos.logger_config import obtener_logger
+from modulos.tipos_cliente import clase_tipo, crear_cliente, nombre_tipo
+from modulos.validaciones import normalizar_email
+
+
+# Clientes fijos que el escritor cambia de tipo siempre todos juntos
+SEMILLAS = 200
+TIPOS = ("regular", "premium", "corporativo")
+
+
+def _semilla(i: int) -> str:
+    return f"semilla{i}@estres.cl"
+
+
+class Estres:
+    """Estado compartido por los hilos de una corrida."""
+
+    def __init__(self, gestor, segundos_escritor: float):
+        self.gestor = gestor
+        self.emails_semilla = [_semilla(i) for i in range(SEMILLAS)]
+        self.fin = threading.Event()
+        self.segundos_escritor = segundos_escritor
+        self.fallas: list[str] = []
+        self.lecturas: list[Counter] = []  # uno por lector (sin compartir contadores)
+        self.altas = 0
+        self.bajas = 0
+        self.importados = 0
+
+    def fallar(self, mensaje: str) -> None:
+        # list.append es atómico; basta con las primeras para el informe.
+        if len(self.fallas) < 50:
+            self.fallas.append(mensaje)
+
+    def hilo(self, nombre: str, funcion):
+        def correr():
+            try:
+                funcion()
+            except Exception:
+                self.fallar(f"{nombre}: {traceback.format_exc(limit=3).strip()}")
+
+        return threading.Thread(target=correr, name=nombre)
+
+    # -------- Verificaciones --------
+    def verificar_cliente(self, clave: str, cliente) -> None:
+        if normalizar_email(cliente.email) != normalizar_email(clave):
+            self.fallar(f"buscar({clave}) devolvió a {cliente.email}")
+        if type(cliente) is not clase_tipo(cliente.tipo()):
+            self.fallar(f"{cliente.email}: clase {type(cliente).__name__} con tipo {cliente.tipo()}")
+
+    # -------- Lectores --------
+    def leer(self, semilla: int) -> None:
+        azar = random.Random(semilla)
+        gestor = self.gestor
+        lecturas = Counter()
+        self.lecturas.append(lecturas)
+        while not self.fin.is_set():
+            operacion = azar.randrange(4)
+            if operacion == 0:
+                clave = azar.choice(self.emails_semilla)
+                cliente = gestor.buscar_por_email(clave)
+                if cliente is None:
+                    self.fallar(f"No se encontró el cliente fijo {clave}")
+                else:
+                    self.verificar_cliente(clave, cliente)
+                lecturas["buscar_por_email"] += 1
+            elif operacion == 1:
+                with gestor.lectura():
+                    total = len(gestor)
+                    conteo = gestor.contar_por_tipo()
+                    tipos = {type(gestor.buscar_por_email(e)) for e in self.emails_semilla[::20]}
+                if sum(conteo.values()) != total:
+                    self.fallar(f"len={total} pero el conteo por tipo suma {sum(conteo.values())}")
+                if len(tipos) != 1:
+                    self.fallar(f"Cambio de tipo por lote visto a medias: {sorted(t.__name__ for t in tipos)}")
+                lecturas["contar_por_tipo"] += 1
+            elif operacion == 2:
+                pagina = gestor.paginar_clientes(por_pagina=20, desde=azar.randrange(SEMILLAS))
+                if len(pagina.clientes) > 20:
+                    self.fallar(f"Página de {len(pagina.clientes)} clientes")
+                for cliente in pagina.clientes:
+                    self.verificar_cliente(cliente.email, cliente)
+                lecturas["paginar_clientes"] += 1
+            else:
+                tipo = azar.choice(TIPOS)
+                pagina = gestor.consultar(tipo=tipo, por_pagina=20)
+                for cliente in pagina.clientes:
+                    if cliente.tipo() != nombre_tipo(tipo):
+                        self.fallar(f"consultar(tipo={tipo}) devolvió un {cliente.tipo()}")
+                lecturas["consultar"] += 1
+
+    def total_lecturas(self) -> Counter:
+        return sum(self.lecturas, Counter())
+
+    # -------- Escritores --------
+    def importar(self, ruta_csv: Path) -> None:
+        resultado = importar_csv(self.gestor, ruta_csv, tamano_lote=500)
+        self.importados = resultado.agregados
+
+    def modificar(self, semilla: int) -> None:
+        azar = random.Random(semilla)
+        gestor = self.gestor
+        vigentes: list[str] = []
+        vuelta = 0
+        limite = time.perf_counter() + self.segundos_escritor
+        while not self.fin.is_set() and time.perf_counter() < limite:
+            vuelta += 1
+            email = f"extra{vuelta}@estres.cl"
+            gestor.agregar_cliente(
+                crear_cliente(azar.choice(TIPOS), f"Extra {vuelta}", email, f"+56 9 {vuelta:08d}", f"Calle {vuelta} Estres")
+            )
+            vigentes.append(email)
+            self.altas += 1
+            gestor.cambiar_tipo_varios(self.emails_semilla, TIPOS[vuelta % 3])
+            if len(vigentes) >= 10:
+                quitar, vigentes = vigentes[:5], vigentes[5:]
+                self.bajas += gestor.eliminar_varios(quitar).conteo().get(ELIMINADO, 0)
+
+
+def _recuento(gestor) -> tuple[int, Counter]:
+    with gestor.lectura():
+        conteo = Counter(cliente.tipo() for cliente in gestor.clientes)
+    return sum(conteo.values()), conteo
+
+
+def correr(args, carpeta: Path) -> int:
+    ruta_csv = carpeta / "estres.csv"
+    escribir_csv(ruta_csv, args.filas, duplicados=0.05, invalidos=0.02)
+
+    clase = GestorClientes if args.sin_candado else GestorConcurrente
+    almacen = AlmacenSQLite(carpeta / "estres.db") if args.sqlite else None
+    gestor = clase(almacen)
+    estres = Estres(gestor, args.segundos)
+    for i, email in enumerate(estres.emails_semilla):
+        gestor.agregar_cliente(crear_cliente("regular", f"Semilla {i}", email, f"+56 2 {i:08d}", f"Avenida {i} Estres"))
+
+    lectores = [estres.hilo(f"lector-{i}", lambda i=i: estres.leer(i)) for i in range(args.lectores)]
+    importador = estres.hilo("importador", lambda: estres.importar(ruta_csv))
+    modificador = estres.hilo("modificador", lambda: estres.modificar(args.lectores))
+
+    inicio = time.perf_counter()
+    for hilo in lectores + [importador, modificador]:
+        hilo.start()
+    importador.join()
+    segundos_importacion = time.perf_counter() - inicio
+    lecturas_importando = sum(estres.total_lecturas().values())
+    modificador.join()
+    estres.fin.set()
+    for hilo in lectores:
+        hilo.join()
+    segundos = time.perf_counter() - inicio
+
+    esperado = SEMILLAS + estres.importados + estres.altas - estres.bajas
+    total, conteo = _recuento(gestor)
+    if total != esperado or len(gestor) != esperado:
+        estres.fallar(f"Total final: len={len(gestor)} recorrido={total} esperado={esperado}")
+    if gestor.contar_por_tipo() != {tipo: n for tipo, n in conteo.items() if n}:
+        estres.fallar(f"Conteo final {gestor.contar_por_tipo()} != recuento {dict(conteo)}")
+    gestor.cerrar()
+
+    print(f"Gestor: {clase.__name__} ({'SQLite' if args.sqlite else 'memoria'}), lectores: {args.lectores}")
+    print(
+        f"Importación: {estres.importados} clientes en {segundos_importacion:.2f} s; "
+        f"altas={estres.altas} bajas={estres.bajas} cambios de tipo por lote={estres.altas}"
+    )
+    lecturas = estres.total_lecturas()
+    print(
+        f"Lecturas: {sum(lecturas.values())} en {segundos:.2f} s; durante la importación "
+        f"{lecturas_importando / segundos_importacion:,.0f} lecturas/s"
+    )
+    for operacion, cantidad in sorted(lecturas.items()):
+        print(f"   {operacion:<18} {cantidad}")
+    print(f"Total final: {len(gestor)} (esperado {esperado})")
+
+    if estres.fallas:
+        print(f"\nFALLAS ({len(estres.fallas)}):")
+        for falla in estres.fallas:
+            print(f" - {falla}")
+        return 1
+    print("OK: sin fallas")
+    return 0
+
+
+def main(argumentos=None) -> int:
+    parser = argparse.ArgumentParser(description="Estrés de lectores y escritores sobre un mismo gestor")
+    parser.add_argument("--filas", type=leer_cantidad, default=50_000, help="Filas del CSV a importar (ej: 50k)")
+    parser.add_argument("--lectores", type=int, default=4)
+    parser.add_argument("--segundos", type=float, default=3.0, help="Duración máxima del hilo de altas/bajas")
+    parser.add_argument("--sqlite", action="store_true", help="Usar AlmacenSQLite en vez de memoria")
+    parser.add_argument("--sin-candado", action="store_true", help="Usar GestorClientes (sin sincronización)")
+    args = parser.parse_args(argumentos)
+
+    logger = obtener_logger()
+    logger.disabled = True  # medir la concurrencia, no el log
+    try:
+        with tempfile.TemporaryDirectory() as carpeta:
+            return correr(args, Path(carpeta))
+    finally:
+        logger.disabled = False
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+"""benchmarks/formatos.py
+
+Compara los formatos de exportar_csv / importar_csv (ver
+modulos/formatos.py): CSV plano, comprimido con gzip, bzip2 y xz, y
+columnar (.gicc). Por cada uno informa el tamaño del archivo y el tiempo
+de exportar todos los clientes y de volver a importarlos en un gestor
+vacío.
+
+Uso (desde la raíz del proyecto):
+
+    python -m benchmarks.formatos [--filas 200k]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.datos_sinteticos import escribir_csv, leer_cantidad
+from modulos.archivos import exportar_csv, importar_csv
+from modulos.gestor_clientes import GestorClientes
+from modulos.logger_config import obtener_logger
+
+
+NOMBRES = ("clientes.csv", "clientes.csv.gz", "clientes.csv.bz2", "clientes.csv.xz", "clientes.gicc")
+
+
+def _segundos(funcion) -> float:
+    inicio = time.perf_counter()
+    funcion()
+    return time.perf_counter() - inicio
+
+
+def main(argumentos=None) -> None:
+    parser = argparse.ArgumentParser(description="Tamaño y tiempos de exportar/importar por formato")
+    parser.add_argument("--filas", type=leer_cantidad, default=200_000, help="Ej: 100k, 1M")
+    args = parser.parse_args(argumentos)
+
+    obtener_logger().disabled = True  # medir el formato, no el log
+    with tempfile.TemporaryDirectory() as carpeta:
+        carpeta = Path(carpeta)
+        entrada = carpeta / "entrada.csv"
+        escribir_csv(entrada, args.filas)
+        gestor = GestorClientes()
+        importar_csv(gestor, entrada)
+
+        print(f"{len(gestor):,} clientes")
+        print(f"{'formato':<18} {'MB':>7} {'exportar':>10} {'importar':>10}")
+        for nombre in NOMBRES:
+            ruta = carpeta / nombre
+            exportar = _segundos(lambda: exportar_csv(gestor, destino=ruta))
+            importar = _segundos(lambda: importar_csv(GestorClientes(), ruta))
+            print(f"{nombre:<18} {ruta.stat().st_size / 1e6:>7.1f} {exportar:>9.2f}s {importar:>9.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""benchmarks/instantanea.py
+
+Compara guardar y volver a cargar todos los clientes con el CSV
+(exportar_csv / importar_csv) contra la instantánea binaria
+(guardar_instantanea / AlmacenInstantanea).
+
+Uso (desde la raíz del proyecto):
+
+    python -m benchmarks.instantanea [clientes]
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from modulos.almacenes import AlmacenMemoria
+from modulos.archivos import exportar_csv, importar_csv
+from modulos.gestor_clientes import GestorClientes
+from modulos.instantanea import AlmacenInstantanea, guardar_instantanea
+from modulos.logger_config import obtener_logger
+from modulos.tipos_cliente import clase_tipo, tipos_registrados
+
+
+def _gestor(clientes: int) -> GestorClientes:
+    clases = [clase_tipo(tipo) for tipo in tipos_registrados()]
+    almacen = AlmacenMemoria()
+    almacen.insertar_lote(
+        clases[i % len(clases)](f"Cliente {i}", f"cliente{i}@correo.cl", f"+56 9 {i:08d}", f"Calle {i}, Santiago")
+        for i in range(clientes)
+    )
+    return GestorClientes(almacen)
+
+
+def _medir(funcion):
+    inicio = time.perf_counter()
+    valor = funcion()
+    return time.perf_counter() - inicio, valor
+
+
+def _abrir_y_usar(ruta: Path, cargar_todo: bool) -> int:
+    """Abre la instantánea, cuenta por tipo y lee la primera página."""
+    gestor = GestorClientes(AlmacenInstantanea(ruta))
+    gestor.contar_por_tipo()
+    gestor.paginar_clientes(por_pagina=10)
+    if cargar_todo:
+        gestor.almacen.cargar_todo()
+    total = len(gestor)
+    gestor.cerrar()
+    return total
+
+
+def main(clientes: int = 200_000) -> None:
+    gestor = _gestor(clientes)
+    obtener_logger().disabled = True  # medir solo el formato
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta_csv = Path(carpeta) / "clientes.csv"
+        ruta_gic = Path(carpeta) / "clientes.gic"
+
+        filas = [
+            ("CSV: guardar", _medir(lambda: exportar_csv(gestor, destino=ruta_csv))[0]),
+            ("CSV: cargar (importar_csv)", _medir(lambda: importar_csv(GestorClientes(), ruta_csv))[0]),
+            ("GIC: guardar", _medir(lambda: guardar_instantanea(gestor, ruta_gic))[0]),
+            ("GIC: abrir + conteo + 1 página", _medir(lambda: _abrir_y_usar(ruta_gic, False))[0]),
+            ("GIC: abrir + cargar todo", _medir(lambda: _abrir_y_usar(ruta_gic, True))[0]),
+        ]
+        tamanos = ruta_csv.stat().st_size, ruta_gic.stat().st_size
+
+    obtener_logger().disabled = False
+    print(f"Clientes: {clientes}  (CSV {tamanos[0] / 1e6:.1f} MB, GIC {tamanos[1] / 1e6:.1f} MB)")
+    for nombre, segundos in filas:
+        print(f"{nombre:<32} {segundos * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,86 @@
+"""benchmarks/log_importacion.py
+
+Mide la importación CSV con el log sincrónico, con el log asíncrono
+(cola + hilo escritor) y sin log. El archivo de entrada tiene muchos
+duplicados para que cada fila genere un registro de log.
+
+Uso (desde la raíz del proyecto):
+
+    python -m benchmarks.log_importacion [filas]
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+import tempfile
+import time
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+from modulos.archivos import importar_csv
+from modulos.gestor_clientes import GestorClientes
+from modulos.logger_config import (
+    FORMATO_LOG,
+    activar_log_asincrono,
+    detener_log_asincrono,
+    obtener_logger,
+)
+
+
+def _crear_csv(ruta: Path, filas: int) -> None:
+    """~80% de las filas repiten un email ya visto (evento DUPLICADO)."""
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        archivo.write("tipo,nombre,email,telefono,direccion\n")
+        for i in range(filas):
+            n = i if i % 5 == 0 else i % max(1, filas // 5)
+            archivo.write(f"regular,Cliente {n},cliente{n}@correo.cl,9{n:08d},Calle {n} Santiago\n")
+
+
+def _redirigir_log(ruta_log: Path) -> logging.Logger:
+    """Hace que el logger del sistema escriba en un archivo temporal."""
+    logger = obtener_logger()
+    for handler in [h for h in logger.handlers if isinstance(h, RotatingFileHandler)]:
+        logger.removeHandler(handler)
+        handler.close()
+    handler = RotatingFileHandler(ruta_log, maxBytes=300_000, backupCount=3, encoding="utf-8")
+    handler.setFormatter(logging.Formatter(FORMATO_LOG))
+    logger.addHandler(handler)
+    return logger
+
+
+def _importar(ruta_csv: Path) -> tuple[float, int]:
+    gestor = GestorClientes()
+    inicio = time.perf_counter()
+    resultado = importar_csv(gestor, ruta_csv)
+    return time.perf_counter() - inicio, resultado.filas_leidas
+
+
+def main(filas: int = 200_000) -> None:
+    with tempfile.TemporaryDirectory() as carpeta:
+        carpeta = Path(carpeta)
+        ruta_csv = carpeta / "entrada.csv"
+        _crear_csv(ruta_csv, filas)
+        logger = _redirigir_log(carpeta / "app.log")
+
+        resultados = {}
+        resultados["log sincrónico"] = _importar(ruta_csv)
+
+        activar_log_asincrono(ruta=carpeta / "app_async.log")
+        inicio = time.perf_counter()
+        segundos, leidas = _importar(ruta_csv)
+        detener_log_asincrono()
+        resultados["log asíncrono"] = (segundos, leidas)
+        resultados["log asíncrono (+vaciado)"] = (time.perf_counter() - inicio, leidas)
+
+        logger.disabled = True
+        resultados["sin log"] = _importar(ruta_csv)
+        logger.disabled = False
+
+    print(f"Filas: {filas}")
+    for nombre, (segundos, leidas) in resultados.items():
+        print(f"{nombre:<26} {segundos:7.2f} s  {leidas / segundos:10,.0f} filas/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
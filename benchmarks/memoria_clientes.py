@@ -0,0 +1,66 @@
+"""benchmarks/memoria_clientes.py
+
+Compara la memoria por cliente entre el diseño anterior (atributos en un
+__dict__ por instancia) y el actual con __slots__.
+
+Uso (desde la raíz del proyecto):
+
+    python -m benchmarks.memoria_clientes [cantidad]
+"""
+
+from __future__ import annotations
+
+import sys
+import tracemalloc
+
+from modulos.cliente_regular import ClienteRegular
+
+
+class ClienteConDict:
+    """Réplica del Cliente original: cuatro atributos privados en __dict__."""
+
+    def __init__(self, nombre: str, email: str, telefono: str, direccion: str):
+        self.__nombre = (nombre or "").strip()
+        self.__email = (email or "").strip()
+        self.__telefono = (telefono or "").strip()
+        self.__direccion = (direccion or "").strip()
+
+    @property
+    def email(self) -> str:
+        return self.__email
+
+
+def _datos(cantidad: int):
+    """Genera los textos de antemano para que no se cuenten en la medición."""
+    return [
+        (f"Cliente {i}", f"cliente{i}@correo.cl", f"9{i:08d}", f"Calle {i}, Santiago")
+        for i in range(cantidad)
+    ]
+
+
+def medir(clase, datos) -> float:
+    """Retorna los bytes por cliente asignados al instanciar `clase`."""
+    tracemalloc.start()
+    inicial, _ = tracemalloc.get_traced_memory()
+    clientes = [clase(*fila) for fila in datos]
+    final, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Restar la lista que contiene a los objetos (8 bytes por puntero).
+    total = final - inicial - sys.getsizeof(clientes)
+    return total / len(clientes)
+
+
+def main(cantidad: int = 100_000) -> None:
+    datos = _datos(cantidad)
+    antes = medir(ClienteConDict, datos)
+    despues = medir(ClienteRegular, datos)
+
+    print(f"Clientes medidos: {cantidad}")
+    print(f"Antes  (__dict__):  {antes:8.1f} bytes/cliente")
+    print(f"Ahora  (__slots__): {despues:8.1f} bytes/cliente")
+    print(f"Ahorro: {antes - despues:.1f} bytes/cliente ({(1 - despues / antes) * 100:.0f}%)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
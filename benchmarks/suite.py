@@ -0,0 +1,322 @@
+"""benchmarks/suite.py
+
+Suite de mediciones de los caminos críticos: importar_csv, exportar_csv,
+generar_reporte, buscar_por_email, contar_por_tipo y las validaciones,
+sobre CSV sintéticos (ver datos_sinteticos.py) de uno o más tamaños.
+
+Por cada operación informa el rendimiento (filas o llamadas por segundo),
+la latencia p50/p99 y la memoria máxima asignada (tracemalloc, en una
+pasada aparte para no inflar los tiempos). Los resultados se guardan en
+JSON (por defecto en reportes/benchmarks/) y se pueden comparar contra
+una corrida anterior para detectar regresiones:
+
+    python -m benchmarks.suite --filas 1k,100k
+    python -m benchmarks.suite --filas 1M --duplicados 0.1 --invalidos 0.05
+    python -m benchmarks.suite --filas 100k --comparar reportes/benchmarks/base.json
+
+En las operaciones masivas (importar, exportar, reporte, validar_lote) la
+latencia es la de cada repetición completa o de cada lote; en las demás,
+la de cada llamada individual.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+
+from benchmarks.datos_sinteticos import escribir_csv, leer_cantidad
+from modulos.archivos import exportar_csv, generar_reporte, importar_csv
+from modulos.excepciones import ValidacionError
+from modulos.gestor_clientes import GestorClientes
+from modulos.logger_config import obtener_logger
+from modulos.rutas import dir_reportes
+from modulos.validaciones import (
+    normalizar_tipo_cliente,
+    validar_direccion,
+    validar_email,
+    validar_lote,
+    validar_telefono,
+)
+
+
+FORMATO_RESULTADOS = 1
+TAMANO_LOTE = 1_000
+# Fracción de búsquedas por email que no encuentran cliente
+FRACCION_AUSENTES = 0.1
+# Filas que se cargan en columnas para medir validar_lote (importar_csv
+# ya lo mide sobre el archivo completo)
+MAX_FILAS_VALIDAR_LOTE = 1_000_000
+
+
+# -------- Estadística --------
+def percentil(muestras: list[float], fraccion: float) -> float:
+    """Percentil por rango más cercano (muestras ya ordenadas)."""
+    if not muestras:
+        return 0.0
+    indice = min(len(muestras) - 1, max(0, round(fraccion * len(muestras) + 0.5) - 1))
+    return muestras[indice]
+
+
+def _resultado(unidades: int, tiempos_ns: list[int], total_ns: int, memoria: float | None) -> dict:
+    tiempos_ns = sorted(tiempos_ns)
+    return {
+        "unidades": unidades,
+        "segundos": round(total_ns / 1e9, 6),
+        "por_segundo": round(unidades / (total_ns / 1e9), 1) if total_ns else None,
+        "p50_ms": round(percentil(tiempos_ns, 0.50) / 1e6, 6),
+        "p99_ms": round(percentil(tiempos_ns, 0.99) / 1e6, 6),
+        "memoria_pico_mb": round(memoria / 1e6, 3) if memoria is not None else None,
+    }
+
+
+def _memoria_pico(funcion) -> int:
+    """Bytes máximos asignados mientras corre `funcion`."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        funcion()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+# -------- Formas de medir --------
+def medir_masiva(funcion, unidades: int, repeticiones: int, memoria: bool) -> dict:
+    """Operación sobre todo el conjunto: una muestra por repetición.
+
+    El rendimiento usa la mejor repetición (la menos afectada por ruido).
+    """
+    tiempos = []
+    for _ in range(repeticiones):
+        gc.collect()
+        inicio = time.perf_counter_ns()
+        funcion()
+        tiempos.append(time.perf_counter_ns() - inicio)
+    pico = _memoria_pico(funcion) if memoria else None
+    return _resultado(unidades, tiempos, min(tiempos), pico)
+
+
+def medir_llamadas(funcion, argumentos: list, repeticiones: int, memoria: bool, unidades: int | None = None) -> dict:
+    """Una muestra por llamada (incluye ~0,1 µs del propio cronómetro).
+
+    Se recorre `argumentos` `repeticiones` veces: la latencia usa todas
+    las muestras y el rendimiento la mejor pasada. `unidades` indica
+    cuántas filas cubre una pasada si no es una por llamada.
+    """
+    reloj = time.perf_counter_ns
+    tiempos = []
+    pasadas = []
+    for _ in range(repeticiones):
+        gc.collect()
+        inicio = reloj()
+        for argumento in argumentos:
+            antes = reloj()
+            funcion(argumento)
+            tiempos.append(reloj() - antes)
+        pasadas.append(reloj() - inicio)
+    pico = _memoria_pico(lambda: [funcion(a) for a in argumentos]) if memoria else None
+    return _resultado(unidades or len(argumentos), tiempos, min(pasadas), pico)
+
+
+def _tolerante(validador):
+    """Las filas inválidas también se miden: se ignora el error."""
+    def llamar(valor):
+        try:
+            validador(valor)
+        except ValidacionError:
+            pass
+    return llamar
+
+
+def _columnas(ruta_csv: Path, filas: int):
+    """(tipos, emails, telefonos, direcciones) de hasta `filas` registros.
+
+    El CSV sintético no lleva comas dentro de los campos.
+    """
+    with open(ruta_csv, encoding="utf-8") as archivo:
+        next(archivo)
+        datos = [linea.rstrip("\n").split(",") for linea in islice(archivo, filas)]
+    tipos, _, emails, telefonos, direcciones = zip(*datos)
+    return tipos, emails, telefonos, direcciones
+
+
+def _lotes(columnas) -> list:
+    """Divide las columnas en lotes del tamaño que usa la importación."""
+    return [
+        [columna[i:i + TAMANO_LOTE] for columna in columnas]
+        for i in range(0, len(columnas[0]), TAMANO_LOTE)
+    ]
+
+
+# -------- Corrida de un tamaño --------
+def medir_tamano(filas: int, args, carpeta: Path) -> dict:
+    ruta_csv = carpeta / f"entrada_{filas}.csv"
+    generado = escribir_csv(ruta_csv, filas, args.duplicados, args.invalidos, args.semilla)
+
+    resultados = {}
+    gestores = []
+
+    def importar():
+        gestores.clear()  # liberar la carga anterior antes de medir otra
+        gestor = GestorClientes()
+        importar_csv(gestor, ruta_csv, tamano_lote=TAMANO_LOTE)
+        gestores[:] = [gestor]  # se conserva el último para las demás mediciones
+
+    resultados["importar_csv"] = medir_masiva(importar, filas, args.repeticiones, args.memoria)
+    gestor = gestores[0]
+    clientes = len(gestor)
+
+    ruta_salida = carpeta / "salida.csv"
+    resultados["exportar_csv"] = medir_masiva(
+        lambda: exportar_csv(gestor, destino=ruta_salida), clientes, args.repeticiones, args.memoria
+    )
+    ruta_reporte = carpeta / "reporte.txt"
+    resultados["generar_reporte"] = medir_masiva(
+        lambda: generar_reporte(gestor, destino=ruta_reporte), clientes, args.repeticiones, args.memoria
+    )
+
+    # Consultas puntuales: emails presentes (con otras mayúsculas) y ausentes.
+    azar = random.Random(args.semilla)
+    emails = [cliente.email for cliente in islice(gestor.clientes, 0, None, max(1, clientes // args.consultas))]
+    emails = [email.upper() if i % 2 else email for i, email in enumerate(emails[:args.consultas])]
+    ausentes = int(len(emails) * FRACCION_AUSENTES)
+    emails[:ausentes] = [f"no.existe{i}@correo.cl" for i in range(ausentes)]
+    azar.shuffle(emails)
+    def llamadas(funcion, argumentos, unidades=None):
+        return medir_llamadas(funcion, argumentos, args.repeticiones, args.memoria, unidades)
+
+    resultados["buscar_por_email"] = llamadas(gestor.buscar_por_email, emails)
+    resultados["contar_por_tipo"] = llamadas(lambda _: gestor.contar_por_tipo(), [None] * min(args.consultas, 1_000))
+
+    # Validaciones sobre las primeras filas del mismo CSV (con sus inválidas).
+    columnas = _columnas(ruta_csv, min(filas, max(args.consultas, MAX_FILAS_VALIDAR_LOTE)))
+    muestra = [columna[:args.consultas] for columna in columnas]
+    resultados["validar_email"] = llamadas(_tolerante(validar_email), muestra[1])
+    resultados["validar_telefono"] = llamadas(_tolerante(validar_telefono), muestra[2])
+    resultados["validar_direccion"] = llamadas(_tolerante(validar_direccion), muestra[3])
+    resultados["normalizar_tipo_cliente"] = llamadas(normalizar_tipo_cliente, muestra[0])
+    resultados["validar_lote"] = llamadas(lambda lote: validar_lote(*lote), _lotes(columnas), len(columnas[0]))
+
+    gestor.cerrar()
+    return {
+        "filas": filas,
+        "clientes": clientes,
+        "generado": {"duplicados": generado.duplicados, "invalidos": generado.invalidos},
+        "resultados": resultados,
+    }
+
+
+# -------- Informe y comparación --------
+def imprimir(corrida: dict) -> None:
+    print(f"\nFilas: {corrida['filas']:,}  (clientes cargados: {corrida['clientes']:,})")
+    print(f"{'operación':<24} {'por segundo':>14} {'p50 ms':>10} {'p99 ms':>10} {'pico MB':>9}")
+    for nombre, r in corrida["resultados"].items():
+        pico = f"{r['memoria_pico_mb']:9.1f}" if r["memoria_pico_mb"] is not None else f"{'-':>9}"
+        print(f"{nombre:<24} {r['por_segundo'] or 0:14,.0f} {r['p50_ms']:10.4f} {r['p99_ms']:10.4f} {pico}")
+
+
+def comparar(actual: dict, base: dict, tolerancia: float) -> list[str]:
+    """Operaciones cuyo rendimiento cayó más que `tolerancia` respecto de `base`."""
+    anteriores = {corrida["filas"]: corrida["resultados"] for corrida in base.get("corridas", [])}
+    regresiones = []
+    print(f"\nComparación con {base.get('fecha', '?')} (tolerancia {tolerancia:.0%}):")
+    for corrida in actual["corridas"]:
+        previos = anteriores.get(corrida["filas"])
+        if previos is None:
+            print(f"  {corrida['filas']:,} filas: sin datos en la corrida base")
+            continue
+        for nombre, r in corrida["resultados"].items():
+            previo = previos.get(nombre)
+            if not previo or not previo.get("por_segundo") or not r["por_segundo"]:
+                continue
+            razon = r["por_segundo"] / previo["por_segundo"]
+            marca = ""
+            if razon < 1 - tolerancia:
+                marca = "  <-- REGRESIÓN"
+                regresiones.append(f"{nombre} ({corrida['filas']:,} filas): {razon:.2f}x")
+            print(f"  {corrida['filas']:>10,} {nombre:<24} {razon:6.2f}x{marca}")
+    return regresiones
+
+
+def crear_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.suite", description="Mediciones reproducibles de GIC"
+    )
+    parser.add_argument(
+        "--filas", default="1k,100k", help="Tamaños separados por coma, de 1k a 10M (por defecto 1k,100k)"
+    )
+    parser.add_argument("--duplicados", type=float, default=0.05, help="Fracción de emails repetidos")
+    parser.add_argument("--invalidos", type=float, default=0.02, help="Fracción de filas inválidas")
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--repeticiones", type=int, default=3, help="Repeticiones de las operaciones masivas")
+    parser.add_argument("--consultas", type=int, default=10_000, help="Llamadas por operación puntual")
+    parser.add_argument(
+        "--sin-memoria", dest="memoria", action="store_false", help="No medir memoria (evita la pasada extra)"
+    )
+    parser.add_argument("--salida", type=Path, help="JSON de resultados (por defecto reportes/benchmarks/)")
+    parser.add_argument("--comparar", type=Path, help="JSON de una corrida anterior")
+    parser.add_argument(
+        "--tolerancia", type=float, default=0.10, help="Caída de rendimiento aceptada al comparar (0.10 = 10%%)"
+    )
+    return parser
+
+
+def main(argumentos=None) -> int:
+    args = crear_parser().parse_args(argumentos)
+    tamanos = [leer_cantidad(texto) for texto in args.filas.split(",") if texto.strip()]
+    base = json.loads(args.comparar.read_text(encoding="utf-8")) if args.comparar else None
+
+    resultado = {
+        "formato": FORMATO_RESULTADOS,
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "parametros": {
+            "duplicados": args.duplicados,
+            "invalidos": args.invalidos,
+            "semilla": args.semilla,
+            "repeticiones": args.repeticiones,
+            "consultas": args.consultas,
+            "tamano_lote": TAMANO_LOTE,
+        },
+        "corridas": [],
+    }
+
+    logger = obtener_logger()
+    logger.disabled = True  # medir las operaciones, no el log
+    try:
+        with tempfile.TemporaryDirectory() as carpeta:
+            for filas in tamanos:
+                corrida = medir_tamano(filas, args, Path(carpeta))
+                resultado["corridas"].append(corrida)
+                imprimir(corrida)
+    finally:
+        logger.disabled = False
+
+    salida = args.salida
+    if salida is None:
+        salida = dir_reportes() / "benchmarks" / f"suite_{datetime.now():%Y%m%d_%H%M%S}.json"
+    salida.parent.mkdir(parents=True, exist_ok=True)
+    salida.write_text(json.dumps(resultado, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"\nResultados: {salida}")
+
+    if base is not None:
+        regresiones = comparar(resultado, base, args.tolerancia)
+        if regresiones:
+            print("Regresiones: " + "; ".join(regresiones))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""benchmarks/validaciones.py
+
+Micro-benchmark de validación: funciones por llamada (versión anterior
+con re.match sobre el patrón en texto, y versión actual con patrones
+compilados) contra validar_lote por columnas.
+
+Uso (desde la raíz del proyecto):
+
+    python -m benchmarks.validaciones [filas]
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+import time
+
+from modulos.excepciones import ValidacionError
+from modulos.validaciones import (
+    normalizar_tipo_cliente,
+    validar_direccion,
+    validar_email,
+    validar_lote,
+    validar_telefono,
+)
+
+
+# ---- Réplica de las funciones originales (patrón en texto en cada llamada) ----
+def _email_original(email: str) -> str:
+    email = email.strip()
+    if not re.match(r"^[\w\.-]+@[\w\.-]+\.[a-zA-Z]{2,}$", email):
+        raise ValidacionError("Email inválido.")
+    return email
+
+
+def _telefono_original(telefono: str) -> str:
+    telefono = telefono.strip()
+    if not re.match(r"^[0-9\s\-\+]{6,}$", telefono):
+        raise ValidacionError("Teléfono inválido.")
+    return telefono
+
+
+def _tipo_original(tipo: str) -> str:
+    tipo = tipo.strip().lower()
+    equivalencias = {
+        "regular": "regular",
+        "clienteregular": "regular",
+        "premium": "premium",
+        "clientepremium": "premium",
+        "corporativo": "corporativo",
+        "clientecorporativo": "corporativo",
+    }
+    return equivalencias.get(tipo, tipo)
+
+
+def _columnas(filas: int):
+    """Datos sintéticos con ~5% de emails y teléfonos inválidos."""
+    tipos, emails, telefonos, direcciones = [], [], [], []
+    for i in range(filas):
+        tipos.append(("ClientePremium", "regular", "Corporativo")[i % 3])
+        emails.append(f"cliente{i}@correo.cl" if i % 20 else f"cliente{i}-correo.cl")
+        telefonos.append(f"+56 9 {i:08d}" if i % 19 else "12")
+        direcciones.append(f"Calle {i}, Santiago")
+    return tipos, emails, telefonos, direcciones
+
+
+def _por_llamada(columnas, email, telefono, tipo) -> int:
+    validas = 0
+    for t, e, f, d in zip(*columnas):
+        try:
+            tipo(t)
+            email(e)
+            telefono(f)
+            validar_direccion(d)
+            validas += 1
+        except ValidacionError:
+            pass
+    return validas
+
+
+def _medir(nombre: str, funcion, filas: int) -> None:
+    inicio = time.perf_counter()
+    validas = funcion()
+    segundos = time.perf_counter() - inicio
+    print(f"{nombre:<28} {segundos * 1000:9.1f} ms  {filas / segundos:12,.0f} filas/s  (válidas={validas})")
+
+
+def main(filas: int = 200_000) -> None:
+    columnas = _columnas(filas)
+    print(f"Filas: {filas}")
+    _medir(
+        "por llamada (original)",
+        lambda: _por_llamada(columnas, _email_original, _telefono_original, _tipo_original),
+        filas,
+    )
+    _medir(
+        "por llamada (compilado)",
+        lambda: _por_llamada(columnas, validar_email, validar_telefono, normalizar_tipo_cliente),
+        filas,
+    )
+    _medir("validar_lote (columnas)", lambda: validar_lote(*columnas).validas, filas)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
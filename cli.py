@@ -0,0 +1,431 @@
+"""cli.py
+
+Gestor Inteligente de Clientes (GIC) - Interfaz por línea de comandos.
+
+Permite ejecutar las operaciones masivas sin el menú interactivo (por
+ejemplo, en una carga nocturna programada). Cada comando informa por la
+salida de errores cuántas filas procesó y cuánto tardó, de modo que la
+salida estándar queda libre para los datos ("-" = stdin/stdout).
+
+Ejemplos (desde la raíz del proyecto):
+
+    python cli.py --db datos/clientes.db importar datos/clientes_entrada.csv
+    python cli.py --db datos/clientes.db exportar - > copia.csv
+    python cli.py reporte --solo-resumen -
+    cat bajas.txt | python cli.py --db datos/clientes.db eliminar -
+    python cli.py --db datos/clientes.db cambiar-tipo premium vip.txt
+    python cli.py --db datos/clientes.db duplicados --umbral 0.7 posibles.txt
+    python cli.py --db datos/clientes.db importar --reanudable grande.csv
+
+Sin --db los clientes se leen de la instantánea datos/clientes.csv y los
+comandos que modifican datos la reescriben al terminar. Con
+--instantanea datos/clientes.gic se usa en su lugar la instantánea
+binaria (ver modulos/instantanea.py), que abre sin releer el CSV:
+
+    python cli.py instantanea datos/clientes.gic
+    python cli.py --instantanea datos/clientes.gic reporte --solo-resumen -
+
+Con --metricas se guardan al terminar contadores y tiempos por etapa en
+reportes/metricas_<fecha>.json y .txt; con --perfil cpu|memoria|ambos,
+un perfil del comando en reportes/perfil_<comando>_<fecha>.prof y .txt
+(ver modulos/metricas.py):
+
+    python cli.py --metricas --perfil cpu importar grande.csv
+
+El comando servir atiende una API HTTP/JSON local para otros sistemas
+(ver modulos/servidor.py) hasta Ctrl+C; sin --db, al terminar guarda los
+cambios como los demás comandos:
+
+    python cli.py --db datos/clientes.db servir --puerto 8080
+
+El comando agrupar cuenta clientes por tipo, comuna o prefijo
+telefónico, con filtros. Con --columnar los clientes del CSV se cargan
+en AlmacenColumnar (ver modulos/columnar.py), pensado para esos conteos
+sobre millones de clientes:
+
+    python cli.py --columnar agrupar comuna --tipo premium --prefijo-telefono 9
+
+exportar elige el formato por la extensión de la salida: CSV comprimido
+(.csv.gz, .csv.bz2, .csv.xz) o columnar (.gicc), más compacto y rápido
+de volver a importar; importar lo reconoce solo (ver modulos/formatos.py):
+
+    python cli.py --db datos/clientes.db exportar respaldo.gicc
+    python cli.py --db otra.db importar respaldo.gicc
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import sys
+import time
+from pathlib import Path
+
+from modulos.almacenes import AlmacenSQLite
+from modulos.archivos import (
+    compactar_diario,
+    esperar_compactacion,
+    exportar_csv,
+    generar_reporte,
+    importar_csv,
+)
+from modulos.columnar import AlmacenColumnar
+from modulos.concurrencia import GestorConcurrente
+from modulos.consultas import CAMPOS_AGRUPACION, DIGITOS_PREFIJO
+from modulos.duplicados import UMBRAL, buscar_duplicados
+from modulos.excepciones import GICError
+from modulos.gestor_clientes import (
+    ACTUALIZADO,
+    ELIMINADO,
+    INVALIDO,
+    NO_ENCONTRADO,
+    GestorClientes,
+)
+from modulos.instantanea import AlmacenInstantanea, guardar_instantanea
+from modulos.logger_config import activar_formato_json, activar_log_asincrono, detener_log_asincrono
+from modulos.metricas import activar_metricas, perfil_opcional, volcar_metricas
+from modulos.rutas import ruta_datos
+from modulos.servidor import servir
+
+
+# Cuántos rechazos/errores se detallan por la salida de errores
+MAX_DETALLE = 10
+
+
+def _informar(texto: str) -> None:
+    print(texto, file=sys.stderr)
+
+
+def _entrada(ruta: str):
+    """Archivo de texto a leer ("-" = stdin)."""
+    if ruta == "-":
+        return io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", newline="")
+    try:
+        return open(ruta, mode="r", newline="", encoding="utf-8")
+    except OSError as exc:
+        raise GICError(f"No se pudo abrir {ruta}: {exc}")
+
+
+def _salida_estandar():
+    return io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", newline="", write_through=False)
+
+
+def _leer_emails(archivo):
+    """Un email por línea; se ignoran líneas vacías y comentarios (#)."""
+    for linea in archivo:
+        email = linea.strip()
+        if email and not email.startswith("#"):
+            yield email
+
+
+def _estadisticas(comando: str, filas: int, segundos: float, detalle: str) -> None:
+    velocidad = f"{filas / segundos:,.0f} filas/s" if segundos > 0 else "-"
+    _informar(f"{comando}: {detalle} | {segundos:.3f} s ({velocidad})")
+
+
+def _detallar(errores: list[str], total: int) -> None:
+    for error in errores[:MAX_DETALLE]:
+        _informar(f"  {error}")
+    if total > MAX_DETALLE:
+        _informar(f"  ... y {total - MAX_DETALLE} más")
+
+
+# -------- Comandos --------
+def comando_importar(gestor: GestorClientes, args) -> bool:
+    entrada = _entrada("-") if args.entrada == "-" else args.entrada
+    resultado = importar_csv(
+        gestor,
+        entrada,
+        tamano_lote=args.lote,
+        procesos=args.procesos,
+        similares=args.similares,
+        reanudable=args.reanudable,
+    )
+    if resultado.reanudado_desde:
+        _informar(f"importar: reanudada desde la línea {resultado.reanudado_desde}")
+    similares = f" similares={resultado.total_similares}" if args.similares else ""
+    _estadisticas(
+        "importar",
+        resultado.filas_leidas,
+        resultado.segundos,
+        f"leídas={resultado.filas_leidas} agregados={resultado.agregados} "
+        f"duplicados={resultado.duplicados} rechazados={resultado.total_rechazados}{similares}",
+    )
+    _detallar([f"Línea {r.linea}: {r.motivo}" for r in resultado.rechazados], resultado.total_rechazados)
+    _detallar(
+        [
+            f"Línea {s.linea}: {s.email} "
+            + ("con otros datos" if s.email == s.similar_a else f"parecido a {s.similar_a}")
+            + f" ({s.puntaje:.2f})"
+            for s in resultado.similares
+        ],
+        resultado.total_similares,
+    )
+    return resultado.agregados > 0
+
+
+def comando_exportar(gestor: GestorClientes, args) -> bool:
+    inicio = time.perf_counter()
+    if args.salida == "-":
+        exportar_csv(gestor, destino=_salida_estandar(), reanudable=args.reanudable)
+    elif args.salida:
+        exportar_csv(gestor, destino=Path(args.salida), reanudable=args.reanudable)
+    else:
+        exportar_csv(gestor, reanudable=args.reanudable)
+    _estadisticas("exportar", len(gestor), time.perf_counter() - inicio, f"registros={len(gestor)}")
+    return False
+
+
+def comando_reporte(gestor: GestorClientes, args) -> bool:
+    inicio = time.perf_counter()
+    destino = _salida_estandar() if args.salida == "-" else args.salida
+    generar_reporte(gestor, solo_resumen=args.solo_resumen, destino=destino)
+    _estadisticas("reporte", len(gestor), time.perf_counter() - inicio, f"clientes={len(gestor)}")
+    return False
+
+
+def _informar_masivo(comando: str, resultado) -> bool:
+    """Muestra el resumen de una operación masiva; True si cambió algún cliente."""
+    conteo = resultado.conteo()
+    detalle = " ".join(f"{estado}={cantidad}" for estado, cantidad in conteo.items())
+    _estadisticas(comando, len(resultado.items), resultado.segundos, f"leídos={len(resultado.items)} {detalle}")
+    fallidos = resultado.con_estado(NO_ENCONTRADO, INVALIDO)
+    _detallar([f"{item.email}: {item.motivo or item.estado}" for item in fallidos], len(fallidos))
+    return bool(conteo.get(ELIMINADO) or conteo.get(ACTUALIZADO))
+
+
+def comando_eliminar(gestor: GestorClientes, args) -> bool:
+    with _entrada(args.emails) as archivo:
+        resultado = gestor.eliminar_varios(_leer_emails(archivo))
+    return _informar_masivo("eliminar", resultado)
+
+
+def comando_cambiar_tipo(gestor: GestorClientes, args) -> bool:
+    with _entrada(args.emails) as archivo:
+        resultado = gestor.cambiar_tipo_varios(_leer_emails(archivo), args.tipo)
+    return _informar_masivo("cambiar-tipo", resultado)
+
+
+def comando_duplicados(gestor: GestorClientes, args) -> bool:
+    resultado = buscar_duplicados(gestor, umbral=args.umbral)
+    if args.salida == "-":
+        salida = _salida_estandar()
+    else:
+        try:
+            salida = open(args.salida, "w", encoding="utf-8")
+        except OSError as exc:
+            raise GICError(f"No se pudo abrir {args.salida}: {exc}")
+    with salida:
+        # Un grupo por línea: similitud del par más parecido y los emails.
+        for grupo in resultado.grupos:
+            salida.write(f"{grupo.puntaje:.2f}\t{' '.join(grupo.emails)}\n")
+    _estadisticas(
+        "duplicados",
+        resultado.clientes,
+        resultado.segundos,
+        f"clientes={resultado.clientes} grupos={len(resultado.grupos)} "
+        f"comparaciones={resultado.comparaciones} bloques_saturados={resultado.bloques_saturados}",
+    )
+    return False
+
+
+def comando_agrupar(gestor: GestorClientes, args) -> bool:
+    inicio = time.perf_counter()
+    conteo = gestor.agrupar(
+        args.campo,
+        tipo=args.tipo,
+        comuna=args.comuna,
+        prefijo_telefono=args.prefijo_telefono,
+        digitos=args.digitos,
+    )
+    salida = _salida_estandar()
+    with salida:
+        for valor, cantidad in conteo.items():
+            salida.write(f"{cantidad}\t{valor}\n")
+    _estadisticas(
+        "agrupar",
+        len(gestor),
+        time.perf_counter() - inicio,
+        f"clientes={sum(conteo.values())} grupos={len(conteo)}",
+    )
+    return False
+
+
+def comando_instantanea(gestor: GestorClientes, args) -> bool:
+    inicio = time.perf_counter()
+    guardar_instantanea(gestor, args.salida)
+    _estadisticas("instantanea", len(gestor), time.perf_counter() - inicio, f"registros={len(gestor)}")
+    return False
+
+
+def comando_servir(gestor: GestorClientes, args) -> bool:
+    _informar(f"servir: http://{args.host}:{args.puerto} (Ctrl+C para terminar)")
+    try:
+        asyncio.run(servir(gestor, args.host, args.puerto))
+    except KeyboardInterrupt:
+        pass
+    except OSError as exc:
+        raise GICError(f"No se pudo abrir el puerto {args.puerto}: {exc}")
+    return gestor.hay_cambios()
+
+
+# -------- Carga y guardado --------
+def _abrir_gestor(args) -> GestorClientes:
+    """Gestor sobre la base SQLite, la instantánea binaria o la instantánea CSV."""
+    # El servidor usa el gestor desde varios hilos.
+    clase = GestorConcurrente if args.comando == "servir" else GestorClientes
+    if args.db:
+        return clase(AlmacenSQLite(args.db))
+    if args.instantanea and args.instantanea.exists():
+        inicio = time.perf_counter()
+        gestor = clase(AlmacenInstantanea(args.instantanea))
+        _estadisticas("cargar", len(gestor), time.perf_counter() - inicio, f"clientes={len(gestor)}")
+        return gestor
+
+    gestor = clase(AlmacenColumnar()) if args.columnar else clase()
+    ruta_csv = ruta_datos("clientes.csv")
+    # Aplicar cambios que hayan quedado en el diario de la exportación incremental.
+    compactar_diario(ruta_csv)
+    if ruta_csv.exists():
+        inicio = time.perf_counter()
+        importar_csv(gestor, ruta_csv)
+        gestor.descartar_cambios()
+        _estadisticas("cargar", len(gestor), time.perf_counter() - inicio, f"clientes={len(gestor)}")
+    return gestor
+
+
+def _guardar(gestor: GestorClientes, args) -> None:
+    if args.db:
+        return  # SQLite ya persistió cada cambio
+    inicio = time.perf_counter()
+    if args.instantanea:
+        guardar_instantanea(gestor, args.instantanea)
+    else:
+        exportar_csv(gestor)
+    _estadisticas("guardar", len(gestor), time.perf_counter() - inicio, f"clientes={len(gestor)}")
+
+
+def crear_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="cli.py",
+        description="Gestor Inteligente de Clientes (GIC) - operaciones por lote",
+    )
+    parser.add_argument("--db", type=Path, help="Base SQLite de clientes (ej: datos/clientes.db)")
+    parser.add_argument(
+        "--instantanea", type=Path, help="Instantánea binaria a usar sin --db (ej: datos/clientes.gic)"
+    )
+    parser.add_argument(
+        "--columnar", action="store_true", help="Sin --db, cargar los clientes en columnas (ver agrupar)"
+    )
+    parser.add_argument("--log-json", action="store_true", help="Escribir logs/app.log como líneas JSON")
+    parser.add_argument(
+        "--metricas", action="store_true", help="Guardar contadores y tiempos por etapa en reportes/"
+    )
+    parser.add_argument(
+        "--perfil", choices=("cpu", "memoria", "ambos"), help="Perfilar el comando (cProfile / tracemalloc)"
+    )
+    comandos = parser.add_subparsers(dest="comando", required=True)
+
+    importar = comandos.add_parser("importar", help="Importar clientes desde un CSV")
+    importar.add_argument(
+        "entrada",
+        nargs="?",
+        help='CSV (también .gz, .bz2, .xz) o .gicc de entrada ("-" = stdin; por defecto datos/clientes_entrada.csv)',
+    )
+    importar.add_argument("--lote", type=int, default=1_000, help="Filas por lote")
+    importar.add_argument("--procesos", type=int, default=1, help="Procesos para validar en paralelo")
+    importar.add_argument(
+        "--similares", action="store_true", help="Señalar filas parecidas a otro cliente (otro email)"
+    )
+    importar.add_argument(
+        "--reanudable", action="store_true", help="Guardar puntos de control y continuar una importación cortada"
+    )
+    importar.set_defaults(funcion=comando_importar)
+
+    exportar = comandos.add_parser("exportar", help="Exportar clientes a CSV")
+    exportar.add_argument(
+        "salida",
+        nargs="?",
+        help='.csv, .csv.gz, .csv.bz2, .csv.xz o .gicc de salida ("-" = CSV a stdout; por defecto datos/clientes.csv)',
+    )
+    exportar.add_argument(
+        "--reanudable", action="store_true", help="Guardar puntos de control y continuar una exportación cortada"
+    )
+    exportar.set_defaults(funcion=comando_exportar)
+
+    reporte = comandos.add_parser("reporte", help="Generar el reporte de clientes")
+    reporte.add_argument("salida", nargs="?", help='Archivo de salida ("-" = stdout; por defecto reportes/resumen.txt)')
+    reporte.add_argument("--solo-resumen", action="store_true", help="Solo totales, sin listado")
+    reporte.set_defaults(funcion=comando_reporte)
+
+    eliminar = comandos.add_parser("eliminar", help="Eliminar los clientes de una lista de emails")
+    eliminar.add_argument("emails", nargs="?", default="-", help='Archivo con un email por línea ("-" = stdin)')
+    eliminar.set_defaults(funcion=comando_eliminar)
+
+    cambiar = comandos.add_parser("cambiar-tipo", help="Cambiar el tipo de una lista de clientes")
+    cambiar.add_argument("tipo", help="Nuevo tipo: regular / premium / corporativo")
+    cambiar.add_argument("emails", nargs="?", default="-", help='Archivo con un email por línea ("-" = stdin)')
+    cambiar.set_defaults(funcion=comando_cambiar_tipo)
+
+    duplicados = comandos.add_parser("duplicados", help="Buscar grupos de posibles clientes duplicados")
+    duplicados.add_argument("salida", nargs="?", default="-", help='Archivo de salida ("-" = stdout)')
+    duplicados.add_argument("--umbral", type=float, default=UMBRAL, help="Similitud mínima (0 a 1)")
+    duplicados.set_defaults(funcion=comando_duplicados)
+
+    agrupar = comandos.add_parser("agrupar", help="Contar clientes por tipo, comuna o prefijo telefónico")
+    agrupar.add_argument("campo", choices=CAMPOS_AGRUPACION)
+    agrupar.add_argument("--tipo", help="Solo clientes de este tipo")
+    agrupar.add_argument("--comuna", help="Solo clientes de esta comuna")
+    agrupar.add_argument(
+        "--prefijo-telefono", help="Solo números nacionales que empiezan así (ej: 9 o +569; hasta 3 dígitos)"
+    )
+    agrupar.add_argument(
+        "--digitos", type=int, default=DIGITOS_PREFIJO, help="Dígitos del prefijo al agrupar por prefijo_telefono"
+    )
+    agrupar.set_defaults(funcion=comando_agrupar)
+
+    instantanea = comandos.add_parser("instantanea", help="Guardar una instantánea binaria de los clientes")
+    instantanea.add_argument("salida", nargs="?", help="Archivo de salida (por defecto datos/clientes.gic)")
+    instantanea.set_defaults(funcion=comando_instantanea)
+
+    servidor = comandos.add_parser("servir", help="Atender la API HTTP/JSON de clientes")
+    servidor.add_argument("--host", default="127.0.0.1", help="Dirección a escuchar (por defecto solo local)")
+    servidor.add_argument("--puerto", type=int, default=8080)
+    servidor.set_defaults(funcion=comando_servir)
+
+    return parser
+
+
+def main(argumentos=None) -> int:
+    args = crear_parser().parse_args(argumentos)
+    if args.log_json:
+        activar_formato_json()
+    activar_log_asincrono()
+    if args.metricas:
+        activar_metricas()
+
+    gestor = None
+    try:
+        gestor = _abrir_gestor(args)
+        with perfil_opcional(args.comando, args.perfil) as archivos:
+            if args.funcion(gestor, args):
+                _guardar(gestor, args)
+        for ruta in archivos:
+            _informar(f"perfil: {ruta}")
+        return 0
+    except GICError as exc:
+        _informar(f"Error: {exc}")
+        return 1
+    finally:
+        esperar_compactacion()
+        if gestor is not None:
+            gestor.cerrar()
+        detener_log_asincrono()
+        if args.metricas:
+            for ruta in volcar_metricas():
+                _informar(f"metricas: {ruta}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
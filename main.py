@@ -8,9 +8,15 @@ reporte TXT y registro de logs.
 
 from __future__ import annotations
 
-from modulos.archivos import exportar_csv, generar_reporte, importar_csv
+import argparse
+from pathlib import Path
+
+from modulos.almacenes import AlmacenSQLite
+from modulos.archivos import esperar_compactacion, exportar_csv, generar_reporte, importar_csv
 from modulos.excepciones import ArchivoError
 from modulos.gestor_clientes import GestorClientes
+from modulos.logger_config import activar_formato_json, activar_log_asincrono, detener_log_asincrono
+from modulos.metricas import activar_metricas, perfil_opcional, volcar_metricas
 
 
 def mostrar_menu() -> None:
@@ -29,53 +35,132 @@ def mostrar_menu() -> None:
     print("8. Salir")
 
 
-def menu() -> None:
-    gestor = GestorClientes()
-
+def menu(
+    ruta_db: Path | None = None,
+    log_json: bool = False,
+    metricas: bool = False,
+    perfil: str | None = None,
+) -> None:
+    if log_json:
+        activar_formato_json()
+    if metricas:
+        activar_metricas()
+    # Con ruta_db los clientes se guardan en SQLite y sobreviven al cierre.
+    gestor = GestorClientes(AlmacenSQLite(ruta_db) if ruta_db else None)
+    # El log al archivo se escribe desde un hilo para no frenar al menú.
+    activar_log_asincrono()
+
+    try:
+        _ciclo_menu(gestor, perfil)
+    finally:
+        esperar_compactacion()
+        gestor.cerrar()
+        detener_log_asincrono()
+        if metricas:
+            ruta_json, ruta_txt = volcar_metricas()
+            print(f"Métricas guardadas en {ruta_json} y {ruta_txt}")
+
+
+# Opciones que se pueden perfilar (con --perfil) y nombre del archivo
+OPCIONES_PERFIL = {
+    "1": "crear",
+    "2": "importar",
+    "3": "exportar",
+    "4": "listar",
+    "5": "editar",
+    "6": "eliminar",
+    "7": "reporte",
+}
+
+
+def _ciclo_menu(gestor: GestorClientes, perfil: str | None = None) -> None:
     while True:
         mostrar_menu()
         opcion = input("Seleccione una opción: ").strip()
 
-        if opcion == "1":
-            gestor.crear_cliente()
-
-        elif opcion == "2":
-            try:
-                agregados = importar_csv(gestor)
-                print(f"Importación finalizada. Clientes agregados: {agregados}")
-            except ArchivoError as exc:
-                print(f"Error: {exc}")
-
-        elif opcion == "3":
-            try:
-                exportar_csv(gestor)
-                print("Clientes guardados correctamente en datos/clientes.csv")
-            except ArchivoError as exc:
-                print(f"Error: {exc}")
-
-        elif opcion == "4":
-            gestor.listar_clientes()
-
-        elif opcion == "5":
-            gestor.editar_cliente()
-
-        elif opcion == "6":
-            gestor.eliminar_cliente()
-
-        elif opcion == "7":
-            try:
-                generar_reporte(gestor)
-                print("Reporte generado correctamente en reportes/resumen.txt")
-            except ArchivoError as exc:
-                print(f"Error: {exc}")
-
-        elif opcion == "8":
-            print("Saliendo del sistema...")
+        nombre = OPCIONES_PERFIL.get(opcion)
+        with perfil_opcional(f"menu_{nombre}", perfil if nombre else None) as archivos:
+            seguir = _ejecutar_opcion(gestor, opcion)
+        for ruta in archivos:
+            print(f"Perfil guardado en {ruta}")
+        if not seguir:
             break
 
-        else:
-            print("Opción inválida. Intente nuevamente.")
+
+def _ejecutar_opcion(gestor: GestorClientes, opcion: str) -> bool:
+    """Ejecuta una opción del menú; retorna False al elegir salir."""
+    if opcion == "1":
+        gestor.crear_cliente()
+
+    elif opcion == "2":
+        try:
+            resultado = importar_csv(gestor)
+            print(
+                f"Importación finalizada. Clientes agregados: {resultado.agregados} | "
+                f"Duplicados: {resultado.duplicados} | "
+                f"Rechazados: {resultado.total_rechazados}"
+            )
+            for rechazo in resultado.rechazados[:10]:
+                print(f"  Línea {rechazo.linea}: {rechazo.motivo}")
+        except ArchivoError as exc:
+            print(f"Error: {exc}")
+
+    elif opcion == "3":
+        try:
+            # La primera vez en la sesión se guarda la instantánea completa;
+            # después solo se agregan los cambios y se rehace en segundo plano.
+            exportar_csv(gestor, incremental=True)
+            print("Clientes guardados correctamente en datos/clientes.csv")
+        except ArchivoError as exc:
+            print(f"Error: {exc}")
+
+    elif opcion == "4":
+        gestor.listar_clientes()
+
+    elif opcion == "5":
+        gestor.editar_cliente()
+
+    elif opcion == "6":
+        gestor.eliminar_cliente()
+
+    elif opcion == "7":
+        try:
+            generar_reporte(gestor)
+            print("Reporte generado correctamente en reportes/resumen.txt")
+        except ArchivoError as exc:
+            print(f"Error: {exc}")
+
+    elif opcion == "8":
+        print("Saliendo del sistema...")
+        return False
+
+    else:
+        print("Opción inválida. Intente nuevamente.")
+
+    return True
 
 
 if __name__ == "__main__":
-    menu()
+    parser = argparse.ArgumentParser(description="Gestor Inteligente de Clientes (GIC)")
+    parser.add_argument(
+        "--db",
+        type=Path,
+        help="Base SQLite donde persistir los clientes (ej: datos/clientes.db)",
+    )
+    parser.add_argument(
+        "--log-json",
+        action="store_true",
+        help="Escribir logs/app.log como líneas JSON (ver modulos/auditoria.py)",
+    )
+    parser.add_argument(
+        "--metricas",
+        action="store_true",
+        help="Guardar al salir contadores y tiempos por etapa en reportes/ (JSON y texto)",
+    )
+    parser.add_argument(
+        "--perfil",
+        choices=("cpu", "memoria", "ambos"),
+        help="Perfilar cada opción del menú (cProfile / tracemalloc) en reportes/",
+    )
+    args = parser.parse_args()
+    menu(args.db, args.log_json, args.metricas, args.perfil)
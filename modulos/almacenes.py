@@ -0,0 +1,652 @@
+"""modulos/almacenes.py
+
+Almacenes (backends de persistencia) usados por GestorClientes.
+
+- AlmacenMemoria: dict ordenado por email normalizado (comportamiento
+  por defecto, los datos se pierden al salir).
+- AlmacenSQLite: base de datos sqlite3 con índice único por email
+  normalizado; cada alta/edición/baja es una transacción de una fila y
+  los clientes se leen bajo demanda (no se cargan todos al iniciar).
+- AlmacenInstantanea (modulos/instantanea.py): lectura perezosa de una
+  instantánea binaria mapeada en memoria.
+- AlmacenColumnar (modulos/columnar.py): clientes en memoria guardados
+  por columnas, con conteos por tipo, comuna y prefijo telefónico.
+
+Todos exponen la misma interfaz: obtener, obtener_lote, existentes,
+insertar, insertar_lote, reemplazar, reemplazar_lote, guardar_lote, quitar,
+quitar_lote, contar_por_tipo, consultar, recorrer, filas, cerrar, __iter__
+y __len__.
+Los conteos por tipo se mantienen con cada cambio, así que contar_por_tipo
+no recorre los clientes.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from bisect import bisect_right
+from itertools import islice
+from pathlib import Path
+
+from modulos.consultas import (
+    FiltroClientes,
+    IndicesSecundarios,
+    PaginaConsulta,
+    tokens_cliente,
+)
+from modulos.excepciones import ArchivoError, ClienteExistenteError, ClienteNoEncontradoError
+from modulos.tipos_cliente import clase_tipo
+from modulos.validaciones import normalizar_email, normalizar_telefono
+
+
+class ConteoPorTipo:
+    """Contadores de clientes por tipo actualizados en cada alta/edición/baja."""
+
+    def __init__(self, inicial: dict[str, int] | None = None):
+        self._conteo = dict(inicial or {})
+
+    def sumar(self, tipo: str, cantidad: int = 1) -> None:
+        total = self._conteo.get(tipo, 0) + cantidad
+        if total > 0:
+            self._conteo[tipo] = total
+        else:
+            # Un tipo sin clientes no aparece en el resumen.
+            self._conteo.pop(tipo, None)
+
+    def cambiar(self, tipo_anterior: str, tipo_nuevo: str) -> None:
+        if tipo_anterior != tipo_nuevo:
+            self.sumar(tipo_anterior, -1)
+            self.sumar(tipo_nuevo, 1)
+
+    def copia(self) -> dict[str, int]:
+        return dict(self._conteo)
+
+    def cantidad(self, tipo: str) -> int:
+        return self._conteo.get(tipo, 0)
+
+
+# Entradas dadas de baja en un OrdenAltas a partir de las cuales se limpia
+MIN_LIMPIAR = 1024
+
+
+class OrdenAltas:
+    """Claves en orden de alta, cada una con su número de secuencia.
+
+    La secuencia solo crece, como el id de SQLite: sirve de cursor estable
+    para recorrer por páginas (una baja no corre a los demás) y desde()
+    ubica el punto de partida con bisect. Las bajas no se quitan de la
+    lista; quien la usa indica qué entradas siguen vigentes y la limpia
+    cuando hace falta. Una clave que vuelve con una secuencia anterior (un
+    cliente que cambió de tipo y vuelve al primero) se ordena al leer.
+
+    Ese orden al leer puede ocurrir en dos lectores a la vez: las dos
+    listas se reemplazan juntas, en una sola asignación.
+    """
+
+    def __init__(self):
+        self._entradas: tuple[list[int], list[str]] = ([], [])  # (secuencias, claves)
+        self._ordenada = True
+
+    def __len__(self) -> int:
+        """Entradas guardadas, incluidas las que ya no están vigentes."""
+        return len(self._entradas[1])
+
+    def agregar(self, secuencia: int, clave: str) -> None:
+        secuencias, claves = self._entradas
+        if secuencias and secuencia <= secuencias[-1]:
+            self._ordenada = False
+        secuencias.append(secuencia)
+        claves.append(clave)
+
+    def limpiar(self, vigente) -> None:
+        """Deja solo las entradas con vigente(secuencia, clave), ordenadas y sin repetir."""
+        pares = zip(*self._entradas)
+        if not self._ordenada:
+            pares = sorted(pares)
+        secuencias, claves = [], []
+        for secuencia, clave in pares:
+            if (not secuencias or secuencia != secuencias[-1]) and vigente(secuencia, clave):
+                secuencias.append(secuencia)
+                claves.append(clave)
+        self._entradas = secuencias, claves
+        self._ordenada = True
+
+    def desde(self, posicion: int, vigente):
+        """Genera (secuencia, clave) vigentes con secuencia mayor que `posicion`."""
+        if not self._ordenada:
+            self.limpiar(vigente)
+        secuencias, claves = self._entradas
+        for i in range(bisect_right(secuencias, posicion), len(claves)):
+            if vigente(secuencias[i], claves[i]):
+                yield secuencias[i], claves[i]
+
+
+def guardar_con_deshacer(almacen, reemplazos, altas) -> None:
+    """guardar_lote de los almacenes en memoria: todo o nada.
+
+    Si la inserción de `altas` falla, los clientes de `reemplazos` vuelven
+    a quedar como estaban.
+    """
+    reemplazos = list(reemplazos)
+    anteriores = almacen.obtener_lote(normalizar_email(c.email) for c in reemplazos)
+    almacen.reemplazar_lote(reemplazos)
+    try:
+        almacen.insertar_lote(altas)
+    except BaseException:
+        almacen.reemplazar_lote(anteriores.values())
+        raise
+
+
+class AlmacenMemoria:
+    """Clientes en memoria indexados por email normalizado.
+
+    El dict conserva el orden de inserción, por lo que sirve a la vez de
+    listado ordenado y de índice O(1) para búsquedas y bajas. Los índices
+    secundarios se arman recién en la primera consulta con filtros; desde
+    ahí se mantienen en cada cambio.
+
+    recorrer() usa como cursor una secuencia de alta (1, 2, ...) que no se
+    reutiliza, con un OrdenAltas de todos los clientes y otro por tipo. Se
+    numeran recién en el primer recorrido (antes nadie tiene un cursor) y
+    desde ahí cada alta recibe la siguiente.
+    """
+
+    def __init__(self):
+        self._por_email = {}
+        self._conteo = ConteoPorTipo()
+        self._indices = None
+        self._secuencias: dict[str, int] | None = None  # email normalizado -> secuencia
+        self._ultima_secuencia = 0
+        self._altas = OrdenAltas()
+        self._altas_por_tipo: dict[str, OrdenAltas] = {}
+
+    def _indices_secundarios(self) -> IndicesSecundarios:
+        if self._indices is None:
+            indices = IndicesSecundarios()
+            for clave, cliente in self._por_email.items():
+                indices.agregar(clave, cliente)
+            self._indices = indices
+        return self._indices
+
+    def __len__(self) -> int:
+        return len(self._por_email)
+
+    def __iter__(self):
+        return iter(self._por_email.values())
+
+    def _vigente(self, tipo: str | None = None):
+        """Indica si una entrada (secuencia, clave) de un OrdenAltas sigue vigente."""
+        secuencias, por_email = self._secuencias, self._por_email
+        if tipo is None:
+            return lambda secuencia, clave: secuencias.get(clave) == secuencia
+        return lambda secuencia, clave: (
+            secuencias.get(clave) == secuencia and por_email[clave].tipo() == tipo
+        )
+
+    def _orden_del_tipo(self, tipo: str) -> OrdenAltas:
+        orden = self._altas_por_tipo.get(tipo)
+        if orden is None:
+            orden = self._altas_por_tipo[tipo] = OrdenAltas()
+        return orden
+
+    def _numerar(self, clave: str, cliente) -> None:
+        self._ultima_secuencia += 1
+        secuencia = self._secuencias[clave] = self._ultima_secuencia
+        self._altas.agregar(secuencia, clave)
+        self._orden_del_tipo(cliente.tipo()).agregar(secuencia, clave)
+
+    def numerar_altas(self) -> None:
+        """Asigna (una vez) las secuencias de alta en el orden actual: 1, 2, ...
+
+        Se llama desde recorrer(), que puede correr en varios lectores a la
+        vez: se arma todo aparte y se publica al final.
+        """
+        if self._secuencias is None:
+            secuencias, altas, por_tipo = {}, OrdenAltas(), {}
+            for secuencia, (clave, cliente) in enumerate(self._por_email.items(), 1):
+                secuencias[clave] = secuencia
+                altas.agregar(secuencia, clave)
+                tipo = cliente.tipo()
+                if tipo not in por_tipo:
+                    por_tipo[tipo] = OrdenAltas()
+                por_tipo[tipo].agregar(secuencia, clave)
+            self._ultima_secuencia = len(secuencias)
+            self._altas, self._altas_por_tipo = altas, por_tipo
+            self._secuencias = secuencias  # al final: marca que ya están numeradas
+
+    def _revisar_altas(self, tipo: str) -> None:
+        """Limpia los OrdenAltas (el general y el de `tipo`) si la mitad son bajas."""
+        if len(self._altas) > 2 * len(self._por_email) + MIN_LIMPIAR:
+            self._altas.limpiar(self._vigente())
+        orden = self._altas_por_tipo.get(tipo)
+        if orden is not None and len(orden) > 2 * self._conteo.cantidad(tipo) + MIN_LIMPIAR:
+            orden.limpiar(self._vigente(tipo))
+
+    def recorrer(self, posicion: int = 0, tipo: str | None = None):
+        """Genera (secuencia, cliente) con secuencia de alta mayor que `posicion`.
+
+        Continuar desde la secuencia del último cliente de una página no
+        se saltea a nadie aunque haya bajas entre páginas. Con `tipo` se
+        recorre solo el orden de ese tipo: el costo depende de la página,
+        no del total de clientes.
+        """
+        self.numerar_altas()
+        if tipo is None:
+            orden = self._altas
+        else:
+            orden = self._altas_por_tipo.get(tipo)
+            if orden is None:
+                return
+        por_email = self._por_email
+        for secuencia, clave in orden.desde(posicion, self._vigente(tipo)):
+            yield secuencia, por_email[clave]
+
+    def obtener(self, clave: str):
+        return self._por_email.get(clave)
+
+    def obtener_lote(self, claves) -> dict:
+        """Retorna {clave: cliente} de las claves registradas."""
+        por_email = self._por_email
+        return {clave: por_email[clave] for clave in claves if clave in por_email}
+
+    def existentes(self, claves) -> set[str]:
+        """Retorna el subconjunto de claves que ya están registradas."""
+        return {clave for clave in claves if clave in self._por_email}
+
+    def insertar(self, cliente) -> None:
+        clave = normalizar_email(cliente.email)
+        if clave in self._por_email:
+            raise ClienteExistenteError(f"Ya existe un cliente con email: {cliente.email}")
+        self._por_email[clave] = cliente
+        self._conteo.sumar(cliente.tipo())
+        if self._secuencias is not None:
+            self._numerar(clave, cliente)
+        if self._indices is not None:
+            self._indices.agregar(clave, cliente)
+
+    def insertar_lote(self, clientes) -> None:
+        """Inserta un lote completo o ninguno (deshace lo insertado si falla)."""
+        insertados = []
+        try:
+            for cliente in clientes:
+                self.insertar(cliente)
+                insertados.append(normalizar_email(cliente.email))
+        except BaseException:
+            for clave in insertados:
+                self.quitar(clave)
+            raise
+
+    def reemplazar(self, cliente) -> None:
+        """Sustituye al cliente con el mismo email manteniendo su posición."""
+        clave = normalizar_email(cliente.email)
+        anterior = self._por_email.get(clave)
+        if anterior is None:
+            raise ClienteNoEncontradoError("Cliente no encontrado.")
+        self._por_email[clave] = cliente
+        tipo_anterior, tipo = anterior.tipo(), cliente.tipo()
+        self._conteo.cambiar(tipo_anterior, tipo)
+        if tipo != tipo_anterior and self._secuencias is not None:
+            # Conserva su secuencia; en el orden del tipo anterior queda como baja.
+            self._orden_del_tipo(tipo).agregar(self._secuencias[clave], clave)
+            self._revisar_altas(tipo_anterior)
+        if self._indices is not None:
+            self._indices.reemplazar(clave, anterior, cliente)
+
+    def reemplazar_lote(self, clientes) -> None:
+        """Reemplaza todos los clientes del lote o ninguno (si falta alguno)."""
+        clientes = list(clientes)
+        for cliente in clientes:
+            if normalizar_email(cliente.email) not in self._por_email:
+                raise ClienteNoEncontradoError(f"Cliente no encontrado: {cliente.email}")
+        for cliente in clientes:
+            self.reemplazar(cliente)
+
+    def guardar_lote(self, reemplazos, altas) -> None:
+        """Reemplaza `reemplazos` e inserta `altas`: todo o nada."""
+        guardar_con_deshacer(self, reemplazos, altas)
+
+    def quitar(self, clave: str):
+        cliente = self._por_email.pop(clave, None)
+        if cliente is not None:
+            self._conteo.sumar(cliente.tipo(), -1)
+            if self._secuencias is not None:
+                del self._secuencias[clave]
+                self._revisar_altas(cliente.tipo())
+            if self._indices is not None:
+                self._indices.quitar(clave, cliente)
+        return cliente
+
+    def quitar_lote(self, claves) -> dict:
+        """Quita las claves registradas y retorna {clave: cliente quitado}."""
+        quitados = {}
+        for clave in claves:
+            cliente = self.quitar(clave)
+            if cliente is not None:
+                quitados[clave] = cliente
+        return quitados
+
+    def contar_por_tipo(self) -> dict[str, int]:
+        return self._conteo.copia()
+
+    def consultar(self, filtro: FiltroClientes, pagina: int, por_pagina: int) -> PaginaConsulta:
+        desde = (pagina - 1) * por_pagina
+        if filtro.vacio():
+            total = len(self._por_email)
+            clientes = list(islice(self._por_email.values(), desde, desde + por_pagina))
+        else:
+            claves = self._indices_secundarios().buscar(filtro)
+            total = len(claves)
+            clientes = [self._por_email[clave] for clave in claves[desde:desde + por_pagina]]
+        return PaginaConsulta(clientes, total, pagina, por_pagina)
+
+    def filas(self):
+        """Genera (nombre, email, telefono, direccion, tipo) en orden de alta."""
+        for cliente in self._por_email.values():
+            yield cliente.fila()
+
+    def cerrar(self) -> None:
+        """Nada que liberar en memoria (se mantiene por simetría)."""
+
+
+class AlmacenSQLite:
+    """Clientes persistidos en una base sqlite3.
+
+    El orden de alta lo da la columna autoincremental `id`; la edición
+    actualiza la fila en su lugar, por lo que el listado no cambia de orden.
+    Los objetos Cliente se construyen al leerlos: modificar uno con sus
+    setters no lo persiste, hay que pasar por GestorClientes.
+    """
+
+    FILAS_POR_LECTURA = 1_000
+    # Versión 2: teléfono normalizado y tabla de palabras para consultas.
+    VERSION_ESQUEMA = 2
+
+    def __init__(self, ruta_db: Path | str):
+        self.ruta_db = Path(ruta_db)
+        try:
+            self._conexion = sqlite3.connect(self.ruta_db, check_same_thread=False)
+            self._crear_esquema()
+            # Se cuenta una sola vez; luego se mantiene con cada cambio.
+            self._conteo = ConteoPorTipo(
+                self._conexion.execute(
+                    "SELECT tipo, COUNT(*) FROM clientes GROUP BY tipo ORDER BY MIN(id)"
+                ).fetchall()
+            )
+            self._total = sum(self._conteo.copia().values())
+        except sqlite3.Error as exc:
+            raise ArchivoError(f"No se pudo abrir la base de datos {self.ruta_db}: {exc}")
+
+    def _crear_esquema(self) -> None:
+        """Crea las tablas o actualiza una base creada por una versión anterior."""
+        with self._conexion:
+            version = self._conexion.execute("PRAGMA user_version").fetchone()[0]
+            self._conexion.execute(
+                """
+                CREATE TABLE IF NOT EXISTS clientes (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    email_norm TEXT NOT NULL UNIQUE,
+                    email TEXT NOT NULL,
+                    nombre TEXT NOT NULL,
+                    telefono TEXT NOT NULL,
+                    direccion TEXT NOT NULL,
+                    tipo TEXT NOT NULL,
+                    telefono_norm TEXT NOT NULL DEFAULT ''
+                )
+                """
+            )
+            columnas = {fila[1] for fila in self._conexion.execute("PRAGMA table_info(clientes)")}
+            if "telefono_norm" not in columnas:
+                self._conexion.execute(
+                    "ALTER TABLE clientes ADD COLUMN telefono_norm TEXT NOT NULL DEFAULT ''"
+                )
+            self._conexion.execute(
+                """
+                CREATE TABLE IF NOT EXISTS clientes_tokens (
+                    token TEXT NOT NULL,
+                    email_norm TEXT NOT NULL,
+                    PRIMARY KEY (token, email_norm)
+                ) WITHOUT ROWID
+                """
+            )
+            self._conexion.execute("CREATE INDEX IF NOT EXISTS idx_clientes_tipo ON clientes (tipo)")
+            self._conexion.execute(
+                "CREATE INDEX IF NOT EXISTS idx_clientes_telefono ON clientes (telefono_norm)"
+            )
+            self._conexion.execute(
+                "CREATE INDEX IF NOT EXISTS idx_tokens_email ON clientes_tokens (email_norm)"
+            )
+
+            if version < self.VERSION_ESQUEMA:
+                # Completar los índices de consultas para filas ya existentes.
+                existentes = self._conexion.execute(
+                    "SELECT nombre, email, telefono, direccion, tipo FROM clientes"
+                ).fetchall()
+                for cliente in map(self._a_cliente, existentes):
+                    clave = normalizar_email(cliente.email)
+                    self._conexion.execute(
+                        "UPDATE clientes SET telefono_norm = ? WHERE email_norm = ?",
+                        (normalizar_telefono(cliente.telefono), clave),
+                    )
+                    self._guardar_tokens(clave, cliente)
+                self._conexion.execute(f"PRAGMA user_version = {self.VERSION_ESQUEMA}")
+
+    def _guardar_tokens(self, clave: str, cliente) -> None:
+        """Reemplaza las palabras indexadas de un cliente (dentro de la transacción)."""
+        self._conexion.execute("DELETE FROM clientes_tokens WHERE email_norm = ?", (clave,))
+        self._conexion.executemany(
+            "INSERT INTO clientes_tokens (token, email_norm) VALUES (?, ?)",
+            ((token, clave) for token in tokens_cliente(cliente)),
+        )
+
+    # -------- Conversión fila <-> cliente --------
+    @staticmethod
+    def _a_fila(cliente) -> tuple:
+        return (
+            normalizar_email(cliente.email),
+            cliente.email,
+            cliente.nombre,
+            cliente.telefono,
+            cliente.direccion,
+            cliente.tipo(),
+            normalizar_telefono(cliente.telefono),
+        )
+
+    @staticmethod
+    def _a_cliente(fila):
+        nombre, email, telefono, direccion, tipo = fila
+        return clase_tipo(tipo)(nombre, email, telefono, direccion)
+
+    def _por_partes(self, sql: str, claves):
+        """Ejecuta `sql` (con {marcas} en un IN) por partes de hasta 500 claves.
+
+        SQLite limita la cantidad de parámetros por consulta.
+        """
+        claves = list(claves)
+        for i in range(0, len(claves), 500):
+            parte = claves[i:i + 500]
+            yield from self._conexion.execute(sql.format(marcas=",".join("?" * len(parte))), parte)
+
+    def _leer(self, sql: str, parametros=()):
+        cursor = self._conexion.execute(sql, parametros)
+        while True:
+            filas = cursor.fetchmany(self.FILAS_POR_LECTURA)
+            if not filas:
+                return
+            yield from filas
+
+    # -------- Interfaz del almacén --------
+    def __len__(self) -> int:
+        return self._total
+
+    def __iter__(self):
+        for fila in self._leer(
+            "SELECT nombre, email, telefono, direccion, tipo FROM clientes ORDER BY id"
+        ):
+            yield self._a_cliente(fila)
+
+    def recorrer(self, posicion: int = 0, tipo: str | None = None):
+        """Genera (id, cliente) con id > `posicion`; usa la clave primaria."""
+        sql = "SELECT id, nombre, email, telefono, direccion, tipo FROM clientes WHERE id > ?"
+        parametros = [posicion]
+        if tipo is not None:
+            sql += " AND tipo = ?"
+            parametros.append(tipo)
+        for id_, *fila in self._leer(sql + " ORDER BY id", parametros):
+            yield id_, self._a_cliente(fila)
+
+    def obtener(self, clave: str):
+        fila = self._conexion.execute(
+            "SELECT nombre, email, telefono, direccion, tipo FROM clientes WHERE email_norm = ?",
+            (clave,),
+        ).fetchone()
+        return self._a_cliente(fila) if fila else None
+
+    def obtener_lote(self, claves) -> dict:
+        """Retorna {clave: cliente} de las claves registradas."""
+        return {
+            clave: self._a_cliente(fila)
+            for clave, *fila in self._por_partes(
+                "SELECT email_norm, nombre, email, telefono, direccion, tipo FROM clientes "
+                "WHERE email_norm IN ({marcas})",
+                claves,
+            )
+        }
+
+    def existentes(self, claves) -> set[str]:
+        """Retorna el subconjunto de claves que ya están registradas."""
+        return {
+            fila[0]
+            for fila in self._por_partes(
+                "SELECT email_norm FROM clientes WHERE email_norm IN ({marcas})", claves
+            )
+        }
+
+    def insertar(self, cliente) -> None:
+        self.insertar_lote([cliente])
+
+    def insertar_lote(self, clientes) -> None:
+        """Inserta todo el lote en una sola transacción (todo o nada)."""
+        self.guardar_lote((), clientes)
+
+    def reemplazar(self, cliente) -> None:
+        self.reemplazar_lote([cliente])
+
+    def reemplazar_lote(self, clientes) -> None:
+        """Actualiza todo el lote en una sola transacción (todo o nada)."""
+        self.guardar_lote(clientes, ())
+
+    def guardar_lote(self, reemplazos, altas) -> None:
+        """Actualiza `reemplazos` e inserta `altas` en una sola transacción."""
+        # Si un lote repite un email, queda la última versión.
+        reemplazos = list({normalizar_email(c.email): c for c in reemplazos}.values())
+        cambios = [self._a_fila(cliente) for cliente in reemplazos]
+        anteriores = dict(
+            self._por_partes(
+                "SELECT email_norm, tipo FROM clientes WHERE email_norm IN ({marcas})",
+                (fila[0] for fila in cambios),
+            )
+        )
+        for fila in cambios:
+            if fila[0] not in anteriores:
+                raise ClienteNoEncontradoError(f"Cliente no encontrado: {fila[1]}")
+        altas = list(altas)
+        nuevas = [self._a_fila(cliente) for cliente in altas]
+
+        try:
+            with self._conexion:
+                self._conexion.executemany(
+                    "UPDATE clientes SET email = ?, nombre = ?, telefono = ?, direccion = ?, "
+                    "tipo = ?, telefono_norm = ? WHERE email_norm = ?",
+                    ((email, nombre, telefono, direccion, tipo, telefono_norm, clave)
+                     for clave, email, nombre, telefono, direccion, tipo, telefono_norm in cambios),
+                )
+                self._conexion.executemany(
+                    "DELETE FROM clientes_tokens WHERE email_norm = ?", ((fila[0],) for fila in cambios)
+                )
+                self._conexion.executemany(
+                    "INSERT INTO clientes "
+                    "(email_norm, email, nombre, telefono, direccion, tipo, telefono_norm) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    nuevas,
+                )
+                self._conexion.executemany(
+                    "INSERT INTO clientes_tokens (token, email_norm) VALUES (?, ?)",
+                    (
+                        (token, fila[0])
+                        for filas, clientes in ((cambios, reemplazos), (nuevas, altas))
+                        for fila, cliente in zip(filas, clientes)
+                        for token in tokens_cliente(cliente)
+                    ),
+                )
+        except sqlite3.IntegrityError as exc:
+            raise ClienteExistenteError(f"Ya existe un cliente con ese email: {exc}")
+        for fila in cambios:
+            self._conteo.cambiar(anteriores[fila[0]], fila[5])
+        self._total += len(nuevas)
+        for fila in nuevas:
+            self._conteo.sumar(fila[5])
+
+    def quitar(self, clave: str):
+        return self.quitar_lote([clave]).get(clave)
+
+    def quitar_lote(self, claves) -> dict:
+        """Quita las claves registradas en una transacción; retorna {clave: cliente}."""
+        quitados = self.obtener_lote(claves)
+        if not quitados:
+            return quitados
+        with self._conexion:
+            self._conexion.executemany(
+                "DELETE FROM clientes WHERE email_norm = ?", ((clave,) for clave in quitados)
+            )
+            self._conexion.executemany(
+                "DELETE FROM clientes_tokens WHERE email_norm = ?", ((clave,) for clave in quitados)
+            )
+        self._total -= len(quitados)
+        for cliente in quitados.values():
+            self._conteo.sumar(cliente.tipo(), -1)
+        return quitados
+
+    def contar_por_tipo(self) -> dict[str, int]:
+        return self._conteo.copia()
+
+    def consultar(self, filtro: FiltroClientes, pagina: int, por_pagina: int) -> PaginaConsulta:
+        condiciones, parametros = [], []
+        if filtro.tipo:
+            condiciones.append("tipo = ?")
+            parametros.append(filtro.tipo)
+        if filtro.telefono:
+            condiciones.append("telefono_norm = ?")
+            parametros.append(filtro.telefono)
+        for token in sorted(filtro.tokens):
+            condiciones.append(
+                "email_norm IN (SELECT email_norm FROM clientes_tokens WHERE token = ?)"
+            )
+            parametros.append(token)
+        if filtro.prefijo:
+            # Rango sobre la clave primaria de clientes_tokens (usa el índice).
+            condiciones.append(
+                "email_norm IN (SELECT email_norm FROM clientes_tokens WHERE token >= ? AND token < ?)"
+            )
+            parametros.extend((filtro.prefijo, filtro.prefijo + "\uffff"))
+
+        donde = f" WHERE {' AND '.join(condiciones)}" if condiciones else ""
+        if condiciones:
+            total = self._conexion.execute(
+                f"SELECT COUNT(*) FROM clientes{donde}", parametros
+            ).fetchone()[0]
+        else:
+            total = self._total
+        filas = self._conexion.execute(
+            f"SELECT nombre, email, telefono, direccion, tipo FROM clientes{donde} "
+            "ORDER BY id LIMIT ? OFFSET ?",
+            parametros + [por_pagina, (pagina - 1) * por_pagina],
+        ).fetchall()
+        return PaginaConsulta([self._a_cliente(f) for f in filas], total, pagina, por_pagina)
+
+    def filas(self):
+        """Genera (nombre, email, telefono, direccion, tipo) sin crear objetos Cliente."""
+        yield from self._leer(
+            "SELECT nombre, email, telefono, direccion, tipo FROM clientes ORDER BY id"
+        )
+
+    def cerrar(self) -> None:
+        self._conexion.close()
@@ -10,40 +10,212 @@ Requisitos del PDF:
 
 Este módulo usa rutas relativas al proyecto para que los archivos
 queden SIEMPRE dentro de la carpeta del trabajo.
+
+Además del CSV plano, importar_csv reconoce un CSV comprimido (gzip, bz2,
+xz) o el formato columnar .gicc por sus primeros bytes, y exportar_csv
+los escribe según la extensión del destino (ver modulos/formatos.py).
+
+Con `reanudable=True`, importar_csv guarda un punto de control (JSON
+oculto junto al archivo) con cada lote confirmado y exportar_csv cada
+FILAS_POR_PUNTO_CONTROL filas: el byte y la línea hasta donde todo quedó
+confirmado y el sha256 de esos bytes. Si el proceso se corta, la misma
+llamada continúa desde ahí en lugar de empezar de nuevo.
 """
 
 from __future__ import annotations
 
 import csv
+import hashlib
+import io
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
 
+from modulos.duplicados import indice_del_gestor
 from modulos.excepciones import ArchivoError
-from modulos.logger_config import obtener_logger
+from modulos.formatos import (
+    COLUMNAS_CSV,
+    FILAS_POR_BLOQUE,
+    abrir_binario,
+    escritor_para,
+    formato_de_ruta,
+    leer_bloques_columnares,
+    leer_cabecera_columnar,
+)
+from modulos.logger_config import evento, obtener_logger
+from modulos.metricas import contar, instrumentar, medir_lotes, metricas_activas, observar
 from modulos.rutas import dir_datos, dir_reportes
+from modulos.tipos_cliente import crear_clientes
+from modulos.validaciones import ERROR_TIPO, MENSAJES_ERROR, normalizar_email, validar_lote
 
 
 logger = obtener_logger()
 
+# Filas por lote al importar: cada lote se valida y confirma completo
+TAMANO_LOTE = 1_000
+# Bytes aproximados por tramo en la importación en paralelo
+TAMANO_TRAMO = 8 * 1024 * 1024
+# Máximo de filas rechazadas que se guardan con detalle en el resultado
+MAX_RECHAZOS_DETALLE = 1_000
+# Reporte: clientes por bloque de texto y tamaño del buffer de escritura
+CLIENTES_POR_BLOQUE = 1_000
+BUFFER_REPORTE = 1024 * 1024
+# Filas entre dos puntos de control de una exportación reanudable (la
+# importación guarda uno por lote: lo releído se contaría dos veces)
+FILAS_POR_PUNTO_CONTROL = 100_000
+# Bytes por lectura al recalcular la huella de lo ya procesado
+BLOQUE_HUELLA = 1024 * 1024
+
+
+def _escribir_atomico(ruta: Path, escribir, binario: bool = False) -> None:
+    """Escribe `ruta` mediante un temporal en la misma carpeta + os.replace.
+
+    Quien lea el archivo ve la versión anterior o la nueva completa, nunca
+    una a medio escribir (aunque el proceso muera durante la escritura).
+    `escribir` recibe el archivo abierto como texto, o en binario si
+    `binario` es True.
+    """
+    temporal = ruta.with_name(f".{ruta.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        if binario:
+            archivo = open(temporal, mode="wb")
+        else:
+            archivo = open(temporal, mode="w", newline="", encoding="utf-8")
+        with archivo:
+            escribir(archivo)
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        os.replace(temporal, ruta)
+    finally:
+        temporal.unlink(missing_ok=True)
+
+
+def _escribir_clientes(gestor, archivo) -> int:
+    """Escribe encabezado + una fila por cliente y retorna cuántas escribió."""
+    escritor = csv.writer(archivo)
+    escritor.writerow(COLUMNAS_CSV)
+
+    # El almacén entrega las filas ya armadas (en SQLite sin crear objetos).
+    registros = 0
+    with gestor.lectura():
+        for fila in gestor.almacen.filas():
+            escritor.writerow(fila)
+            registros += 1
+    contar("exportar.filas_escritas", registros)
+    return registros
+
+
+def _escribir_bloques(archivo, filas, escritor, control=None) -> int:
+    """Escribe `filas` en `archivo` (binario) de a FILAS_POR_BLOQUE con `escritor`.
+
+    Con un punto de control, cada bloque se suma a su posición y huella, y
+    cada FILAS_POR_PUNTO_CONTROL filas se baja a disco y se guarda.
+    Retorna las filas escritas.
+    """
+    escritas = 0
+    while True:
+        bloque = list(islice(filas, FILAS_POR_BLOQUE))
+        if not bloque:
+            break
+        datos = escritor.bloque(bloque)
+        archivo.write(datos)
+        escritas += len(bloque)
+        if control is None:
+            continue
+        control.huella.update(datos)
+        control.posicion += len(datos)
+        control.filas += len(bloque)
+        control.datos["ultimo_email"] = bloque[-1][1]
+        if control.filas // FILAS_POR_PUNTO_CONTROL != (control.filas - len(bloque)) // FILAS_POR_PUNTO_CONTROL:
+            archivo.flush()
+            os.fsync(archivo.fileno())
+            control.guardar()
+    contar("exportar.filas_escritas", escritas)
+    return escritas
+
+
+def _exportar_archivo(gestor, ruta: Path) -> int:
+    """Exporta todos los clientes a `ruta` en el formato de su extensión (de forma atómica)."""
+    escritor = escritor_para(ruta)
+    registros = 0
+
+    def escribir(archivo) -> None:
+        nonlocal registros
+        archivo.write(escritor.inicio())
+        # El almacén entrega las filas ya armadas (en SQLite sin crear objetos).
+        with gestor.lectura():
+            registros = _escribir_bloques(archivo, gestor.almacen.filas(), escritor)
+
+    _escribir_atomico(ruta, escribir, binario=True)
+    return registros
+
+
+@instrumentar("archivos.exportar_csv")
+def exportar_csv(
+    gestor, incremental: bool = False, compactar: bool = True, destino=None, reanudable: bool = False
+) -> Path:
+    """Exporta los clientes registrados a datos/clientes.csv.
+
+    Por defecto reescribe la instantánea completa (de forma atómica).
+    Con `incremental=True` solo agrega al diario datos/clientes_cambios.csv
+    los clientes modificados desde la última exportación y, si `compactar`
+    es True, fusiona diario e instantánea en un hilo en segundo plano.
+    Los cambios que marca el gestor son relativos a la instantánea de su
+    última exportación completa: si no hay una (la primera exportación de
+    la sesión) o es otra (la reescribió otro gestor), la exportación
+    incremental también escribe la instantánea completa.
+
+    `destino` (una ruta o un archivo de texto abierto, p. ej. sys.stdout)
+    exporta una copia completa ahí sin tocar la instantánea ni el diario.
+    Si la ruta termina en .gz, .bz2 o .xz el CSV se comprime, y con .gicc
+    se usa el formato columnar (ver modulos/formatos.py).
+
+    Con `reanudable=True` la exportación completa se escribe en un archivo
+    parcial con puntos de control (ver _exportar_reanudable); si se corta,
+    la siguiente llamada continúa desde el último.
+    """
+    if destino is not None:
+        return _exportar_copia(gestor, destino, reanudable)
 
-def exportar_csv(gestor) -> Path:
-    """Exporta los clientes registrados a datos/clientes.csv."""
     ruta_csv = dir_datos() / "clientes.csv"
 
+    if incremental and ruta_csv.exists() and _exportar_cambios(gestor, ruta_csv, compactar):
+        return ruta_csv
+
+    # Una compactación en curso podría pisar la instantánea nueva.
+    esperar_compactacion()
+
+    inicio = time.perf_counter()
     try:
-        with open(ruta_csv, mode="w", newline="", encoding="utf-8") as archivo:
-            escritor = csv.writer(archivo)
-            escritor.writerow(["nombre", "email", "telefono", "direccion", "tipo"])
-
-            for cliente in gestor.clientes:
-                escritor.writerow([
-                    cliente.nombre,
-                    cliente.email,
-                    cliente.telefono,
-                    cliente.direccion,
-                    cliente.tipo(),
-                ])
-
-        logger.info("EXPORT CSV -> %s (registros=%s)", ruta_csv, len(gestor.clientes))
+        # Bajo la lectura del gestor nadie puede marcar cambios nuevos entre
+        # la instantánea y el descarte de los pendientes.
+        with _candado_diario, gestor.lectura():
+            # Sin generación mientras se reescribe: si algo falla, ningún
+            # gestor agrega cambios al diario de una instantánea que no conoce.
+            _ruta_generacion(ruta_csv).unlink(missing_ok=True)
+            if reanudable:
+                registros = _exportar_reanudable(gestor, ruta_csv)
+            else:
+                registros = _exportar_archivo(gestor, ruta_csv)
+            # La instantánea completa ya incluye todo lo que tenía el diario.
+            _ruta_diario(ruta_csv).unlink(missing_ok=True)
+            _ruta_diario(ruta_csv, compactando=True).unlink(missing_ok=True)
+            generacion = uuid.uuid4().hex
+            _escribir_atomico(_ruta_generacion(ruta_csv), lambda archivo: archivo.write(generacion))
+            gestor.descartar_cambios(generacion)
+
+        logger.info(
+            "EXPORT CSV -> %s (registros=%s)", ruta_csv, registros,
+            extra=evento("EXPORT", duracion=time.perf_counter() - inicio),
+        )
         return ruta_csv
 
     except Exception as exc:
@@ -51,83 +223,1007 @@ def exportar_csv(gestor) -> Path:
         raise ArchivoError(f"No se pudo exportar el CSV: {exc}")
 
 
-def importar_csv(gestor, archivo_entrada: Path | None = None) -> int:
-    """Importa clientes desde datos/clientes_entrada.csv.
+def _exportar_copia(gestor, destino, reanudable: bool = False) -> Path:
+    """Exporta todos los clientes a `destino` (ruta o archivo abierto)."""
+    inicio = time.perf_counter()
+    if reanudable and hasattr(destino, "write"):
+        raise ArchivoError("La exportación reanudable necesita una ruta de archivo.")
+    try:
+        if reanudable:
+            ruta = Path(destino)
+            registros = _exportar_reanudable(gestor, ruta)
+        elif hasattr(destino, "write"):
+            ruta = Path(getattr(destino, "name", "-"))
+            registros = _escribir_clientes(gestor, destino)
+            destino.flush()
+        else:
+            ruta = Path(destino)
+            registros = _exportar_archivo(gestor, ruta)
+    except Exception as exc:
+        logger.error("ERROR exportando CSV: %s", exc)
+        raise ArchivoError(f"No se pudo exportar el CSV: {exc}")
 
-    Retorna la cantidad de clientes agregados (no duplicados).
-    """
-    ruta_csv = archivo_entrada or (dir_datos() / "clientes_entrada.csv")
+    logger.info(
+        "EXPORT CSV -> %s (registros=%s)", ruta, registros,
+        extra=evento("EXPORT", duracion=time.perf_counter() - inicio),
+    )
+    return ruta
+
+
+# -------- Exportación incremental (diario de cambios) --------
+# Evita que se agregue al diario mientras la compactación lo rota.
+_candado_diario = threading.Lock()
+_hilo_compactacion: threading.Thread | None = None
+
+
+def _ruta_diario(ruta_csv: Path, compactando: bool = False) -> Path:
+    sufijo = "_cambios.compactando.csv" if compactando else "_cambios.csv"
+    return ruta_csv.with_name(ruta_csv.stem + sufijo)
 
-    if not ruta_csv.exists():
-        raise ArchivoError(f"No existe el archivo de entrada: {ruta_csv}")
 
-    agregados = 0
+def _ruta_generacion(ruta_csv: Path) -> Path:
+    """Archivo oculto con la generación de la instantánea (cambia en cada exportación completa)."""
+    return ruta_csv.with_name(f".{ruta_csv.name}.generacion")
+
+
+def _leer_generacion(ruta_csv: Path) -> str | None:
+    try:
+        return _ruta_generacion(ruta_csv).read_text(encoding="utf-8").strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def _exportar_cambios(gestor, ruta_csv: Path, compactar: bool) -> bool:
+    """Agrega al diario una fila por cliente modificado ("U") o eliminado ("D").
+
+    Retorna False sin escribir nada si los cambios del gestor no son
+    relativos a la instantánea actual de `ruta_csv` (hay que exportarla
+    completa).
+    """
+    ruta_diario = _ruta_diario(ruta_csv)
+    cambios = {}
     try:
-        with open(ruta_csv, mode="r", encoding="utf-8") as archivo:
-            lector = csv.DictReader(archivo)
+        with _candado_diario:
+            generacion = gestor.generacion_exportada()
+            if generacion is None or generacion != _leer_generacion(ruta_csv):
+                return False
+            cambios = gestor.tomar_cambios()
+            nuevo = not ruta_diario.exists()
+            with open(ruta_diario, mode="a", newline="", encoding="utf-8") as archivo:
+                escritor = csv.writer(archivo)
+                if nuevo:
+                    escritor.writerow(("op",) + COLUMNAS_CSV)
+                with gestor.lectura():
+                    for clave, op in cambios.items():
+                        cliente = gestor.buscar_por_email(clave) if op == "U" else None
+                        if cliente is None:
+                            escritor.writerow(("D", "", clave, "", "", ""))
+                        else:
+                            escritor.writerow(("U",) + cliente.fila())
+                archivo.flush()
+                os.fsync(archivo.fileno())
+    except Exception as exc:
+        # Devolver los cambios para no perderlos en el próximo intento.
+        gestor.restaurar_cambios(cambios)
+        logger.error("ERROR exportando cambios CSV: %s", exc)
+        raise ArchivoError(f"No se pudo exportar el CSV: {exc}")
+
+    logger.info("EXPORT CAMBIOS -> %s (registros=%s)", ruta_diario, len(cambios))
+    if compactar:
+        compactar_en_segundo_plano(ruta_csv)
+    return True
+
+
+def compactar_diario(ruta_csv: Path | None = None) -> int:
+    """Fusiona el diario de cambios en una nueva instantánea de clientes.csv.
 
-            # Soportar CSV con encabezados en mayúsculas/minúsculas.
-            
+    Lee la instantánea en streaming y solo mantiene en memoria los cambios
+    del diario. Retorna la cantidad de cambios aplicados.
+    """
+    ruta_csv = ruta_csv or (dir_datos() / "clientes.csv")
+    ruta_diario = _ruta_diario(ruta_csv)
+    ruta_compactando = _ruta_diario(ruta_csv, compactando=True)
+
+    with _candado_diario:
+        # Si una compactación anterior quedó a medias, su diario es más
+        # antiguo: se le agregan al final los cambios nuevos.
+        if ruta_diario.exists():
+            if ruta_compactando.exists():
+                with open(ruta_diario, mode="r", newline="", encoding="utf-8") as origen, \
+                        open(ruta_compactando, mode="a", newline="", encoding="utf-8") as destino:
+                    next(origen, None)  # encabezado
+                    shutil.copyfileobj(origen, destino)
+                ruta_diario.unlink()
+            else:
+                os.replace(ruta_diario, ruta_compactando)
+
+    if not ruta_compactando.exists():
+        return 0
+
+    # Último cambio por email; el orden del dict conserva las altas nuevas.
+    cambios = {}
+    with open(ruta_compactando, mode="r", newline="", encoding="utf-8") as archivo:
+        lector = csv.reader(archivo)
+        next(lector, None)
+        for op, *fila in lector:
+            if len(fila) < len(COLUMNAS_CSV):
+                continue
+            clave = normalizar_email(fila[1])
+            cambios.pop(clave, None)
+            cambios[clave] = (op, fila)
+
+    def escribir(archivo) -> None:
+        escritor = csv.writer(archivo)
+        escritor.writerow(COLUMNAS_CSV)
+        with open(ruta_csv, mode="r", newline="", encoding="utf-8") as snapshot:
+            lector = csv.reader(snapshot)
+            next(lector, None)
             for fila in lector:
-                fila_norm = {str(k).strip().lower(): (v or "").strip() for k, v in fila.items()}
+                cambio = cambios.pop(normalizar_email(fila[1]), None)
+                if cambio is None:
+                    escritor.writerow(fila)
+                elif cambio[0] == "U":
+                    escritor.writerow(cambio[1])
+        for op, fila in cambios.values():
+            if op == "U":
+                escritor.writerow(fila)
+
+    # Si el proceso muere entre el reemplazo y el borrado del diario, la
+    # próxima compactación lo vuelve a aplicar sin efectos (es idempotente).
+    aplicados = len(cambios)
+    _escribir_atomico(ruta_csv, escribir)
+    ruta_compactando.unlink(missing_ok=True)
+
+    logger.info("COMPACTACION CSV -> %s (cambios=%s)", ruta_csv, aplicados)
+    return aplicados
+
+
+def compactar_en_segundo_plano(ruta_csv: Path | None = None) -> threading.Thread | None:
+    """Lanza compactar_diario en un hilo (si ya hay uno corriendo, no hace nada).
+
+    El hilo no es daemon: al salir, Python espera a que termine de escribir.
+    """
+    global _hilo_compactacion
+
+    if _hilo_compactacion is not None and _hilo_compactacion.is_alive():
+        return None
+
+    def tarea() -> None:
+        try:
+            compactar_diario(ruta_csv)
+        except Exception as exc:
+            logger.error("ERROR compactando CSV: %s", exc)
+
+    _hilo_compactacion = threading.Thread(target=tarea, name="gic-compactacion")
+    _hilo_compactacion.start()
+    return _hilo_compactacion
+
+
+def esperar_compactacion() -> None:
+    """Bloquea hasta que termine la compactación en curso (si hay una)."""
+    if _hilo_compactacion is not None:
+        _hilo_compactacion.join()
+
+
+# -------- Puntos de control (importación y exportación reanudables) --------
+def _ruta_punto_control(ruta: Path) -> Path:
+    return ruta.with_name(f".{ruta.name}.punto_control.json")
+
+
+def _huella_prefijo(ruta: Path, hasta: int, descomprimir: bool = False):
+    """sha256 de los primeros `hasta` bytes de `ruta` (para seguir sumándole bytes).
+
+    Con `descomprimir`, de los bytes ya descomprimidos si es un CSV comprimido.
+    """
+    huella = hashlib.sha256()
+    with abrir_binario(ruta) if descomprimir else open(ruta, mode="rb") as archivo:
+        while hasta > 0:
+            bloque = archivo.read(min(BLOQUE_HUELLA, hasta))
+            if not bloque:
+                break
+            huella.update(bloque)
+            hasta -= len(bloque)
+    return huella
+
+
+@dataclass
+class _PuntoControl:
+    """Hasta dónde quedó confirmada una importación o exportación.
+
+    `posicion` es el byte del archivo hasta el que todo está confirmado,
+    `lineas` las líneas físicas y `filas` los registros hasta ahí, y
+    `huella` el sha256 de esos bytes. `datos` guarda lo propio de cada
+    operación (encabezado, conteos, último email...).
+    """
+
+    ruta: Path
+    operacion: str
+    posicion: int = 0
+    lineas: int = 0
+    filas: int = 0
+    huella: object = field(default_factory=hashlib.sha256)
+    datos: dict = field(default_factory=dict)
+    reanudado: bool = False
+
+    @classmethod
+    def cargar(
+        cls, ruta: Path, operacion: str, archivo: Path, descomprimir: bool = False
+    ) -> _PuntoControl | None:
+        """Punto de control guardado para `archivo`; None si no hay o ya no coincide.
+
+        Coincide si los primeros `posicion` bytes de `archivo` siguen teniendo
+        la huella guardada (el archivo no cambió en la parte ya procesada).
+        Si el archivo es más corto, la huella de lo que hay no puede coincidir.
+        """
+        try:
+            guardado = json.loads(ruta.read_text(encoding="utf-8"))
+            if guardado.get("operacion") != operacion:
+                return None
+            posicion = int(guardado["posicion"])
+            huella = _huella_prefijo(archivo, posicion, descomprimir)
+            coincide = huella.hexdigest() == guardado["huella"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as exc:
+            logger.warning("PUNTO DE CONTROL ilegible, se empieza de nuevo: %s (%s)", ruta, exc)
+            return None
+        if not coincide:
+            logger.warning("PUNTO DE CONTROL descartado: %s cambió desde el último", archivo)
+            return None
+        return cls(
+            ruta,
+            operacion,
+            posicion,
+            int(guardado.get("lineas", 0)),
+            int(guardado.get("filas", 0)),
+            huella,
+            guardado.get("datos", {}),
+            reanudado=True,
+        )
+
+    def guardar(self) -> None:
+        guardado = {
+            "operacion": self.operacion,
+            "posicion": self.posicion,
+            "lineas": self.lineas,
+            "filas": self.filas,
+            "huella": self.huella.hexdigest(),
+            "datos": self.datos,
+        }
+        _escribir_atomico(self.ruta, lambda archivo: json.dump(guardado, archivo, ensure_ascii=False))
+        contar(f"{self.operacion}.puntos_control")
+
+    def borrar(self) -> None:
+        self.ruta.unlink(missing_ok=True)
+
+
+def _exportar_reanudable(gestor, ruta: Path) -> int:
+    """Exporta a `ruta` con un punto de control cada FILAS_POR_PUNTO_CONTROL filas.
+
+    Las filas se escriben en un archivo parcial oculto junto a `ruta`, que
+    la reemplaza al terminar. Si quedó uno de una exportación cortada, se
+    recorta al último punto de control y se continúa desde la fila
+    siguiente, siempre que la última fila exportada siga en el mismo lugar
+    (si hubo bajas o altas antes de ella se empieza de nuevo). Sirve para
+    todos los formatos: cada bloque se escribe completo (ver formatos.py).
+    Retorna la cantidad de filas del archivo completo.
+    """
+    parcial = ruta.with_name(f".{ruta.name}.parcial")
+    ruta_control = _ruta_punto_control(ruta)
+    control = _PuntoControl.cargar(ruta_control, "exportar", parcial) if parcial.exists() else None
+    escritor = escritor_para(ruta)
+
+    with gestor.lectura():
+        filas = iter(gestor.almacen.filas())
+        if control is not None:
+            ultima = next(islice(filas, control.filas - 1, None), None) if control.filas else None
+            if ultima is None or ultima[1] != control.datos.get("ultimo_email"):
+                logger.warning("PUNTO DE CONTROL descartado: los clientes cambiaron desde %s", ruta_control)
+                control = None
+                filas = iter(gestor.almacen.filas())
+        if control is None:
+            control = _PuntoControl(ruta_control, "exportar")
+        else:
+            logger.info("EXPORT CSV reanudado -> %s (desde la fila %s)", ruta, control.filas)
+
+        with open(parcial, mode="r+b" if control.reanudado else "wb") as archivo:
+            archivo.truncate(control.posicion)
+            archivo.seek(control.posicion)
+            if not control.reanudado:
+                datos = escritor.inicio()
+                archivo.write(datos)
+                control.huella.update(datos)
+                control.posicion += len(datos)
+            _escribir_bloques(archivo, filas, escritor, control)
+            archivo.flush()
+            os.fsync(archivo.fileno())
+
+    os.replace(parcial, ruta)
+    control.borrar()
+    return control.filas
+
+
+@dataclass
+class FilaRechazada:
+    """Fila del CSV de entrada que no pasó las validaciones."""
+
+    linea: int
+    motivo: str
+
+
+@dataclass
+class FilaSimilar:
+    """Fila importada (o descartada por email repetido) parecida a otro cliente."""
+
+    linea: int
+    email: str
+    similar_a: str
+    puntaje: float
+
+
+@dataclass
+class ResultadoImportacion:
+    """Resumen de una importación de clientes desde CSV."""
+
+    archivo: Path
+    agregados: int = 0
+    duplicados: int = 0
+    total_rechazados: int = 0
+    filas_leidas: int = 0
+    segundos: float = 0.0
+    # Solo se guarda el detalle de las primeras filas rechazadas para que la
+    # memoria no crezca con archivos muy grandes y muy sucios.
+    rechazados: list[FilaRechazada] = field(default_factory=list)
+    # Posibles duplicados (solo con importar_csv(..., similares=True))
+    total_similares: int = 0
+    similares: list[FilaSimilar] = field(default_factory=list)
+    # Línea desde la que continuó una importación reanudable (0 = desde el
+    # principio). Los totales incluyen lo importado antes del corte; el
+    # detalle de rechazos y similares, solo lo de esta ejecución.
+    reanudado_desde: int = 0
+
+    @property
+    def filas_por_segundo(self) -> float:
+        return self.filas_leidas / self.segundos if self.segundos > 0 else 0.0
+
+    def rechazar(self, linea: int, motivo: str) -> None:
+        self.total_rechazados += 1
+        if len(self.rechazados) < MAX_RECHAZOS_DETALLE:
+            self.rechazados.append(FilaRechazada(linea, motivo))
 
-                # Aceptar valores como "ClientePremium" o "Premium".
-                tipo_raw = fila_norm.get("tipo", "")
-                tipo = tipo_raw.replace("Cliente", "").strip().lower()
+    def senalar_similar(self, linea: int, email: str, similar_a: str, puntaje: float) -> None:
+        self.total_similares += 1
+        if len(self.similares) < MAX_RECHAZOS_DETALLE:
+            self.similares.append(FilaSimilar(linea, email, similar_a, round(puntaje, 3)))
 
-                cliente = gestor._crear_cliente_por_tipo(
-                    tipo,
-                    fila_norm.get("nombre", ""),
-                    fila_norm.get("email", ""),
-                    fila_norm.get("telefono", ""),
-                    fila_norm.get("direccion", ""),
-                )
 
-                # Evitar duplicados por email
-                if gestor.buscar_por_email(cliente.email):
-                    logger.warning("DUPLICADO en import: email=%s", cliente.email)
-                    continue
+def _indices_columnas(encabezado: list[str]) -> dict[str, int]:
+    """Ubica cada columna esperada en el encabezado (sin importar mayúsculas)."""
+    posiciones = {str(col).strip().lower(): i for i, col in enumerate(encabezado)}
+    faltantes = [col for col in COLUMNAS_CSV if col not in posiciones]
+    if faltantes:
+        raise ArchivoError(f"Faltan columnas en el CSV: {', '.join(faltantes)}")
+    return {col: posiciones[col] for col in COLUMNAS_CSV}
 
-                gestor.clientes.append(cliente)
-                agregados += 1
 
-        logger.info("IMPORT CSV <- %s (agregados=%s)", ruta_csv, agregados)
-        return agregados
+def _leer_lotes(lector, tamano_lote: int, lineas_previas: int = 0):
+    """Agrupa las filas del lector en listas de (linea, fila) de tamaño fijo.
 
+    `lineas_previas` son las líneas del archivo anteriores a la primera
+    que entrega el lector (al reanudar una importación).
+    """
+    lote = []
+    # line_num indica la última línea física leída; la fila siguiente
+    # comienza justo después (importa si hay campos con saltos de línea).
+    linea = lector.line_num + lineas_previas + 1
+    for fila in lector:
+        inicio, linea = linea, lector.line_num + lineas_previas + 1
+        if not fila:
+            continue
+        lote.append((inicio, fila))
+        if len(lote) >= tamano_lote:
+            yield lote
+            lote = []
+    if lote:
+        yield lote
+
+
+def _validar_lote(lote, indices) -> list[tuple[int, tuple | None, str | None]]:
+    """Valida un lote de (linea, fila) por columnas con validar_lote.
+
+    Retorna una lista de (linea, campos, motivo): `campos` trae
+    (tipo, nombre, email, telefono, direccion) validados o None, y
+    `motivo` explica el rechazo cuando corresponde.
+    """
+    posiciones = [indices[col] for col in ("tipo", "nombre", "email", "telefono", "direccion")]
+    completas = []
+    validadas = []
+    for linea, fila in lote:
+        try:
+            campos = [(fila[i] or "").strip() for i in posiciones]
+        except IndexError:
+            validadas.append((linea, None, "Fila con columnas incompletas."))
+            continue
+        completas.append((linea, campos))
+        validadas.append(None)  # se completa abajo, manteniendo el orden
+
+    if completas:
+        lineas, campos = zip(*completas)
+        pendientes = iter(_validar_columnas(lineas, *zip(*campos)))
+        validadas = [valor if valor is not None else next(pendientes) for valor in validadas]
+    return validadas
+
+
+def _validar_columnas(lineas, tipos, nombres, emails, telefonos, direcciones) -> list[tuple]:
+    """Como _validar_lote, para filas completas que ya vienen por columnas
+    (sin espacios al inicio/fin), con `lineas` el número de cada una."""
+    revision = validar_lote(tipos, emails, telefonos, direcciones)
+    return [
+        (linea, (tipo, nombre, email, telefono, direccion), None) if codigo is None
+        else (linea, None, f"Tipo de cliente inválido: {tipo or '(vacío)'}") if codigo == ERROR_TIPO
+        else (linea, None, MENSAJES_ERROR[codigo])
+        for linea, nombre, email, telefono, direccion, codigo, tipo in zip(
+            lineas, nombres, emails, telefonos, direcciones, revision.codigos, revision.tipos
+        )
+    ]
+
+
+def _confirmar_lote(gestor, validadas, resultado: ResultadoImportacion, similares=None) -> None:
+    """Descarta duplicados y confirma completo en el gestor un lote ya validado.
+
+    Con un GestorConcurrente el lote se confirma como una sola escritura:
+    nadie agrega un email entre la verificación y el alta. `similares` es
+    el IndiceDuplicados con el que se señalan los posibles duplicados.
+    """
+    with gestor.escritura():
+        _confirmar_nuevos(gestor, validadas, resultado)
+    if similares is not None:
+        _senalar_similares(similares, validadas, resultado)
+
+
+def _senalar_similares(indice, validadas, resultado: ResultadoImportacion) -> None:
+    """Anota las filas parecidas a un cliente ya cargado o a una fila anterior.
+
+    Una fila descartada por email repetido se anota si sus demás datos no
+    coinciden con los del cliente que se quedó ("Los Nogales 9456" / "9769").
+    """
+    vistos = set()
+    for linea, campos, _ in validadas:
+        if campos is None:
+            continue
+        _, nombre, email, telefono, direccion = campos
+        clave = normalizar_email(email)
+        puntaje = indice.similitud_mismo_email(email, nombre, telefono, direccion)
+        if puntaje is not None or clave in vistos:
+            if puntaje is not None and puntaje < 1.0:
+                resultado.senalar_similar(linea, email, clave, puntaje)
+            continue
+        vistos.add(clave)
+        parecidos = indice.agregar(email, nombre, telefono, direccion)
+        if parecidos:
+            similar_a, puntaje = max(parecidos, key=lambda par: par[1])
+            resultado.senalar_similar(linea, email, similar_a, puntaje)
+            logger.warning(
+                "POSIBLE DUPLICADO en import: email=%s similar_a=%s puntaje=%.2f", email, similar_a, puntaje
+            )
+
+
+def _confirmar_nuevos(gestor, validadas, resultado: ResultadoImportacion) -> None:
+    inicio = time.perf_counter()
+    filas = []
+    # Una sola consulta al almacén por lote para detectar emails ya cargados.
+    vistos = gestor.emails_existentes(campos[2] for _, campos, _ in validadas if campos)
+    for linea, campos, motivo in validadas:
+        resultado.filas_leidas += 1
+        if campos is None:
+            resultado.rechazar(linea, motivo)
+            continue
+
+        email = campos[2]
+
+        # Evitar duplicados por email (contra el gestor y dentro del lote)
+        clave = normalizar_email(email)
+        if clave in vistos:
+            resultado.duplicados += 1
+            logger.warning("DUPLICADO en import: email=%s", email, extra=evento("DUPLICADO", email))
+            continue
+
+        vistos.add(clave)
+        filas.append(campos)
+
+    # Los tipos ya vienen normalizados por validar_lote: se crean todos de una vez.
+    nuevos = crear_clientes(filas)
+    creados = time.perf_counter()
+    gestor._insertar_lote(nuevos)
+    resultado.agregados += len(nuevos)
+    if metricas_activas():
+        observar("importar.deduplicar", creados - inicio, len(validadas))
+        observar("importar.insertar", time.perf_counter() - creados, len(nuevos))
+
+
+# -------- Importación reanudable --------
+# Totales del resultado que se guardan en el punto de control
+CONTEOS_IMPORTACION = ("filas_leidas", "agregados", "duplicados", "total_rechazados", "total_similares")
+
+
+class _LineasContadas:
+    """Líneas de un archivo abierto en binario, ya decodificadas para csv.reader.
+
+    Cada línea leída se suma a la posición y a la huella del punto de
+    control. El lector de CSV no lee por adelantado, así que al terminar un
+    lote la posición es justo el fin de su última fila.
+    """
+
+    def __init__(self, archivo, control: _PuntoControl):
+        self._archivo = archivo
+        self._control = control
+
+    def __iter__(self):
+        control = self._control
+        for linea in self._archivo:
+            control.posicion += len(linea)
+            control.huella.update(linea)
+            yield linea.decode("utf-8")
+
+
+def _almacen_de(gestor) -> str:
+    """Qué almacén recibe la importación (para no reanudar sobre otro)."""
+    almacen = gestor.almacen
+    return str(getattr(almacen, "ruta_db", None) or type(almacen).__name__)
+
+
+def _reanudar_importacion(gestor, ruta_csv: Path, resultado: ResultadoImportacion) -> _PuntoControl:
+    """Punto de control de la importación de `ruta_csv`: el guardado o uno nuevo.
+
+    El guardado se descarta si el gestor ya no tiene los clientes que
+    había al guardarlo (p. ej. un gestor en memoria que se perdió con el
+    corte): en ese caso se importa desde el principio.
+    """
+    ruta_control = _ruta_punto_control(ruta_csv)
+    # En un CSV comprimido las posiciones son de los bytes descomprimidos.
+    control = _PuntoControl.cargar(ruta_control, "importar", ruta_csv, descomprimir=True)
+    if control is not None and (
+        control.datos.get("almacen") != _almacen_de(gestor) or len(gestor) < control.datos.get("clientes", 0)
+    ):
+        logger.warning("PUNTO DE CONTROL descartado: el gestor no tiene lo ya importado (%s)", ruta_control)
+        control = None
+    if control is None:
+        return _PuntoControl(ruta_control, "importar")
+
+    for nombre, valor in control.datos.get("resultado", {}).items():
+        if nombre in CONTEOS_IMPORTACION:
+            setattr(resultado, nombre, int(valor))
+    resultado.reanudado_desde = control.lineas + 1
+    logger.info("IMPORT CSV reanudado <- %s (desde la línea %s)", ruta_csv, resultado.reanudado_desde)
+    return control
+
+
+def _filas_confirmadas(control: _PuntoControl, gestor, resultado: ResultadoImportacion, filas: int) -> None:
+    """Suma las `filas` del lote recién confirmado y guarda el punto de control.
+
+    Se guarda con cada lote: al reanudar, una fila ya confirmada no se
+    relee ni se cuenta otra vez como duplicado.
+    """
+    control.filas += filas
+    control.datos["almacen"] = _almacen_de(gestor)
+    control.datos["clientes"] = len(gestor)
+    control.datos["resultado"] = {nombre: getattr(resultado, nombre) for nombre in CONTEOS_IMPORTACION}
+    control.guardar()
+
+
+# -------- Importación en paralelo --------
+def _dividir_en_tramos(ruta_csv: Path, desde: int, tamano_tramo: int):
+    """Genera rangos de bytes (inicio, fin) que terminan en un salto de línea.
+
+    El corte no mira las comillas: un campo con saltos de línea puede
+    quedar partido entre dos tramos. _validar_tramo lo detecta y la
+    importación sigue en secuencial desde ese tramo.
+    """
+    total = ruta_csv.stat().st_size
+    with open(ruta_csv, mode="rb") as archivo:
+        inicio = desde
+        while inicio < total:
+            objetivo = inicio + tamano_tramo
+            if objetivo >= total:
+                fin = total
+            else:
+                archivo.seek(objetivo)
+                archivo.readline()
+                fin = archivo.tell()
+            yield inicio, fin
+            inicio = fin
+
+
+def _validar_tramo(ruta_csv: Path, inicio: int, fin: int, indices: dict[str, int]):
+    """Lee y valida un tramo del archivo (se ejecuta en un proceso hijo).
+
+    Retorna (lineas_del_tramo, validadas, partido) con números de línea
+    relativos al comienzo del tramo. `partido` indica que el tramo termina
+    dentro de un campo entre comillas (una cantidad impar de comillas,
+    contando que empieza fuera de uno): sus filas no sirven.
+    """
+    with open(ruta_csv, mode="rb") as archivo:
+        archivo.seek(inicio)
+        texto = archivo.read(fin - inicio).decode("utf-8")
+
+    if texto.count('"') % 2:
+        return 0, [], True
+    lector = csv.reader(io.StringIO(texto, newline=""))
+    validadas = []
+    for lote in _leer_lotes(lector, TAMANO_LOTE):
+        validadas.extend(_validar_lote(lote, indices))
+    return lector.line_num, validadas, False
+
+
+def _fusionar_tramo(gestor, tramo, lineas_previas: int, tamano_lote: int, resultado, similares) -> int:
+    """Confirma en orden las filas de un tramo y retorna las líneas acumuladas."""
+    lineas_tramo, validadas, _ = tramo
+    for i in range(0, len(validadas), tamano_lote):
+        lote = [
+            (linea + lineas_previas, campos, motivo)
+            for linea, campos, motivo in validadas[i:i + tamano_lote]
+        ]
+        _confirmar_lote(gestor, lote, resultado, similares)
+    return lineas_previas + lineas_tramo
+
+
+def _importar_en_paralelo(
+    gestor, ruta_csv: Path, tamano_lote: int, procesos: int, resultado, similares, control=None
+) -> None:
+    """Valida tramos del archivo en varios procesos y los confirma en orden.
+
+    Los procesos hijos solo leen y validan; la deduplicación y el alta se
+    hacen aquí, tramo por tramo y en el orden del archivo, por lo que el
+    resultado es el mismo que el de la importación secuencial. Se mantienen
+    como máximo 2 tramos en vuelo por proceso para acotar la memoria.
+
+    Con un punto de control (`control`), cada tramo se confirma como un
+    solo lote (su fin es la primera posición conocida) y se guarda tras
+    él; si viene de una importación cortada, se continúa desde su posición.
+
+    Si un tramo termina dentro de un campo entre comillas (un campo con
+    saltos de línea), los siguientes se descartan y el resto del archivo
+    se importa en secuencial desde el comienzo de ese tramo.
+    """
+    if control is not None and control.reanudado:
+        encabezado = control.datos.get("encabezado")
+        desde = control.posicion
+        lineas_previas = control.lineas
+    else:
+        with open(ruta_csv, mode="rb") as archivo:
+            primera_linea = archivo.readline()
+            desde = archivo.tell()
+        encabezado = next(csv.reader([primera_linea.decode("utf-8")]), None)
+        lineas_previas = 1  # el encabezado
+        if control is not None:
+            control.huella.update(primera_linea)
+            control.posicion, control.lineas = desde, lineas_previas
+
+    if not encabezado:
+        raise ArchivoError(f"El archivo de entrada está vacío: {ruta_csv}")
+    indices = _indices_columnas(encabezado)
+    if control is not None:
+        control.datos["encabezado"] = encabezado
+
+    pendientes = deque()
+    partido = None  # inicio del tramo partido dentro de un campo entre comillas
+    with open(ruta_csv, mode="rb") as archivo:
+        archivo.seek(desde)
+
+        def fusionar(inicio: int, fin: int, futuro) -> bool:
+            """Confirma un tramo; False si está partido (no se confirma nada)."""
+            nonlocal lineas_previas
+            tramo = futuro.result()
+            if tramo[2]:
+                return False
+            lote = tamano_lote if control is None else max(len(tramo[1]), 1)
+            lineas_previas = _fusionar_tramo(gestor, tramo, lineas_previas, lote, resultado, similares)
+            if control is not None:
+                # La huella se calcula aquí, en orden, con los bytes del tramo.
+                control.huella.update(archivo.read(fin - control.posicion))
+                control.posicion, control.lineas = fin, lineas_previas
+                _filas_confirmadas(control, gestor, resultado, len(tramo[1]))
+            return True
+
+        with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            tramos = _dividir_en_tramos(ruta_csv, desde, TAMANO_TRAMO)
+            while partido is None:
+                for inicio, fin in islice(tramos, procesos * 2 - len(pendientes)):
+                    futuro = ejecutor.submit(_validar_tramo, ruta_csv, inicio, fin, indices)
+                    pendientes.append((inicio, fin, futuro))
+                if not pendientes:
+                    break
+                inicio, fin, futuro = pendientes.popleft()
+                if not fusionar(inicio, fin, futuro):
+                    partido = inicio
+            for _, _, futuro in pendientes:
+                futuro.cancel()
+
+        if partido is not None:
+            logger.warning(
+                "IMPORT CSV: campo con saltos de línea partido entre tramos (%s); secuencial desde la línea %s",
+                ruta_csv,
+                lineas_previas + 1,
+            )
+            archivo.seek(partido)
+            if control is not None:
+                lineas = _LineasContadas(archivo, control)
+            else:
+                lineas = (linea.decode("utf-8") for linea in archivo)
+            _importar_secuencial(
+                gestor, lineas, ruta_csv, tamano_lote, resultado, similares, control,
+                encabezado=encabezado, lineas_previas=lineas_previas,
+            )
+
+
+def _importar_secuencial(
+    gestor,
+    archivo,
+    ruta_csv: Path,
+    tamano_lote: int,
+    resultado,
+    similares,
+    control=None,
+    encabezado: list[str] | None = None,
+    lineas_previas: int = 0,
+) -> None:
+    """Lee, valida y confirma lote por lote.
+
+    Con un punto de control, `archivo` son las _LineasContadas desde su
+    posición: el control se actualiza tras cada lote confirmado.
+    `encabezado` y `lineas_previas` continúan una lectura que empezó otro
+    (la importación en paralelo que pasa a secuencial).
+    """
+    lector = csv.reader(archivo)
+
+    if encabezado is None and control is not None and control.reanudado:
+        encabezado = control.datos.get("encabezado")
+        lineas_previas = control.lineas
+    elif encabezado is None:
+        # Soportar CSV con encabezados en mayúsculas/minúsculas.
+        encabezado = next(lector, None)
+    if encabezado is None:
+        raise ArchivoError(f"El archivo de entrada está vacío: {ruta_csv}")
+    indices = _indices_columnas(encabezado)
+    if control is not None:
+        control.datos["encabezado"] = encabezado
+
+    lotes = _leer_lotes(lector, tamano_lote, lineas_previas)
+    medir = metricas_activas()
+    if medir:
+        lotes = medir_lotes("importar.leer", lotes)
+    for lote in lotes:
+        inicio = time.perf_counter()
+        validadas = _validar_lote(lote, indices)
+        if medir:
+            observar("importar.validar", time.perf_counter() - inicio, len(lote))
+        _confirmar_lote(gestor, validadas, resultado, similares)
+        if control is not None:
+            control.lineas = lineas_previas + lector.line_num
+            _filas_confirmadas(control, gestor, resultado, len(lote))
+
+
+def _importar_columnar(gestor, archivo, ruta: Path, tamano_lote: int, resultado, similares, control=None) -> None:
+    """Importa un archivo columnar (ver formatos.py) bloque por bloque.
+
+    Las filas pasan por la misma validación y deduplicación que las del
+    CSV; su "línea" es la que tendrían en el CSV equivalente (encabezado
+    en la 1). Con un punto de control, cada bloque se confirma como un
+    solo lote y se guarda tras él; `archivo` ya viene en su posición si
+    se reanuda.
+    """
+    if control is None or not control.reanudado:
+        cabecera = leer_cabecera_columnar(archivo, ruta)
+        if control is not None:
+            control.huella.update(cabecera)
+            control.posicion, control.lineas = len(cabecera), 1
+    lineas = control.lineas if control is not None else 1
+
+    medir = metricas_activas()
+    for datos, columnas in leer_bloques_columnares(archivo, ruta):
+        # Se valida por columnas directamente, sin armar una tupla por fila.
+        nombres, emails, telefonos, direcciones, tipos = (list(map(str.strip, c)) for c in columnas)
+        filas = len(nombres)
+        lote = tamano_lote if control is None else max(filas, 1)
+        for desde in range(0, filas, lote):
+            hasta = min(desde + lote, filas)
+            inicio = time.perf_counter()
+            validadas = _validar_columnas(
+                range(lineas + desde + 1, lineas + hasta + 1),
+                tipos[desde:hasta], nombres[desde:hasta], emails[desde:hasta],
+                telefonos[desde:hasta], direcciones[desde:hasta],
+            )
+            if medir:
+                observar("importar.validar", time.perf_counter() - inicio, hasta - desde)
+            _confirmar_lote(gestor, validadas, resultado, similares)
+        lineas += filas
+        if control is not None:
+            control.huella.update(datos)
+            control.posicion += len(datos)
+            control.lineas = lineas
+            _filas_confirmadas(control, gestor, resultado, filas)
+
+
+@instrumentar("archivos.importar_csv")
+def importar_csv(
+    gestor,
+    archivo_entrada=None,
+    tamano_lote: int = TAMANO_LOTE,
+    procesos: int = 1,
+    similares: bool = False,
+    reanudable: bool = False,
+) -> ResultadoImportacion:
+    """Importa clientes desde datos/clientes_entrada.csv (o el archivo indicado).
+
+    El archivo se lee en streaming por lotes de `tamano_lote` filas; cada
+    lote se valida y se confirma completo en el gestor, de modo que la
+    memoria usada no depende del tamaño del archivo. Las filas inválidas
+    no abortan la importación: quedan registradas en el resultado con su
+    número de línea y motivo.
+
+    Con `procesos` > 1 el archivo se divide en tramos de bytes alineados a
+    fin de línea que se validan en procesos hijos; el orden de alta y la
+    regla "el primero gana" ante duplicados son los mismos que en modo
+    secuencial. Si un campo con saltos de línea queda partido entre dos
+    tramos, desde ahí se sigue en secuencial.
+
+    `archivo_entrada` también puede ser un archivo de texto ya abierto
+    (p. ej. sys.stdin); en ese caso la lectura es siempre secuencial.
+    Una ruta puede ser un CSV comprimido (gzip, bz2, xz) o un archivo
+    columnar .gicc: el formato se reconoce por sus primeros bytes. Ambos
+    se leen en streaming y de forma secuencial.
+
+    Con `similares=True` además se señalan en el resultado las filas
+    parecidas a otro cliente aunque tengan otro email (ver duplicados.py);
+    se importan igual.
+
+    Con `reanudable=True` se guarda un punto de control con cada lote
+    confirmado (en paralelo, cada tramo se confirma como un lote; en un
+    .gicc, cada bloque); si la importación se corta, volver a llamarla con
+    el mismo archivo continúa desde el último (si el archivo no cambió y el
+    gestor conserva lo importado), con los totales que llevaba. Solo un
+    corte justo entre la confirmación de un lote y su punto de control hace
+    releer ese lote: sus filas ya están en el gestor y se cuentan como
+    duplicados.
+    """
+    flujo = archivo_entrada if hasattr(archivo_entrada, "read") else None
+    if flujo is not None:
+        ruta_csv = Path(getattr(flujo, "name", "-"))
+        formato = "csv"
+        if procesos > 1:
+            raise ArchivoError("La importación en paralelo necesita una ruta de archivo.")
+        if reanudable:
+            raise ArchivoError("La importación reanudable necesita una ruta de archivo.")
+    else:
+        ruta_csv = Path(archivo_entrada) if archivo_entrada else (dir_datos() / "clientes_entrada.csv")
+        if not ruta_csv.exists():
+            raise ArchivoError(f"No existe el archivo de entrada: {ruta_csv}")
+        formato = formato_de_ruta(ruta_csv)
+        if procesos > 1 and formato != "csv":
+            raise ArchivoError("La importación en paralelo necesita un CSV sin comprimir.")
+    if tamano_lote < 1:
+        raise ArchivoError("El tamaño de lote debe ser mayor que cero.")
+    if procesos < 1:
+        raise ArchivoError("La cantidad de procesos debe ser mayor que cero.")
+
+    resultado = ResultadoImportacion(archivo=ruta_csv)
+    inicio = time.perf_counter()
+    try:
+        # Los clientes ya cargados solo se indexan: se comparan las filas nuevas.
+        indice = indice_del_gestor(gestor, comparar=False) if similares else None
+        control = _reanudar_importacion(gestor, ruta_csv, resultado) if reanudable else None
+        if procesos > 1:
+            _importar_en_paralelo(gestor, ruta_csv, tamano_lote, procesos, resultado, indice, control)
+        elif flujo is not None:
+            _importar_secuencial(gestor, flujo, ruta_csv, tamano_lote, resultado, indice)
+        elif formato == "columnar":
+            with open(ruta_csv, mode="rb") as archivo:
+                if control is not None:
+                    archivo.seek(control.posicion)
+                _importar_columnar(gestor, archivo, ruta_csv, tamano_lote, resultado, indice, control)
+        elif control is not None:
+            with abrir_binario(ruta_csv) as archivo:
+                archivo.seek(control.posicion)
+                lineas = _LineasContadas(archivo, control)
+                _importar_secuencial(gestor, lineas, ruta_csv, tamano_lote, resultado, indice, control)
+        elif formato == "csv":
+            with open(ruta_csv, mode="r", newline="", encoding="utf-8") as archivo:
+                _importar_secuencial(gestor, archivo, ruta_csv, tamano_lote, resultado, indice)
+        else:
+            with abrir_binario(ruta_csv) as binario, \
+                    io.TextIOWrapper(binario, encoding="utf-8", newline="") as archivo:
+                _importar_secuencial(gestor, archivo, ruta_csv, tamano_lote, resultado, indice)
+        if control is not None:
+            control.borrar()
+
+    except ArchivoError as exc:
+        logger.error("ERROR importando CSV: %s", exc)
+        raise
     except Exception as exc:
         logger.error("ERROR importando CSV: %s", exc)
         raise ArchivoError(f"No se pudo importar el CSV: {exc}")
+    finally:
+        resultado.segundos = time.perf_counter() - inicio
+        contar("importar.filas_leidas", resultado.filas_leidas)
+        contar("importar.agregados", resultado.agregados)
+        contar("importar.duplicados", resultado.duplicados)
+        contar("importar.rechazados", resultado.total_rechazados)
 
+    logger.info(
+        "IMPORT CSV <- %s (agregados=%s duplicados=%s rechazados=%s filas/s=%.0f)",
+        ruta_csv,
+        resultado.agregados,
+        resultado.duplicados,
+        resultado.total_rechazados,
+        resultado.filas_por_segundo,
+        extra=evento("IMPORT", duracion=resultado.segundos),
+    )
+    return resultado
 
-def generar_reporte(gestor) -> Path:
-    """Genera reportes/resumen.txt con conteos y listado."""
-    ruta_txt = dir_reportes() / "resumen.txt"
 
-    try:
-        with open(ruta_txt, mode="w", encoding="utf-8") as archivo:
-            archivo.write("RESUMEN DE CLIENTES\n")
-            archivo.write("===================\n\n")
+def _escribir_listado(archivo, clientes) -> None:
+    """Escribe el listado en bloques de texto (pocas llamadas a write)."""
+    bloque = []
+    i = 0
+    for i, cliente in enumerate(clientes, start=1):
+        bloque.append(f"\nCliente #{i}\n{cliente.mostrar_info()}\n")
+        if len(bloque) >= CLIENTES_POR_BLOQUE:
+            archivo.write("".join(bloque))
+            bloque.clear()
+    archivo.write("".join(bloque))
+    contar("reporte.clientes_listados", i)
 
-            archivo.write(f"Total de clientes: {len(gestor.clientes)}\n\n")
 
-            if not gestor.clientes:
-                archivo.write("No hay clientes registrados.\n")
-            else:
-                archivo.write("LISTADO\n")
-                archivo.write("-------\n")
-                for i, cliente in enumerate(gestor.clientes, start=1):
-                    archivo.write(f"\nCliente #{i}\n")
-                    archivo.write(cliente.mostrar_info())
-                    archivo.write("\n")
+def _escribir_reporte(archivo, gestor, solo_resumen: bool) -> None:
+    # Total, listado y resumen por tipo de un mismo estado del gestor.
+    with gestor.lectura():
+        _escribir_secciones(archivo, gestor, solo_resumen)
+
+
+def _escribir_secciones(archivo, gestor, solo_resumen: bool) -> None:
+    total = len(gestor)
+    resumen = gestor.contar_por_tipo()
+
+    archivo.write("RESUMEN DE CLIENTES\n===================\n\n")
+    archivo.write(f"Total de clientes: {total}\n\n")
 
-                archivo.write("\n\nRESUMEN POR TIPO\n")
-                archivo.write("----------------\n")
+    if not total:
+        archivo.write("No hay clientes registrados.\n")
+        return
 
-                resumen = gestor.contar_por_tipo()
-                for tipo, cantidad in resumen.items():
-                    archivo.write(f"{tipo}: {cantidad}\n")
+    if not solo_resumen:
+        archivo.write("LISTADO\n-------\n")
+        _escribir_listado(archivo, gestor.clientes)
+        archivo.write("\n\n")
+
+    archivo.write("RESUMEN POR TIPO\n----------------\n")
+    archivo.write("".join(f"{tipo}: {cantidad}\n" for tipo, cantidad in resumen.items()))
+
+
+@instrumentar("archivos.generar_reporte")
+def generar_reporte(gestor, solo_resumen: bool = False, destino=None) -> Path:
+    """Genera reportes/resumen.txt con conteos y listado.
+
+    El listado se arma en una sola pasada; los totales por tipo salen de
+    los contadores que mantiene el gestor, así que con `solo_resumen=True`
+    el reporte no recorre los clientes. `destino` permite escribirlo en
+    otra ruta o en un archivo de texto abierto (p. ej. sys.stdout).
+    """
+    inicio = time.perf_counter()
+    try:
+        if hasattr(destino, "write"):
+            ruta_txt = Path(getattr(destino, "name", "-"))
+            _escribir_reporte(destino, gestor, solo_resumen)
+            destino.flush()
+        else:
+            ruta_txt = Path(destino) if destino else (dir_reportes() / "resumen.txt")
+            with open(ruta_txt, mode="w", encoding="utf-8", buffering=BUFFER_REPORTE) as archivo:
+                _escribir_reporte(archivo, gestor, solo_resumen)
 
-        logger.info("REPORTE generado -> %s", ruta_txt)
+        logger.info(
+            "REPORTE generado -> %s", ruta_txt,
+            extra=evento("REPORTE", duracion=time.perf_counter() - inicio),
+        )
         return ruta_txt
 
     except Exception as exc:
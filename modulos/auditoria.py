@@ -0,0 +1,266 @@
+"""modulos/auditoria.py
+
+Lectura de eventos del log (logs/app.log y sus respaldos app.log.1, .2, ...)
+para responder "qué pasó con este email" o "qué pasó entre estas horas".
+
+- Entiende tanto las líneas JSON (activar_formato_json) como las de texto.
+- Por rango de fechas: búsqueda binaria por posición de byte dentro de
+  cada archivo (las líneas de un archivo están en orden cronológico).
+- Por email: índice email -> posiciones guardado en logs/.indice_auditoria.
+  Los respaldos no cambian, así que se indexan una sola vez; del archivo
+  actual solo se indexa lo agregado desde la última consulta.
+
+Uso por consola (desde la raíz del proyecto):
+
+    python -m modulos.auditoria --email cliente@correo.cl
+    python -m modulos.auditoria --desde "2026-01-21 20:00" --hasta "2026-01-21 21:00"
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from modulos.rutas import ruta_log
+from modulos.validaciones import normalizar_email
+
+
+# "2026-01-21 20:41:24,972 - INFO - ..." y el formato antiguo
+# "2026-01-21 02:04:32 [ERROR] ..."
+_LINEA_TEXTO = re.compile(
+    r"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})(?:,(\d{3}))? (?:- (\w+) -|\[(\w+)\]) (.*)$"
+)
+_EMAIL_TEXTO = re.compile(r"email=(\S+)")
+_TIPO_TEXTO = re.compile(r"tipo=(\S+)")
+
+
+@dataclass
+class EventoAuditoria:
+    """Un evento leído del log."""
+
+    fecha: datetime
+    nivel: str
+    evento: str
+    mensaje: str
+    email: str | None = None
+    tipo: str | None = None
+    duracion_ms: float | None = None
+    archivo: str = ""
+    posicion: int = 0
+
+    def __str__(self) -> str:
+        extra = f" email={self.email}" if self.email else ""
+        return f"{self.fecha:%Y-%m-%d %H:%M:%S} {self.nivel:<7} {self.evento:<10}{extra} | {self.mensaje}"
+
+
+def parsear_linea(linea: str) -> EventoAuditoria | None:
+    """Convierte una línea del log (JSON o texto) en evento; None si no es un evento."""
+    linea = linea.rstrip("\r\n")
+    if linea.startswith("{"):
+        try:
+            datos = json.loads(linea)
+            return EventoAuditoria(
+                fecha=datetime.fromisoformat(datos["fecha"]),
+                nivel=datos.get("nivel", ""),
+                evento=datos.get("evento", ""),
+                mensaje=datos.get("mensaje", ""),
+                email=datos.get("email"),
+                tipo=datos.get("tipo"),
+                duracion_ms=datos.get("duracion_ms"),
+            )
+        except (ValueError, KeyError):
+            return None
+
+    coincidencia = _LINEA_TEXTO.match(linea)
+    if not coincidencia:
+        return None  # p. ej. líneas de un traceback
+    fecha, milis, nivel, nivel_antiguo, mensaje = coincidencia.groups()
+    email = _EMAIL_TEXTO.search(mensaje)
+    tipo = _TIPO_TEXTO.search(mensaje)
+    return EventoAuditoria(
+        fecha=datetime.strptime(fecha, "%Y-%m-%d %H:%M:%S").replace(microsecond=int(milis or 0) * 1000),
+        nivel=nivel or nivel_antiguo,
+        evento=mensaje.split(" ", 1)[0],
+        mensaje=mensaje,
+        email=email.group(1) if email else None,
+        tipo=tipo.group(1) if tipo else None,
+    )
+
+
+class LectorAuditoria:
+    """Consultas sobre app.log y sus respaldos rotados."""
+
+    def __init__(self, ruta: Path | str | None = None):
+        self.ruta = Path(ruta) if ruta else ruta_log("app.log")
+        self.dir_indice = self.ruta.parent / ".indice_auditoria"
+
+    def archivos(self) -> list[Path]:
+        """Archivos de log existentes, del más antiguo al más nuevo."""
+        respaldos = []
+        for ruta in self.ruta.parent.glob(self.ruta.name + ".*"):
+            sufijo = ruta.name[len(self.ruta.name) + 1:]
+            if sufijo.isdigit():
+                respaldos.append((int(sufijo), ruta))
+        ordenados = [ruta for _, ruta in sorted(respaldos, reverse=True)]
+        if self.ruta.exists():
+            ordenados.append(self.ruta)
+        return ordenados
+
+    # -------- Lectura de eventos --------
+    @staticmethod
+    def _eventos_desde(archivo, ruta: Path):
+        """Genera eventos leyendo `archivo` (binario) desde su posición actual."""
+        while True:
+            posicion = archivo.tell()
+            linea = archivo.readline()
+            if not linea:
+                return
+            evento = parsear_linea(linea.decode("utf-8", errors="replace"))
+            if evento is not None:
+                evento.archivo = ruta.name
+                evento.posicion = posicion
+                yield evento
+
+    @staticmethod
+    def _alinear(archivo, posicion: int) -> int:
+        """Lleva el archivo al primer inicio de línea en `posicion` o después."""
+        if posicion == 0:
+            archivo.seek(0)
+        else:
+            archivo.seek(posicion - 1)
+            archivo.readline()
+        return archivo.tell()
+
+    def _primera_posicion(self, archivo, ruta: Path, desde: datetime) -> int:
+        """Búsqueda binaria del primer evento con fecha >= desde."""
+        archivo.seek(0, 2)
+        bajo, alto = 0, archivo.tell()
+        while bajo < alto:
+            medio = (bajo + alto) // 2
+            self._alinear(archivo, medio)
+            evento = next(self._eventos_desde(archivo, ruta), None)
+            if evento is None or evento.fecha >= desde:
+                alto = medio
+            else:
+                bajo = medio + 1
+        return self._alinear(archivo, bajo)
+
+    def por_rango(self, desde: datetime | None = None, hasta: datetime | None = None):
+        """Genera los eventos con desde <= fecha <= hasta, en orden cronológico."""
+        for ruta in self.archivos():
+            with open(ruta, mode="rb") as archivo:
+                if desde is not None:
+                    archivo.seek(self._primera_posicion(archivo, ruta, desde))
+                for evento in self._eventos_desde(archivo, ruta):
+                    if hasta is not None and evento.fecha > hasta:
+                        return
+                    yield evento
+
+    # -------- Índice por email --------
+    @staticmethod
+    def _clave_archivo(ruta: Path) -> str | None:
+        """Identifica un archivo por su primera línea (no cambia al rotarlo)."""
+        with open(ruta, mode="rb") as archivo:
+            primera = archivo.readline(4096)
+        if not primera.endswith(b"\n"):
+            return None
+        return hashlib.sha1(primera).hexdigest()
+
+    def _indice(self, ruta: Path, clave: str) -> dict[str, list[int]]:
+        """Carga el índice del archivo y le agrega lo escrito desde la última vez."""
+        ruta_indice = self.dir_indice / f"{clave}.json"
+        try:
+            indice = json.loads(ruta_indice.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            indice = {"bytes": 0, "emails": {}}
+
+        tamano = ruta.stat().st_size
+        if tamano < indice["bytes"]:
+            indice = {"bytes": 0, "emails": {}}  # el archivo se truncó
+        if tamano == indice["bytes"]:
+            return indice["emails"]
+
+        emails = indice["emails"]
+        with open(ruta, mode="rb") as archivo:
+            archivo.seek(indice["bytes"])
+            while True:
+                posicion = archivo.tell()
+                linea = archivo.readline()
+                if not linea.endswith(b"\n"):
+                    break  # línea incompleta: se indexa en la próxima consulta
+                indice["bytes"] = archivo.tell()
+                evento = parsear_linea(linea.decode("utf-8", errors="replace"))
+                if evento is not None and evento.email:
+                    emails.setdefault(normalizar_email(evento.email), []).append(posicion)
+
+        self.dir_indice.mkdir(parents=True, exist_ok=True)
+        temporal = ruta_indice.with_suffix(".tmp")
+        temporal.write_text(json.dumps(indice), encoding="utf-8")
+        temporal.replace(ruta_indice)
+        return emails
+
+    def _limpiar_indices(self, vigentes: set[str]) -> None:
+        """Borra índices de archivos que ya salieron de la rotación."""
+        if not self.dir_indice.exists():
+            return
+        for ruta_indice in self.dir_indice.glob("*.json"):
+            if ruta_indice.stem not in vigentes:
+                ruta_indice.unlink(missing_ok=True)
+
+    def por_email(self, email: str) -> list[EventoAuditoria]:
+        """Eventos de un email en orden cronológico, leyendo solo sus líneas."""
+        email = normalizar_email(email)
+        eventos, vigentes = [], set()
+        for ruta in self.archivos():
+            clave = self._clave_archivo(ruta)
+            if clave is None:
+                continue
+            vigentes.add(clave)
+            posiciones = self._indice(ruta, clave).get(email, [])
+            if not posiciones:
+                continue
+            with open(ruta, mode="rb") as archivo:
+                for posicion in posiciones:
+                    archivo.seek(posicion)
+                    evento = parsear_linea(archivo.readline().decode("utf-8", errors="replace"))
+                    if evento is not None:
+                        evento.archivo = ruta.name
+                        evento.posicion = posicion
+                        eventos.append(evento)
+        self._limpiar_indices(vigentes)
+        return eventos
+
+
+def _fecha(texto: str) -> datetime:
+    return datetime.fromisoformat(texto)
+
+
+def main(argumentos=None) -> None:
+    parser = argparse.ArgumentParser(description="Consulta de eventos del log de GIC")
+    parser.add_argument("--email", help="Eventos de este email")
+    parser.add_argument("--desde", type=_fecha, help='Fecha inicial, ej: "2026-01-21 20:00"')
+    parser.add_argument("--hasta", type=_fecha, help="Fecha final (inclusive)")
+    parser.add_argument("--log", type=Path, help="Archivo de log (por defecto logs/app.log)")
+    args = parser.parse_args(argumentos)
+
+    lector = LectorAuditoria(args.log)
+    if args.email:
+        eventos = (
+            e for e in lector.por_email(args.email)
+            if (args.desde is None or e.fecha >= args.desde)
+            and (args.hasta is None or e.fecha <= args.hasta)
+        )
+    else:
+        eventos = lector.por_rango(args.desde, args.hasta)
+
+    for evento in eventos:
+        print(evento)
+
+
+if __name__ == "__main__":
+    main()
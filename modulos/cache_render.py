@@ -0,0 +1,182 @@
+"""modulos/cache_render.py
+
+Caché de lo que se arma a partir de los datos de un cliente: el texto de
+mostrar_info() (y por lo tanto str(cliente)) y la fila del CSV que usa
+exportar_csv. Un listado o reporte repetido sobre los mismos clientes
+reutiliza los textos en lugar de volver a armarlos con super() en cada
+subclase.
+
+- Cada cliente guarda lo suyo en sus slots `_info` y `_fila`; los
+  setters de nombre, teléfono y dirección lo descartan (el email no
+  cambia y un cambio de tipo crea otro objeto).
+- El total de la caché no pasa de `max_bytes`: al superarlo se descarta
+  lo del cliente usado hace más tiempo (LRU).
+- El LRU apunta a los clientes con referencias débiles: no los mantiene
+  vivos. Los que un almacén arma para una sola lectura (SQLite,
+  columnar) salen de la caché, y del tope, apenas se liberan.
+- Con la caché llena, solo uno de cada ADMITIR_CADA fallos desplaza a
+  otro cliente. Un listado con más clientes de los que caben (con el
+  tope por defecto, del orden de cien mil) no vacía la caché de golpe ni
+  paga el costo de guardar cada texto para descartarlo enseguida.
+
+    configurar_cache_render(16 * 1024 * 1024)   # 16 MB; 0 la desactiva
+    estado_cache_render()                       # aciertos, fallos, bytes, ...
+"""
+
+from __future__ import annotations
+
+import functools
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+
+
+# Memoria máxima de la caché (textos y filas, aproximada con sys.getsizeof)
+MAX_BYTES_RENDER = 64 * 1024 * 1024
+# Costo fijo de cada cliente en la caché (su entrada en el LRU y la referencia)
+BYTES_POR_ENTRADA = 150
+# Con la caché llena, fallos por cada uno que entra desplazando a otro
+ADMITIR_CADA = 32
+
+
+class _Referencia(weakref.ref):
+    """Referencia débil a un cliente del LRU, con lo que ocupa en la caché."""
+
+    __slots__ = ("clave", "bytes")
+
+
+class CacheRender:
+    """LRU de los clientes con textos guardados, con un tope de memoria global."""
+
+    def __init__(self, max_bytes: int = MAX_BYTES_RENDER):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        # Con varios hilos aciertos y fallos son aproximados (no toman el candado).
+        self.aciertos = 0
+        self.fallos = 0
+        self.descartes = 0
+        # Se llenó al menos una vez (hasta que se vacíe o cambie el tope)
+        self.llena = False
+        # id(cliente) -> _Referencia, del usado hace más tiempo al último
+        self._orden: OrderedDict = OrderedDict()
+        # Reentrante: _liberado() corre en el hilo que suelta al cliente,
+        # que puede ser uno que ya tiene el candado.
+        self._candado = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._orden)
+
+    def usado(self, cliente) -> None:
+        """Acierto: el cliente pasa al final del LRU."""
+        self.aciertos += 1
+        try:
+            self._orden.move_to_end(id(cliente))
+        except KeyError:
+            pass  # otro hilo lo acaba de descartar
+
+    def admitir(self) -> bool:
+        """Fallo: indica si conviene guardar lo que se armó para el cliente."""
+        self.fallos += 1
+        if not self.llena:
+            return self.max_bytes > 0
+        return self.fallos % ADMITIR_CADA == 0
+
+    def guardado(self, cliente, valor) -> None:
+        """Se guardó `valor` en un slot del cliente: se suma al tope."""
+        tamano = sys.getsizeof(valor)
+        clave = id(cliente)
+        with self._candado:
+            referencia = self._orden.get(clave)
+            if referencia is None:
+                tamano += BYTES_POR_ENTRADA
+                referencia = self._orden[clave] = _Referencia(cliente, self._liberado)
+                referencia.clave, referencia.bytes = clave, tamano
+            else:
+                referencia.bytes += tamano
+                self._orden.move_to_end(clave)
+            self.bytes += tamano
+            self._recortar()
+
+    def olvidar(self, cliente) -> None:
+        """Descarta lo guardado para el cliente (sus datos cambiaron)."""
+        with self._candado:
+            cliente._info = cliente._fila = None
+            referencia = self._orden.pop(id(cliente), None)
+            if referencia is not None:
+                self.bytes -= referencia.bytes
+
+    def _liberado(self, referencia: _Referencia) -> None:
+        """El cliente dejó de existir: sale del LRU (su id se puede reutilizar)."""
+        with self._candado:
+            if self._orden.get(referencia.clave) is referencia:
+                del self._orden[referencia.clave]
+                self.bytes -= referencia.bytes
+
+    def vaciar(self) -> None:
+        with self._candado:
+            while self._orden:
+                self._descartar_antiguo()
+            self.aciertos = self.fallos = self.descartes = 0
+            self.llena = False
+
+    def _recortar(self) -> None:
+        while self.bytes > self.max_bytes and self._orden:
+            self._descartar_antiguo()
+            self.descartes += 1
+            self.llena = True
+
+    def _descartar_antiguo(self) -> None:
+        _, referencia = self._orden.popitem(last=False)
+        cliente = referencia()
+        if cliente is not None:
+            cliente._info = cliente._fila = None
+        self.bytes -= referencia.bytes
+
+
+cache_render = CacheRender()
+
+
+def configurar_cache_render(max_bytes: int) -> None:
+    """Cambia el tope de memoria de la caché (0 la desactiva y la vacía)."""
+    with cache_render._candado:
+        cache_render.max_bytes = max_bytes
+        cache_render.llena = False
+        cache_render._recortar()
+
+
+def estado_cache_render() -> dict:
+    """Aciertos, fallos, descartes por el tope, clientes y bytes en la caché."""
+    with cache_render._candado:
+        return {
+            "aciertos": cache_render.aciertos,
+            "fallos": cache_render.fallos,
+            "descartes": cache_render.descartes,
+            "clientes": len(cache_render),
+            "bytes": cache_render.bytes,
+            "max_bytes": cache_render.max_bytes,
+        }
+
+
+def memorizar_info(funcion):
+    """Guarda en la caché el resultado de mostrar_info() de cada cliente.
+
+    Solo se guarda la llamada hecha sobre la implementación de la clase
+    del cliente: la de la clase base, llamada con super() desde una
+    subclase, se arma siempre (es parte del texto de la subclase).
+    """
+    @functools.wraps(funcion)
+    def mostrar_info(self) -> str:
+        if type(self).mostrar_info is not mostrar_info:
+            return funcion(self)
+        info = self._info
+        if info is not None:
+            cache_render.usado(self)
+            return info
+        info = funcion(self)
+        if cache_render.admitir():
+            self._info = info
+            cache_render.guardado(self, info)
+        return info
+
+    return mostrar_info
@@ -8,16 +8,33 @@ Incluye encapsulamiento (atributos privados) y métodos de acceso
 
 from __future__ import annotations
 
+from modulos.cache_render import cache_render, memorizar_info
+
 
 class Cliente:
     """Clase base para cualquier tipo de cliente."""
 
+    # __slots__ evita el __dict__ por instancia (ahorra memoria con muchos
+    # clientes). Los nombres se "manglean" igual que los atributos privados,
+    # así que siguen siendo _Cliente__nombre, etc. Las subclases deben
+    # declarar __slots__ = () para no volver a crear el __dict__.
+    # _info y _fila guardan los textos ya armados (ver cache_render.py), que
+    # apunta a cada cliente con una referencia débil (__weakref__).
+    __slots__ = ("__nombre", "__email", "__telefono", "__direccion", "_info", "_fila", "__weakref__")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Las subclases redefinen mostrar_info(): también se guarda en la caché.
+        if "mostrar_info" in cls.__dict__:
+            cls.mostrar_info = memorizar_info(cls.__dict__["mostrar_info"])
+
     def __init__(self, nombre: str, email: str, telefono: str, direccion: str):
         # Encapsulamiento: atributos privados.
         self.__nombre = (nombre or "").strip()
         self.__email = (email or "").strip()
         self.__telefono = (telefono or "").strip()
         self.__direccion = (direccion or "").strip()
+        self._info = self._fila = None
 
     # ---- Properties (getters/setters) ----
     @property
@@ -27,6 +44,7 @@ class Cliente:
     @nombre.setter
     def nombre(self, valor: str) -> None:
         self.__nombre = (valor or "").strip()
+        self._olvidar_render()
 
     @property
     def email(self) -> str:
@@ -41,6 +59,7 @@ class Cliente:
     @telefono.setter
     def telefono(self, valor: str) -> None:
         self.__telefono = (valor or "").strip()
+        self._olvidar_render()
 
     @property
     def direccion(self) -> str:
@@ -49,12 +68,18 @@ class Cliente:
     @direccion.setter
     def direccion(self, valor: str) -> None:
         self.__direccion = (valor or "").strip()
+        self._olvidar_render()
+
+    def _olvidar_render(self) -> None:
+        if self._info is not None or self._fila is not None:
+            cache_render.olvidar(self)
 
     # ---- Métodos comunes ----
     def tipo(self) -> str:
         """Retorna un nombre de tipo humano para el cliente."""
         return "Base"
 
+    @memorizar_info
     def mostrar_info(self) -> str:
         """Devuelve información del cliente.
 
@@ -68,6 +93,18 @@ class Cliente:
             f"Tipo: {self.tipo()}"
         )
 
+    def fila(self) -> tuple:
+        """(nombre, email, telefono, direccion, tipo), como en el CSV exportado."""
+        fila = self._fila
+        if fila is not None:
+            cache_render.usado(self)
+            return fila
+        fila = (self.__nombre, self.__email, self.__telefono, self.__direccion, self.tipo())
+        if cache_render.admitir():
+            self._fila = fila
+            cache_render.guardado(self, fila)
+        return fila
+
     def __str__(self) -> str:
         """Permite imprimir el cliente directamente."""
-        return self.mostrar_info()
\ No newline at end of file
+        return self.mostrar_info()
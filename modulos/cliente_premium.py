@@ -10,6 +10,8 @@ from modulos.cliente import Cliente
 
 
 class ClientePremium(Cliente):
+    __slots__ = ()
+
     # Retorna el nombre del tipo para mostrarlo en listados y reportes
     def tipo(self) -> str:
         return "Premium"
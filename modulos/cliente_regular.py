@@ -12,6 +12,8 @@ from modulos.cliente import Cliente
 
 
 class ClienteRegular(Cliente):
+    __slots__ = ()
+
     def tipo(self) -> str:
         return "Regular"
 
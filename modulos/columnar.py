@@ -0,0 +1,423 @@
+"""modulos/columnar.py
+
+AlmacenColumnar: los clientes en memoria guardados por columnas en lugar
+de un objeto Cliente por cliente, pensado para análisis sobre millones
+de clientes (cuántos hay por tipo, por comuna o por prefijo telefónico,
+con filtros).
+
+- tipo: un array de bytes con el código de cada tipo (tipos_cliente);
+- nombre, email, teléfono y dirección: listas de textos internados (un
+  mismo texto repetido en muchos clientes se guarda una sola vez);
+- comuna y prefijo telefónico: arrays de enteros que apuntan a un
+  diccionario de valores distintos, calculados al insertar;
+- vivos: un byte por fila (0 = eliminada); las filas eliminadas se
+  compactan cuando superan la mitad;
+- secuencias: el número de alta de cada fila (crece y no cambia al
+  compactar), que es el cursor de recorrer().
+
+agrupar() y seleccionar() resuelven filtros y conteos sobre esas
+columnas: con NumPy instalado, de forma vectorizada (bincount sobre los
+códigos); si no, con Counter e itertools.compress sobre los arrays. Las
+operaciones de siempre (buscar_por_email, listar_clientes, consultar,
+exportar...) siguen funcionando: cada Cliente se arma desde su fila al
+pedirlo, como en AlmacenSQLite, así que modificar uno con sus setters no
+lo persiste.
+
+    gestor = GestorClientes(AlmacenColumnar())
+    importar_csv(gestor, "grande.csv")
+    gestor.agrupar("comuna", tipo="premium")      # {"La Cisterna": 120, ...}
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from itertools import compress, islice
+
+from modulos.almacenes import ConteoPorTipo, guardar_con_deshacer
+from modulos.consultas import (
+    DIGITOS_PREFIJO,
+    SIN_COMUNA,
+    FiltroClientes,
+    IndicesSecundarios,
+    PaginaConsulta,
+    comuna_de,
+    normalizar_prefijo_telefono,
+    normalizar_texto,
+    prefijo_de,
+    validar_agrupacion,
+)
+from modulos.excepciones import ClienteExistenteError, ClienteNoEncontradoError
+from modulos.tipos_cliente import clase_tipo, codigo_tipo, tipo_por_codigo
+from modulos.validaciones import normalizar_email
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él se usan array y Counter
+    np = None
+
+
+# Filas eliminadas a partir de las cuales se considera compactar
+MIN_COMPACTAR = 1024
+
+
+class _Diccionario:
+    """Valores distintos de una columna codificada y su código (posición)."""
+
+    def __init__(self, normalizar=None):
+        self.valores: list[str] = []
+        self._codigos: dict[str, int] = {}
+        self._normalizar = normalizar
+
+    def codigo(self, valor: str) -> int:
+        clave = self._normalizar(valor) if self._normalizar else valor
+        codigo = self._codigos.get(clave)
+        if codigo is None:
+            codigo = self._codigos[clave] = len(self.valores)
+            self.valores.append(sys.intern(valor))
+        return codigo
+
+    def buscar(self, valor: str) -> int | None:
+        clave = self._normalizar(valor) if self._normalizar else valor
+        return self._codigos.get(clave)
+
+
+def _comuna_normalizada(comuna: str) -> str:
+    return normalizar_texto(comuna).strip()
+
+
+class AlmacenColumnar:
+    """Clientes en columnas (arrays y listas de textos) con agregados por columna."""
+
+    def __init__(self):
+        self._codigos = array("B")
+        self._nombres: list[str] = []
+        self._emails: list[str] = []
+        self._telefonos: list[str] = []
+        self._direcciones: list[str] = []
+        self._comunas = array("I")
+        self._prefijos = array("I")
+        self._vivos = bytearray()
+        self._secuencias = array("Q")
+        self._ultima_secuencia = 0
+        self._eliminadas = 0
+        self._diccionario_comunas = _Diccionario(_comuna_normalizada)
+        self._diccionario_prefijos = _Diccionario()
+        self._filas: dict[str, int] = {}  # email normalizado -> fila
+        self._conteo = ConteoPorTipo()
+        self._clases: dict[int, type] = {}
+        self._indices = None
+
+    # -------- Filas y vistas --------
+    def _clase(self, codigo: int) -> type:
+        clase = self._clases.get(codigo)
+        if clase is None:
+            clase = self._clases[codigo] = clase_tipo(tipo_por_codigo(codigo))
+        return clase
+
+    def _vista(self, fila: int):
+        """Cliente armado desde la fila (un objeto nuevo en cada lectura)."""
+        return self._clase(self._codigos[fila])(
+            self._nombres[fila], self._emails[fila], self._telefonos[fila], self._direcciones[fila]
+        )
+
+    def _valores(self, cliente) -> tuple:
+        """(código de tipo, nombre, teléfono, dirección, comuna, prefijo) de la fila."""
+        direccion = sys.intern(cliente.direccion)
+        return (
+            codigo_tipo(cliente.tipo()),
+            sys.intern(cliente.nombre),
+            sys.intern(cliente.telefono),
+            direccion,
+            self._diccionario_comunas.codigo(comuna_de(direccion)),
+            self._diccionario_prefijos.codigo(prefijo_de(cliente.telefono)),
+        )
+
+    def _escribir_fila(self, fila: int, valores: tuple) -> None:
+        (
+            self._codigos[fila],
+            self._nombres[fila],
+            self._telefonos[fila],
+            self._direcciones[fila],
+            self._comunas[fila],
+            self._prefijos[fila],
+        ) = valores
+
+    def _agregar_fila(self, clave: str, cliente) -> None:
+        codigo, nombre, telefono, direccion, comuna, prefijo = self._valores(cliente)
+        self._filas[clave] = len(self._vivos)
+        self._codigos.append(codigo)
+        self._nombres.append(nombre)
+        # El email normalizado suele ser el mismo texto: se guarda una vez.
+        self._emails.append(clave if clave == cliente.email else cliente.email)
+        self._telefonos.append(telefono)
+        self._direcciones.append(direccion)
+        self._comunas.append(comuna)
+        self._prefijos.append(prefijo)
+        self._vivos.append(1)
+        self._ultima_secuencia += 1
+        self._secuencias.append(self._ultima_secuencia)
+
+    def _filas_vivas(self, desde: int = 0):
+        """Números de fila no eliminadas desde `desde`, en orden de alta."""
+        if not self._eliminadas:
+            return iter(range(desde, len(self._vivos)))
+        return compress(range(desde, len(self._vivos)), islice(self._vivos, desde, None))
+
+    def _compactar(self) -> None:
+        """Quita las filas eliminadas (los números de fila cambian; las secuencias no)."""
+        vivos = bytes(self._vivos)
+        self._codigos = array("B", compress(self._codigos, vivos))
+        self._nombres = list(compress(self._nombres, vivos))
+        self._emails = list(compress(self._emails, vivos))
+        self._telefonos = list(compress(self._telefonos, vivos))
+        self._direcciones = list(compress(self._direcciones, vivos))
+        self._comunas = array("I", compress(self._comunas, vivos))
+        self._prefijos = array("I", compress(self._prefijos, vivos))
+        self._secuencias = array("Q", compress(self._secuencias, vivos))
+        self._vivos = bytearray(b"\x01") * len(self._emails)
+        self._eliminadas = 0
+        self._filas = {normalizar_email(email): fila for fila, email in enumerate(self._emails)}
+
+    def _indices_secundarios(self) -> IndicesSecundarios:
+        if self._indices is None:
+            indices = IndicesSecundarios()
+            for fila in self._filas_vivas():
+                indices.agregar(normalizar_email(self._emails[fila]), self._vista(fila))
+            self._indices = indices
+        return self._indices
+
+    # -------- Interfaz del almacén --------
+    def __len__(self) -> int:
+        return len(self._filas)
+
+    def __iter__(self):
+        return map(self._vista, self._filas_vivas())
+
+    def recorrer(self, posicion: int = 0, tipo: str | None = None):
+        """Genera (secuencia, cliente) con secuencia de alta mayor que `posicion`.
+
+        La fila de partida se busca con bisect sobre las secuencias, que no
+        cambian al compactar. Con `tipo`, array.index salta en C las filas
+        de otros tipos.
+        """
+        codigo = None
+        if tipo is not None:
+            try:
+                codigo = codigo_tipo(tipo)
+            except KeyError:
+                return  # tipo no registrado: no hay clientes de ese tipo
+        codigos, vivos, secuencias = self._codigos, self._vivos, self._secuencias
+        fila = bisect_right(secuencias, posicion)
+        while fila < len(vivos):
+            if codigo is not None:
+                try:
+                    fila = codigos.index(codigo, fila)
+                except ValueError:
+                    return
+            if vivos[fila]:
+                yield secuencias[fila], self._vista(fila)
+            fila += 1
+
+    def obtener(self, clave: str):
+        fila = self._filas.get(clave)
+        return self._vista(fila) if fila is not None else None
+
+    def obtener_lote(self, claves) -> dict:
+        filas = self._filas
+        return {clave: self._vista(filas[clave]) for clave in claves if clave in filas}
+
+    def existentes(self, claves) -> set[str]:
+        return {clave for clave in claves if clave in self._filas}
+
+    def insertar(self, cliente) -> None:
+        clave = normalizar_email(cliente.email)
+        if clave in self._filas:
+            raise ClienteExistenteError(f"Ya existe un cliente con email: {cliente.email}")
+        self._agregar_fila(clave, cliente)
+        self._conteo.sumar(cliente.tipo())
+        if self._indices is not None:
+            self._indices.agregar(clave, cliente)
+
+    def insertar_lote(self, clientes) -> None:
+        """Inserta un lote completo o ninguno (deshace lo insertado si falla)."""
+        insertados = []
+        try:
+            for cliente in clientes:
+                self.insertar(cliente)
+                insertados.append(normalizar_email(cliente.email))
+        except BaseException:
+            for clave in insertados:
+                self.quitar(clave)
+            raise
+
+    def reemplazar(self, cliente) -> None:
+        """Sobrescribe la fila del cliente con el mismo email (conserva su posición)."""
+        clave = normalizar_email(cliente.email)
+        fila = self._filas.get(clave)
+        if fila is None:
+            raise ClienteNoEncontradoError("Cliente no encontrado.")
+        anterior = self._vista(fila)
+        self._escribir_fila(fila, self._valores(cliente))
+        self._conteo.cambiar(anterior.tipo(), cliente.tipo())
+        if self._indices is not None:
+            self._indices.reemplazar(clave, anterior, cliente)
+
+    def reemplazar_lote(self, clientes) -> None:
+        """Reemplaza todos los clientes del lote o ninguno (si falta alguno)."""
+        clientes = list(clientes)
+        for cliente in clientes:
+            if normalizar_email(cliente.email) not in self._filas:
+                raise ClienteNoEncontradoError(f"Cliente no encontrado: {cliente.email}")
+        for cliente in clientes:
+            self.reemplazar(cliente)
+
+    def guardar_lote(self, reemplazos, altas) -> None:
+        """Reemplaza `reemplazos` e inserta `altas`: todo o nada."""
+        guardar_con_deshacer(self, reemplazos, altas)
+
+    def quitar(self, clave: str):
+        fila = self._filas.pop(clave, None)
+        if fila is None:
+            return None
+        cliente = self._vista(fila)
+        self._vivos[fila] = 0
+        self._eliminadas += 1
+        self._conteo.sumar(cliente.tipo(), -1)
+        if self._indices is not None:
+            self._indices.quitar(clave, cliente)
+        if self._eliminadas >= MIN_COMPACTAR and self._eliminadas > len(self._filas):
+            self._compactar()
+        return cliente
+
+    def quitar_lote(self, claves) -> dict:
+        """Quita las claves registradas y retorna {clave: cliente quitado}."""
+        quitados = {}
+        for clave in claves:
+            cliente = self.quitar(clave)
+            if cliente is not None:
+                quitados[clave] = cliente
+        return quitados
+
+    def contar_por_tipo(self) -> dict[str, int]:
+        return self._conteo.copia()
+
+    def consultar(self, filtro: FiltroClientes, pagina: int, por_pagina: int) -> PaginaConsulta:
+        desde = (pagina - 1) * por_pagina
+        if filtro.vacio():
+            filas = list(islice(self._filas_vivas(), desde, desde + por_pagina))
+            return PaginaConsulta([self._vista(f) for f in filas], len(self._filas), pagina, por_pagina)
+        claves = self._indices_secundarios().buscar(filtro)
+        clientes = [self._vista(self._filas[clave]) for clave in claves[desde:desde + por_pagina]]
+        return PaginaConsulta(clientes, len(claves), pagina, por_pagina)
+
+    def filas(self):
+        """Genera (nombre, email, telefono, direccion, tipo) sin crear objetos Cliente."""
+        tipos = {}
+        codigos, nombres, emails = self._codigos, self._nombres, self._emails
+        telefonos, direcciones = self._telefonos, self._direcciones
+        for fila in self._filas_vivas():
+            codigo = codigos[fila]
+            tipo = tipos.get(codigo)
+            if tipo is None:
+                tipo = tipos[codigo] = tipo_por_codigo(codigo)
+            yield nombres[fila], emails[fila], telefonos[fila], direcciones[fila], tipo
+
+    def cerrar(self) -> None:
+        """Nada que liberar en memoria (se mantiene por simetría)."""
+
+    # -------- Agregados por columna --------
+    def _condiciones(self, tipo, comuna, prefijo_telefono) -> list[tuple[array, set[int]]] | None:
+        """[(columna, códigos admitidos)] de los filtros; None si ninguna fila puede cumplirlos."""
+        if prefijo_telefono:
+            # Se valida antes de descartar por otro filtro, como condicion_agrupacion.
+            prefijo_telefono = normalizar_prefijo_telefono(prefijo_telefono)
+        condiciones = []
+        if tipo:
+            try:
+                condiciones.append((self._codigos, {codigo_tipo(tipo)}))
+            except KeyError:
+                return None
+        if comuna is not None:
+            codigo = self._diccionario_comunas.buscar(comuna)
+            if codigo is None:
+                return None
+            condiciones.append((self._comunas, {codigo}))
+        if prefijo_telefono:
+            codigos = {
+                codigo for codigo, valor in enumerate(self._diccionario_prefijos.valores)
+                if valor.startswith(prefijo_telefono)
+            }
+            if not codigos:
+                return None
+            condiciones.append((self._prefijos, codigos))
+        return condiciones
+
+    def _columna_agrupada(self, campo: str, digitos: int):
+        """Columna de códigos del campo y el valor que muestra cada código."""
+        if campo == "tipo":
+            return self._codigos, tipo_por_codigo
+        if campo == "comuna":
+            valores = self._diccionario_comunas.valores
+            return self._comunas, lambda codigo: valores[codigo] or SIN_COMUNA
+        valores = self._diccionario_prefijos.valores
+        return self._prefijos, lambda codigo: valores[codigo][:digitos]
+
+    def _mascara(self, condiciones):
+        """Vector booleano de NumPy: filas vivas que cumplen las condiciones."""
+        mascara = np.frombuffer(self._vivos, dtype=np.uint8).astype(bool)
+        for columna, codigos in condiciones:
+            # Vista sin copia sobre el array (solo mientras dura la consulta).
+            valores = np.frombuffer(columna, dtype=columna.typecode)
+            mascara &= np.isin(valores, list(codigos))
+        return mascara
+
+    def _contar_codigos(self, columna: array, condiciones) -> Counter:
+        """Cantidad de filas vivas por código de `columna` que cumplen las condiciones."""
+        if np is not None:
+            agrupados = np.frombuffer(columna, dtype=columna.typecode)[self._mascara(condiciones)]
+            cantidades = np.bincount(agrupados) if len(agrupados) else ()
+            return Counter({codigo: int(n) for codigo, n in enumerate(cantidades) if n})
+
+        if not condiciones:
+            return Counter(compress(columna, self._vivos) if self._eliminadas else columna)
+        filas = self._filas_vivas()
+        for columna_filtro, codigos in condiciones:
+            filas = [fila for fila in filas if columna_filtro[fila] in codigos]
+        return Counter(columna[fila] for fila in filas)
+
+    def agrupar(
+        self,
+        campo: str,
+        tipo: str | None = None,
+        comuna: str | None = None,
+        prefijo_telefono: str | None = None,
+        digitos: int = DIGITOS_PREFIJO,
+    ) -> dict[str, int]:
+        """Clientes por tipo, comuna o prefijo telefónico (ver consultas.agrupar_filas)."""
+        validar_agrupacion(campo, digitos)
+        condiciones = self._condiciones(tipo, comuna, prefijo_telefono)
+        if condiciones is None:
+            return {}
+        columna, mostrar = self._columna_agrupada(campo, digitos)
+        conteo = Counter()
+        for codigo, cantidad in self._contar_codigos(columna, condiciones).items():
+            conteo[mostrar(codigo)] += cantidad
+        return dict(conteo.most_common())
+
+    def seleccionar(
+        self, tipo: str | None = None, comuna: str | None = None, prefijo_telefono: str | None = None
+    ) -> list:
+        """Clientes que cumplen los filtros, en orden de alta."""
+        condiciones = self._condiciones(tipo, comuna, prefijo_telefono)
+        if condiciones is None:
+            return []
+        if np is not None:
+            filas = np.flatnonzero(self._mascara(condiciones)).tolist()
+        else:
+            filas = self._filas_vivas()
+            for columna, codigos in condiciones:
+                filas = [fila for fila in filas if columna[fila] in codigos]
+        return [self._vista(fila) for fila in filas]
@@ -0,0 +1,245 @@
+"""modulos/concurrencia.py
+
+Acceso desde varios hilos a un mismo gestor de clientes.
+
+GestorConcurrente es un GestorClientes cuyas operaciones toman un
+candado de lectura/escritura: las consultas (buscar_por_email,
+consultar, contar_por_tipo, ...) corren en paralelo entre sí y cada
+escritura (alta, baja, cambio de tipo, lote de importación) se aplica
+completa sin lectores a la mitad. Un lector nunca ve una edición a
+medias: ve al cliente anterior o al nuevo objeto ya armado.
+
+    gestor = GestorConcurrente()
+    hilo = threading.Thread(target=importar_csv, args=(gestor, "grande.csv"))
+    hilo.start()
+    gestor.buscar_por_email("cliente@correo.cl")   # sirve mientras importa
+
+Para recorrer todos los clientes (gestor.clientes) sin que cambien en el
+medio, hacerlo dentro de `with gestor.lectura():` (exportar_csv y
+generar_reporte ya lo hacen). El GestorClientes común no toma candados:
+lectura() y escritura() no hacen nada y no agregan costo.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+
+from modulos.gestor_clientes import GestorClientes
+
+
+class CandadoLecturaEscritura:
+    """Varios lectores a la vez o un único escritor.
+
+    Da preferencia a los escritores: si uno espera, los lectores nuevos
+    esperan también (una importación no queda postergada por consultas
+    continuas); pero un lector que ya esperaba entra apenas termina la
+    escritura en curso, aunque haya más escritores en fila. Los
+    escritores pasan por orden de llegada, así un hilo que escribe en un
+    ciclo no retoma el candado antes que el que ya esperaba (por ejemplo,
+    altas sueltas frente a los lotes de una importación).
+
+    Es reentrante por hilo: quien escribe puede volver a tomar escritura
+    o lectura, y quien lee puede volver a leer. Pasar de lectura a
+    escritura no se permite (dos hilos que lo intentaran a la vez se
+    bloquearían mutuamente). Usar con `with candado.lectura():` o
+    `with candado.escritura():`.
+    """
+
+    def __init__(self):
+        # El mutex se toma directo en los caminos rápidos (más barato que
+        # entrar a la Condition, que es código Python); es el mismo candado.
+        self._mutex = threading.Lock()
+        self._condicion = threading.Condition(self._mutex)
+        self._lectores = 0  # hilos con lectura tomada
+        self._escribiendo = False
+        self._escritores_esperando = 0
+        # Turnos de escritura: número entregado y número atendido.
+        self._turnos_entregados = 0
+        self._turno_actual = 0
+        self._turnos_abandonados = set()  # esperas interrumpidas
+        self._escrituras_terminadas = 0
+        self._hilos = threading.local()
+        self._lectura = _Tomar(self.adquirir_lectura, self.liberar_lectura)
+        self._escritura = _Tomar(self.adquirir_escritura, self.liberar_escritura)
+
+    def _estado(self) -> list[int]:
+        """[lecturas, escrituras] tomadas por el hilo actual."""
+        try:
+            return self._hilos.estado
+        except AttributeError:
+            estado = self._hilos.estado = [0, 0]
+            return estado
+
+    def lectura(self):
+        return self._lectura
+
+    def escritura(self):
+        return self._escritura
+
+    def adquirir_lectura(self) -> None:
+        estado = self._estado()
+        if estado[0] or estado[1]:
+            # Anidada dentro de una lectura o escritura propia: no espera.
+            estado[0] += 1
+            return
+        with self._mutex:
+            llegada = self._escrituras_terminadas
+            while self._escribiendo or (
+                self._escritores_esperando and llegada == self._escrituras_terminadas
+            ):
+                self._condicion.wait()
+            self._lectores += 1
+        estado[0] = 1
+
+    def liberar_lectura(self) -> None:
+        estado = self._estado()
+        estado[0] -= 1
+        if estado[0] or estado[1]:
+            return
+        with self._mutex:
+            self._lectores -= 1
+            # Solo un escritor espera a que no queden lectores.
+            if not self._lectores and self._escritores_esperando:
+                self._condicion.notify_all()
+
+    def adquirir_escritura(self) -> None:
+        estado = self._estado()
+        if estado[1]:
+            estado[1] += 1
+            return
+        if estado[0]:
+            raise RuntimeError("No se puede pasar de lectura a escritura con el mismo candado.")
+        with self._condicion:
+            turno = self._turnos_entregados
+            self._turnos_entregados += 1
+            self._escritores_esperando += 1
+            try:
+                while self._escribiendo or self._lectores or turno != self._turno_actual:
+                    self._condicion.wait()
+            except BaseException:
+                # Interrumpido (p. ej. Ctrl+C): ceder el turno para no trabar a los demás.
+                self._turnos_abandonados.add(turno)
+                self._avanzar_turno()
+                raise
+            finally:
+                self._escritores_esperando -= 1
+            self._escribiendo = True
+        estado[1] = 1
+
+    def liberar_escritura(self) -> None:
+        estado = self._estado()
+        estado[1] -= 1
+        if estado[1]:
+            return
+        with self._condicion:
+            self._escribiendo = False
+            self._escrituras_terminadas += 1
+            self._turno_actual += 1
+            self._avanzar_turno()
+
+    def _avanzar_turno(self) -> None:
+        """Salta los turnos abandonados y despierta a quienes esperan."""
+        while self._turno_actual in self._turnos_abandonados:
+            self._turnos_abandonados.discard(self._turno_actual)
+            self._turno_actual += 1
+        self._condicion.notify_all()
+
+
+class _Tomar:
+    """Contexto reutilizable (sin estado propio) para `with candado.lectura():`."""
+
+    __slots__ = ("_adquirir", "_liberar")
+
+    def __init__(self, adquirir, liberar):
+        self._adquirir = adquirir
+        self._liberar = liberar
+
+    def __enter__(self) -> None:
+        self._adquirir()
+
+    def __exit__(self, *exc) -> None:
+        self._liberar()
+
+
+# -------- Gestor --------
+def _leyendo(nombre: str):
+    """Método de GestorClientes ejecutado con el candado de lectura."""
+    @functools.wraps(getattr(GestorClientes, nombre))
+    def envoltura(self, *args, **kwargs):
+        candado = self._candado
+        candado.adquirir_lectura()
+        try:
+            # Se busca al llamar: respeta los métodos medidos de metricas.py.
+            return getattr(GestorClientes, nombre)(self, *args, **kwargs)
+        finally:
+            candado.liberar_lectura()
+
+    return envoltura
+
+
+def _escribiendo(nombre: str):
+    """Método de GestorClientes ejecutado con el candado de escritura."""
+    @functools.wraps(getattr(GestorClientes, nombre))
+    def envoltura(self, *args, **kwargs):
+        candado = self._candado
+        candado.adquirir_escritura()
+        try:
+            return getattr(GestorClientes, nombre)(self, *args, **kwargs)
+        finally:
+            candado.liberar_escritura()
+
+    return envoltura
+
+
+class GestorConcurrente(GestorClientes):
+    """GestorClientes que admite lectores y escritores en varios hilos.
+
+    Cada operación pública (y cada primitiva que usan archivos.py y las
+    operaciones masivas) corre bajo el candado; las operaciones compuestas,
+    como agregar_cliente (verificar + insertar) o cambiar_tipo (buscar +
+    reemplazar), son atómicas porque el candado es reentrante.
+    """
+
+    def __init__(self, almacen=None):
+        super().__init__(almacen)
+        self._candado = CandadoLecturaEscritura()
+
+    def lectura(self):
+        return self._candado.lectura()
+
+    def escritura(self):
+        return self._candado.escritura()
+
+    # Consultas: en paralelo entre sí
+    __len__ = _leyendo("__len__")
+    buscar_por_email = _leyendo("buscar_por_email")
+    buscar_varios = _leyendo("buscar_varios")
+    existe_email = _leyendo("existe_email")
+    emails_existentes = _leyendo("emails_existentes")
+    hay_cambios = _leyendo("hay_cambios")
+    generacion_exportada = _leyendo("generacion_exportada")
+    consultar = _leyendo("consultar")
+    paginar_clientes = _leyendo("paginar_clientes")
+    contar_por_tipo = _leyendo("contar_por_tipo")
+    agrupar = _leyendo("agrupar")
+    seleccionar = _leyendo("seleccionar")
+
+    # Cambios: de a uno y sin lectores
+    cerrar = _escribiendo("cerrar")
+    tomar_cambios = _escribiendo("tomar_cambios")
+    restaurar_cambios = _escribiendo("restaurar_cambios")
+    # exportar_csv lo llama bajo lectura: con el candado tomado nadie más
+    # puede marcar cambios, y solo reemplaza el diccionario de pendientes.
+    descartar_cambios = _leyendo("descartar_cambios")
+    _insertar = _escribiendo("_insertar")
+    _insertar_lote = _escribiendo("_insertar_lote")
+    _reemplazar = _escribiendo("_reemplazar")
+    _quitar = _escribiendo("_quitar")
+    agregar_cliente = _escribiendo("agregar_cliente")
+    eliminar_por_email = _escribiendo("eliminar_por_email")
+    cambiar_tipo = _escribiendo("cambiar_tipo")
+    actualizar_cliente = _escribiendo("actualizar_cliente")
+    eliminar_varios = _escribiendo("eliminar_varios")
+    cambiar_tipo_varios = _escribiendo("cambiar_tipo_varios")
+    guardar_varios = _escribiendo("guardar_varios")
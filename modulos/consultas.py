@@ -0,0 +1,339 @@
+"""modulos/consultas.py
+
+Consultas sobre los clientes más allá de la búsqueda por email.
+
+- FiltroClientes: filtros combinables (tipo, teléfono, texto y prefijo).
+- IndicesSecundarios: índices que mantiene AlmacenMemoria en cada
+  alta/edición/baja (por tipo, teléfono normalizado y palabras de
+  nombre/dirección), para no recorrer todos los clientes.
+- PaginaConsulta: una página de resultados y el total encontrado.
+- PaginaListado / CursorListado: listado paginado por cursor, que no
+  necesita contar ni recorrer a todos los clientes.
+- comuna_de / prefijo_de / agrupar_filas: agregados para análisis
+  (clientes por tipo, comuna o prefijo telefónico) sobre las filas de
+  cualquier almacén; AlmacenColumnar los resuelve sobre sus columnas.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass
+
+from modulos.excepciones import ValidacionError
+from modulos.tipos_cliente import nombre_tipo
+from modulos.validaciones import normalizar_telefono
+
+
+_SEPARADORES = re.compile(r"[^0-9a-z]+")
+
+# Campos por los que se puede agrupar
+CAMPOS_AGRUPACION = ("tipo", "comuna", "prefijo_telefono")
+# Dígitos del número nacional que forman el prefijo telefónico
+DIGITOS_PREFIJO = 3
+CODIGO_PAIS = "56"
+SIN_COMUNA = "(sin comuna)"
+
+
+def normalizar_texto(texto: str) -> str:
+    """Minúsculas y sin tildes ("Peñalolén" -> "penalolen")."""
+    texto = (texto or "").lower()
+    if texto.isascii():
+        return texto
+    texto = unicodedata.normalize("NFKD", texto)
+    return "".join(c for c in texto if not unicodedata.combining(c))
+
+
+def tokenizar(*textos: str) -> set[str]:
+    """Palabras normalizadas de uno o más textos."""
+    tokens = set()
+    for texto in textos:
+        tokens.update(t for t in _SEPARADORES.split(normalizar_texto(texto)) if t)
+    return tokens
+
+
+def tokens_cliente(cliente) -> set[str]:
+    """Palabras por las que se puede encontrar a un cliente."""
+    return tokenizar(cliente.nombre, cliente.direccion)
+
+
+def comuna_de(direccion: str) -> str:
+    """Lo que sigue a la última coma de la dirección ("Los Nogales 9456, La Cisterna")."""
+    _, coma, comuna = (direccion or "").rpartition(",")
+    return comuna.strip() if coma else ""
+
+
+def prefijo_de(telefono: str, digitos: int = DIGITOS_PREFIJO) -> str:
+    """Primeros dígitos del número nacional ("+56 9 1234 5678" -> "912")."""
+    numero = normalizar_telefono(telefono)
+    if len(numero) > 9 and numero.startswith(CODIGO_PAIS):
+        numero = numero[len(CODIGO_PAIS):]
+    return numero[:digitos]
+
+
+def normalizar_prefijo_telefono(prefijo: str) -> str:
+    """Prefijo a filtrar, comparable con prefijo_de ("+56 9 2" -> "92").
+
+    Solo dígitos y sin el código de país; debe quedar entre 1 y
+    DIGITOS_PREFIJO dígitos, porque se compara contra prefijo_de().
+    """
+    numero = normalizar_telefono(prefijo)
+    if numero.startswith(CODIGO_PAIS):
+        numero = numero[len(CODIGO_PAIS):]
+    if not 0 < len(numero) <= DIGITOS_PREFIJO:
+        raise ValidacionError(
+            f"El prefijo telefónico a filtrar debe tener entre 1 y {DIGITOS_PREFIJO} dígitos (sin +56)."
+        )
+    return numero
+
+
+def validar_agrupacion(campo: str, digitos: int) -> None:
+    if campo not in CAMPOS_AGRUPACION:
+        raise ValidacionError(f"No se puede agrupar por {campo!r}. Use: {' / '.join(CAMPOS_AGRUPACION)}")
+    if not 0 < digitos <= DIGITOS_PREFIJO:
+        raise ValidacionError(f"El prefijo telefónico debe tener entre 1 y {DIGITOS_PREFIJO} dígitos.")
+
+
+def condicion_agrupacion(
+    tipo: str | None = None, comuna: str | None = None, prefijo_telefono: str | None = None
+):
+    """Función (telefono, direccion, tipo) -> bool con los filtros de agrupar.
+
+    Los filtros se combinan: `tipo` (cualquier alias), `comuna` (sin
+    importar mayúsculas ni tildes) y `prefijo_telefono` (el número
+    nacional empieza así; ver normalizar_prefijo_telefono).
+    """
+    tipo = nombre_tipo(tipo) if tipo else None
+    prefijo_telefono = normalizar_prefijo_telefono(prefijo_telefono) if prefijo_telefono else None
+    comuna = normalizar_texto(comuna).strip() if comuna is not None else None
+
+    def cumple(telefono: str, direccion: str, tipo_fila: str) -> bool:
+        if tipo is not None and tipo_fila != tipo:
+            return False
+        if prefijo_telefono and not prefijo_de(telefono).startswith(prefijo_telefono):
+            return False
+        return comuna is None or normalizar_texto(comuna_de(direccion)) == comuna
+
+    return cumple
+
+
+def agrupar_filas(
+    filas,
+    campo: str,
+    tipo: str | None = None,
+    comuna: str | None = None,
+    prefijo_telefono: str | None = None,
+    digitos: int = DIGITOS_PREFIJO,
+) -> dict[str, int]:
+    """Clientes por `campo` entre las filas (nombre, email, telefono, direccion, tipo).
+
+    Recorre todas las filas; AlmacenColumnar.agrupar hace lo mismo sobre
+    sus columnas. Retorna {valor: cantidad}, de mayor a menor cantidad.
+    """
+    validar_agrupacion(campo, digitos)
+    cumple = condicion_agrupacion(tipo, comuna, prefijo_telefono)
+    conteo = Counter()
+    comunas = {}  # cada comuna se muestra como aparece la primera vez
+    for _, _, telefono, direccion, tipo_fila in filas:
+        if not cumple(telefono, direccion, tipo_fila):
+            continue
+        if campo == "tipo":
+            conteo[tipo_fila] += 1
+        elif campo == "comuna":
+            texto = comuna_de(direccion)
+            conteo[comunas.setdefault(normalizar_texto(texto), texto or SIN_COMUNA)] += 1
+        else:
+            conteo[prefijo_de(telefono, digitos)] += 1
+    return dict(conteo.most_common())
+
+
+@dataclass
+class FiltroClientes:
+    """Filtros de una consulta; los que se indiquen deben cumplirse todos.
+
+    - tipo: "premium", "ClientePremium", etc.
+    - telefono: se compara solo por sus dígitos (debe tener alguno).
+    - texto: todas sus palabras deben estar en el nombre o la dirección
+      (debe tener alguna).
+    - prefijo: alguna palabra del nombre o la dirección empieza así (no
+      puede quedar vacío).
+    """
+
+    tipo: str | None = None
+    telefono: str | None = None
+    texto: str | None = None
+    prefijo: str | None = None
+
+    def __post_init__(self):
+        # Se guardan ya normalizados para comparar contra los índices.
+        if self.tipo:
+            self.tipo = nombre_tipo(self.tipo)
+        if self.telefono:
+            self.telefono = normalizar_telefono(self.telefono)
+            if not self.telefono:
+                # Sin dígitos no filtraría nada: se rechaza en vez de listar a todos.
+                raise ValidacionError("El teléfono a buscar debe tener al menos un dígito.")
+        self.tokens = tokenizar(self.texto) if self.texto else set()
+        if self.texto and not self.tokens:
+            raise ValidacionError("El texto a buscar debe tener al menos una palabra.")
+        if self.prefijo:
+            self.prefijo = normalizar_texto(self.prefijo).strip()
+            if not self.prefijo:
+                raise ValidacionError("El prefijo a buscar no puede quedar vacío.")
+
+    def vacio(self) -> bool:
+        return not (self.tipo or self.telefono or self.tokens or self.prefijo)
+
+
+@dataclass
+class PaginaConsulta:
+    """Resultado paginado de una consulta (páginas numeradas desde 1)."""
+
+    clientes: list
+    total: int
+    pagina: int
+    por_pagina: int
+
+    @property
+    def total_paginas(self) -> int:
+        return max(1, -(-self.total // self.por_pagina))
+
+    @property
+    def hay_siguiente(self) -> bool:
+        return self.pagina < self.total_paginas
+
+
+@dataclass(frozen=True)
+class CursorListado:
+    """Punto desde donde continuar un listado.
+
+    `posicion` es la secuencia de alta del último cliente mostrado (el id
+    en SQLite), que no cambia con las bajas, y `numero` es el número de
+    cliente mostrado en el listado.
+    """
+
+    posicion: int = 0
+    numero: int = 0
+
+
+@dataclass
+class PaginaListado:
+    """Una página del listado; el texto se arma recién al recorrerla."""
+
+    clientes: list
+    numero_inicial: int
+    siguiente: CursorListado | None
+
+    def lineas(self):
+        """Genera el bloque de texto de cada cliente de la página."""
+        for numero, cliente in enumerate(self.clientes, start=self.numero_inicial):
+            yield f"\nCliente #{numero}\n{cliente.mostrar_info()}"
+
+
+class IndicesSecundarios:
+    """Índices secundarios en memoria (todos guardan emails normalizados).
+
+    `_orden` guarda la posición de alta de cada cliente para devolver los
+    resultados en el mismo orden del listado, incluso después de una
+    edición que cambia el tipo (el cliente conserva su posición).
+    """
+
+    def __init__(self):
+        self._orden = {}
+        self._siguiente = 0
+        self._por_tipo = {}
+        self._por_telefono = {}
+        self._por_token = {}
+        # Vocabulario ordenado para la búsqueda por prefijo (bisect). Se
+        # rearma solo cuando se consulta después de que cambió (None).
+        self._tokens_ordenados = None
+
+    # -------- Mantenimiento --------
+    @staticmethod
+    def _sumar(indice: dict, valor, clave: str) -> bool:
+        """Agrega clave al conjunto de `valor`; True si el valor es nuevo."""
+        conjunto = indice.get(valor)
+        if conjunto is None:
+            indice[valor] = {clave}
+            return True
+        conjunto.add(clave)
+        return False
+
+    @staticmethod
+    def _restar(indice: dict, valor, clave: str) -> bool:
+        """Quita clave del conjunto de `valor`; True si quedó vacío."""
+        conjunto = indice.get(valor)
+        if conjunto is None:
+            return False
+        conjunto.discard(clave)
+        if not conjunto:
+            del indice[valor]
+            return True
+        return False
+
+    def _indexar(self, clave: str, cliente) -> None:
+        self._sumar(self._por_tipo, cliente.tipo(), clave)
+        self._sumar(self._por_telefono, normalizar_telefono(cliente.telefono), clave)
+        for token in tokens_cliente(cliente):
+            if self._sumar(self._por_token, token, clave):
+                self._tokens_ordenados = None
+
+    def _desindexar(self, clave: str, cliente) -> None:
+        self._restar(self._por_tipo, cliente.tipo(), clave)
+        self._restar(self._por_telefono, normalizar_telefono(cliente.telefono), clave)
+        for token in tokens_cliente(cliente):
+            if self._restar(self._por_token, token, clave):
+                self._tokens_ordenados = None
+
+    def agregar(self, clave: str, cliente) -> None:
+        self._orden[clave] = self._siguiente
+        self._siguiente += 1
+        self._indexar(clave, cliente)
+
+    def reemplazar(self, clave: str, anterior, nuevo) -> None:
+        """Reindexa un cliente editado manteniendo su posición."""
+        self._desindexar(clave, anterior)
+        self._indexar(clave, nuevo)
+
+    def quitar(self, clave: str, cliente) -> None:
+        self._orden.pop(clave, None)
+        self._desindexar(clave, cliente)
+
+    # -------- Búsqueda --------
+    def _claves_con_prefijo(self, prefijo: str) -> set[str]:
+        if self._tokens_ordenados is None:
+            self._tokens_ordenados = sorted(self._por_token)
+        tokens = self._tokens_ordenados
+
+        claves = set()
+        i = bisect_left(tokens, prefijo)
+        while i < len(tokens) and tokens[i].startswith(prefijo):
+            claves |= self._por_token[tokens[i]]
+            i += 1
+        return claves
+
+    def buscar(self, filtro: FiltroClientes) -> list[str]:
+        """Retorna las claves que cumplen el filtro, en orden de alta.
+
+        Con un filtro vacío conviene recorrer el almacén directamente.
+        """
+        candidatos = []
+        if filtro.tipo:
+            candidatos.append(self._por_tipo.get(filtro.tipo, set()))
+        if filtro.telefono:
+            candidatos.append(self._por_telefono.get(filtro.telefono, set()))
+        for token in filtro.tokens:
+            candidatos.append(self._por_token.get(token, set()))
+        if filtro.prefijo:
+            candidatos.append(self._claves_con_prefijo(filtro.prefijo))
+
+        # Se parte del conjunto más chico para que la intersección sea barata.
+        candidatos.sort(key=len)
+        claves = set(candidatos[0]) if candidatos else set(self._orden)
+        for conjunto in candidatos[1:]:
+            claves &= conjunto
+            if not claves:
+                break
+        return sorted(claves, key=self._orden.__getitem__)
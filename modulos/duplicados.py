@@ -0,0 +1,286 @@
+"""modulos/duplicados.py
+
+Detección de posibles duplicados entre clientes con distinto email (o
+con el mismo email y datos distintos), sin comparar todos contra todos.
+
+Cada cliente se ubica en unos pocos "bloques" según claves de bloqueo:
+
+- t: los últimos 8 dígitos del teléfono;
+- n: la primera y la última palabra del nombre (sin importar el orden);
+- e: la parte del email antes de la @, solo letras y números;
+- d: la palabra más larga y el número de la dirección.
+
+Solo se comparan clientes que comparten al menos un bloque, y un bloque
+que llega a MAX_BLOQUE clientes se descarta: una clave tan común (un
+nombre frecuente, el teléfono de una empresa) ya no distingue a nadie, y
+esos clientes se siguen encontrando por sus otras claves. Así cada
+cliente se compara con a lo sumo unos pocos por clave y el costo crece
+en proporción a la cantidad de clientes, no a su cuadrado.
+
+La similitud (0 a 1) pondera nombre, teléfono, dirección y email; los
+pares desde `umbral` se juntan en grupos (componentes conexas).
+
+    resultado = buscar_duplicados(gestor)
+    for grupo in resultado.grupos:
+        print(grupo.emails, grupo.puntaje)
+
+importar_csv(..., similares=True) usa el mismo índice para señalar las
+filas nuevas parecidas a un cliente ya cargado (no las rechaza).
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+
+from modulos.consultas import tokenizar
+from modulos.validaciones import normalizar_email, normalizar_telefono
+
+
+# Similitud mínima para considerar a dos clientes posibles duplicados
+UMBRAL = 0.55
+# Clientes por bloque a partir del cual el bloque se descarta
+MAX_BLOQUE = 50
+# Dígitos finales del teléfono que se comparan (ignora +56, 9, etc.)
+DIGITOS_TELEFONO = 8
+# Peso de cada campo en la similitud (suman 1)
+PESO_NOMBRE = 0.45
+PESO_TELEFONO = 0.2
+PESO_DIRECCION = 0.25
+PESO_EMAIL = 0.1
+# Mismo usuario de email en otro dominio (ana@gmail.com / ana@hotmail.com)
+SIMILITUD_USUARIO_EMAIL = 0.7
+
+
+@dataclass
+class ParSimilar:
+    email_a: str
+    email_b: str
+    puntaje: float
+
+
+@dataclass
+class GrupoDuplicados:
+    """Clientes conectados por pares con similitud desde el umbral."""
+
+    emails: list[str]
+    pares: list[ParSimilar]
+
+    @property
+    def puntaje(self) -> float:
+        """Similitud del par más parecido del grupo."""
+        return max(par.puntaje for par in self.pares)
+
+
+@dataclass
+class ResultadoDuplicados:
+    grupos: list[GrupoDuplicados] = field(default_factory=list)
+    clientes: int = 0
+    comparaciones: int = 0
+    bloques_saturados: int = 0
+    segundos: float = 0.0
+
+
+def _palabras(texto: str) -> list[str]:
+    # Las palabras se repiten mucho entre clientes: se comparten las cadenas.
+    return sorted(sys.intern(palabra) for palabra in tokenizar(texto))
+
+
+def _jaccard(a: frozenset, b: frozenset) -> float:
+    if not a or not b:
+        return 0.0
+    comunes = len(a & b)
+    return comunes / (len(a) + len(b) - comunes)
+
+
+_NO_ALFANUMERICO = re.compile(r"[\W_]+")
+
+
+def _usuario_email(clave: str) -> str:
+    return _NO_ALFANUMERICO.sub("", clave.partition("@")[0])
+
+
+def similitud(a: tuple, b: tuple) -> float:
+    """Similitud entre dos registros del índice (ver IndiceDuplicados.registro)."""
+    if a[0] == b[0]:
+        email = 1.0
+    elif a[1] == b[1]:
+        email = SIMILITUD_USUARIO_EMAIL
+    else:
+        email = 0.0
+    telefono = 1.0 if a[3] and a[3] == b[3] else 0.0
+    return (
+        PESO_NOMBRE * _jaccard(a[2], b[2])
+        + PESO_TELEFONO * telefono
+        + PESO_DIRECCION * _jaccard(a[4], b[4])
+        + PESO_EMAIL * email
+    )
+
+
+# Marca de un bloque descartado por tener demasiados clientes
+_SATURADO = object()
+
+
+class IndiceDuplicados:
+    """Índice por bloques que compara cada cliente nuevo con sus vecinos.
+
+    agregar() compara al cliente con los que comparten algún bloque,
+    guarda los pares desde el umbral y lo suma al índice; grupos() arma
+    los grupos de posibles duplicados con todo lo agregado.
+    """
+
+    def __init__(self, umbral: float = UMBRAL, max_bloque: int = MAX_BLOQUE):
+        self.umbral = umbral
+        self.max_bloque = max_bloque
+        self.comparaciones = 0
+        self.bloques_saturados = 0
+        # Registro: (email normalizado, usuario del email, palabras del nombre,
+        # teléfono, palabras de la dirección)
+        self._registros: list[tuple] = []
+        # Clave de bloqueo -> posición en _registros (uno solo), lista de
+        # posiciones o _SATURADO
+        self._bloques: dict = {}
+        # Email normalizado -> posición en _registros (el bloque "e:" puede
+        # estar saturado o mezclar usuarios de distintos dominios)
+        self._por_email: dict[str, int] = {}
+        self._pares: list[tuple[int, int, float]] = []
+
+    def __len__(self) -> int:
+        return len(self._registros)
+
+    @staticmethod
+    def registro(email: str, nombre: str, telefono: str, direccion: str) -> tuple[tuple, list[int]]:
+        """Registro del cliente para el índice y sus claves de bloqueo."""
+        clave = normalizar_email(email)
+        usuario = _usuario_email(clave)
+        nombre = _palabras(nombre)
+        telefono = normalizar_telefono(telefono)[-DIGITOS_TELEFONO:]
+        direccion = _palabras(direccion)
+
+        claves = []
+        if len(telefono) >= 6:
+            claves.append("t:" + telefono)
+        if nombre:
+            claves.append("n:" + nombre[0] + " " + nombre[-1])
+        if usuario:
+            claves.append("e:" + usuario)
+        numeros = [p for p in direccion if p.isdigit()]
+        palabras = [p for p in direccion if not p.isdigit()]
+        if numeros and palabras:
+            claves.append("d:" + max(palabras, key=len) + " " + numeros[0])
+        registro = (clave, usuario, frozenset(nombre), telefono, frozenset(direccion))
+        # Se guarda el hash: las colisiones solo suman candidatos que se descartan al comparar.
+        return registro, [hash(c) for c in claves]
+
+    def _candidatos(self, claves) -> set[int]:
+        candidatos = set()
+        for clave in claves:
+            bloque = self._bloques.get(clave)
+            if bloque is None or bloque is _SATURADO:
+                continue
+            if isinstance(bloque, int):
+                candidatos.add(bloque)
+            else:
+                candidatos.update(bloque)
+        return candidatos
+
+    def similitud_mismo_email(self, email: str, nombre: str, telefono: str, direccion: str) -> float | None:
+        """Similitud con el cliente indexado de ese mismo email (None si no está)."""
+        posicion = self._por_email.get(normalizar_email(email))
+        if posicion is None:
+            return None
+        registro, _ = self.registro(email, nombre, telefono, direccion)
+        return similitud(registro, self._registros[posicion])
+
+    def _comparar(self, registro: tuple, claves) -> list[tuple[int, float]]:
+        encontrados = []
+        registros = self._registros
+        candidatos = self._candidatos(claves)
+        self.comparaciones += len(candidatos)
+        for i in candidatos:
+            puntaje = similitud(registro, registros[i])
+            if puntaje >= self.umbral:
+                encontrados.append((i, puntaje))
+        return encontrados
+
+    def agregar(
+        self, email: str, nombre: str, telefono: str, direccion: str, comparar: bool = True
+    ) -> list[tuple[str, float]]:
+        """Suma un cliente y retorna los ya indexados que se le parecen: [(email, puntaje)].
+
+        Con `comparar=False` solo lo indexa (para comparar después a otros
+        contra él, como hace la importación con los clientes ya cargados).
+        """
+        registro, claves = self.registro(email, nombre, telefono, direccion)
+        encontrados = self._comparar(registro, claves) if comparar else []
+
+        posicion = len(self._registros)
+        self._registros.append(registro)
+        self._por_email.setdefault(registro[0], posicion)
+        for i, puntaje in encontrados:
+            self._pares.append((i, posicion, puntaje))
+        bloques = self._bloques
+        for clave in claves:
+            bloque = bloques.get(clave)
+            if bloque is None:
+                bloques[clave] = posicion
+            elif isinstance(bloque, int):
+                bloques[clave] = [bloque, posicion]
+            elif bloque is _SATURADO:
+                continue
+            elif len(bloque) + 1 < self.max_bloque:
+                bloque.append(posicion)
+            else:
+                bloques[clave] = _SATURADO
+                self.bloques_saturados += 1
+        return [(self._registros[i][0], puntaje) for i, puntaje in encontrados]
+
+    def grupos(self) -> list[GrupoDuplicados]:
+        """Grupos de posibles duplicados, del más parecido al menos parecido."""
+        padre = {}
+
+        def raiz(i: int) -> int:
+            while padre.setdefault(i, i) != i:
+                padre[i] = padre[padre[i]]
+                i = padre[i]
+            return i
+
+        for a, b, _ in self._pares:
+            padre[raiz(a)] = raiz(b)
+
+        por_raiz: dict[int, GrupoDuplicados] = {}
+        registros = self._registros
+        for a, b, puntaje in self._pares:
+            grupo = por_raiz.get(raiz(a))
+            if grupo is None:
+                grupo = por_raiz[raiz(a)] = GrupoDuplicados([], [])
+            grupo.pares.append(ParSimilar(registros[a][0], registros[b][0], round(puntaje, 3)))
+        for grupo in por_raiz.values():
+            grupo.emails = list(dict.fromkeys(e for par in grupo.pares for e in (par.email_a, par.email_b)))
+        return sorted(por_raiz.values(), key=lambda grupo: -grupo.puntaje)
+
+
+def indice_del_gestor(
+    gestor, umbral: float = UMBRAL, max_bloque: int = MAX_BLOQUE, comparar: bool = True
+) -> IndiceDuplicados:
+    """Índice con todos los clientes del gestor (en orden de alta)."""
+    indice = IndiceDuplicados(umbral, max_bloque)
+    with gestor.lectura():
+        for nombre, email, telefono, direccion, _ in gestor.almacen.filas():
+            indice.agregar(email, nombre, telefono, direccion, comparar)
+    return indice
+
+
+def buscar_duplicados(gestor, umbral: float = UMBRAL, max_bloque: int = MAX_BLOQUE) -> ResultadoDuplicados:
+    """Busca grupos de posibles duplicados entre los clientes del gestor."""
+    inicio = time.perf_counter()
+    indice = indice_del_gestor(gestor, umbral, max_bloque)
+    return ResultadoDuplicados(
+        grupos=indice.grupos(),
+        clientes=len(indice),
+        comparaciones=indice.comparaciones,
+        bloques_saturados=indice.bloques_saturados,
+        segundos=time.perf_counter() - inicio,
+    )
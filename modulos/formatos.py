@@ -0,0 +1,255 @@
+"""modulos/formatos.py
+
+Formatos de archivo de importar_csv / exportar_csv (modulos/archivos.py),
+además del CSV plano:
+
+- CSV comprimido con gzip (.gz), bzip2 (.bz2) o xz (.xz). Al exportar se
+  elige por la extensión del destino; al importar se reconoce por los
+  primeros bytes del archivo, sin importar su nombre. Se escribe por
+  bloques, cada uno un miembro comprimido completo (los tres formatos
+  admiten miembros concatenados: zcat, bzcat y xzcat leen el archivo
+  entero). Así una exportación reanudable puede cortar el archivo al fin
+  de cualquier bloque. registrar_compresion() agrega otros formatos.
+
+- Columnar (.gicc), más compacto y rápido de volver a cargar que el CSV
+  (no hay que separar campos ni comillas):
+
+  - Cabecera: "GICC" y versión (u16).
+  - Bloques de hasta FILAS_POR_BLOQUE filas: cantidad de filas y largo
+    del cuerpo (2 x u32), y el cuerpo comprimido con zlib.
+  - Cuerpo: diccionario de tipos del bloque (u8 cantidad y cada nombre
+    con su largo en u8), un código u8 por fila con su tipo, y luego las
+    columnas nombre, email, teléfono y dirección. Cada columna va como el
+    largo en caracteres de cada valor (u32 por fila), el largo en bytes
+    de sus textos (u32) y los textos unidos, en UTF-8.
+
+Enteros little-endian.
+"""
+
+from __future__ import annotations
+
+import bz2
+import csv
+import gzip
+import io
+import lzma
+import struct
+import sys
+import zlib
+from array import array
+from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import accumulate
+from pathlib import Path
+
+from modulos.excepciones import ArchivoError
+
+
+# Columnas del CSV de clientes (mismo orden que exportar_csv)
+COLUMNAS_CSV = ("nombre", "email", "telefono", "direccion", "tipo")
+# Filas por bloque al escribir (miembro comprimido o bloque columnar)
+FILAS_POR_BLOQUE = 10_000
+# Nivel de gzip y de zlib: el 6 de gzip por defecto; el 9 tarda mucho más y ahorra poco
+NIVEL_COMPRESION = 6
+# Preset de xz: el 6 por defecto tarda unas 8 veces más y el archivo queda un 15% menor
+PRESET_XZ = 2
+
+EXTENSION_COLUMNAR = ".gicc"
+MAGICO_COLUMNAR = b"GICC"
+VERSION_COLUMNAR = 1
+_CABECERA_COLUMNAR = struct.Struct("<4sH")
+_BLOQUE = struct.Struct("<II")
+_LARGO = struct.Struct("<I")
+# Columnas de texto de cada bloque columnar, en orden
+_COLUMNAS_TEXTO = 4
+
+
+@dataclass(frozen=True)
+class Compresion:
+    """Compresión de CSV: extensión (al escribir) y firma (al leer).
+
+    `abrir(archivo, "rb")` envuelve un archivo binario abierto y entrega
+    los bytes descomprimidos; `comprimir(bytes)` arma un miembro completo.
+    """
+
+    extension: str
+    firma: bytes
+    abrir: object
+    comprimir: object
+
+
+_compresiones: dict[str, Compresion] = {}
+
+
+def registrar_compresion(extension: str, firma: bytes, abrir, comprimir) -> None:
+    """Agrega (o reemplaza) una compresión de CSV, p. ej. ".zst" con otra biblioteca."""
+    extension = extension.lower()
+    _compresiones[extension] = Compresion(extension, firma, abrir, comprimir)
+
+
+# mtime=0: la misma exportación da siempre los mismos bytes
+registrar_compresion(
+    ".gz",
+    b"\x1f\x8b",
+    lambda archivo, modo: gzip.GzipFile(fileobj=archivo, mode=modo),
+    lambda datos: gzip.compress(datos, NIVEL_COMPRESION, mtime=0),
+)
+registrar_compresion(".bz2", b"BZh", bz2.BZ2File, bz2.compress)
+registrar_compresion(
+    ".xz",
+    b"\xfd7zXZ\x00",
+    lzma.LZMAFile,
+    lambda datos: lzma.compress(datos, preset=PRESET_XZ),
+)
+
+
+def compresiones_registradas() -> list[str]:
+    return list(_compresiones)
+
+
+# -------- Detección al leer --------
+def formato_de(archivo) -> str | Compresion:
+    """"csv", "columnar" o la Compresion de un archivo binario, según sus primeros bytes.
+
+    Deja el archivo en la posición en que estaba.
+    """
+    posicion = archivo.tell()
+    inicio = archivo.read(max([len(MAGICO_COLUMNAR)] + [len(c.firma) for c in _compresiones.values()]))
+    archivo.seek(posicion)
+    if inicio.startswith(MAGICO_COLUMNAR):
+        return "columnar"
+    for compresion in _compresiones.values():
+        if inicio.startswith(compresion.firma):
+            return compresion
+    return "csv"
+
+
+def formato_de_ruta(ruta: Path) -> str | Compresion:
+    with open(ruta, mode="rb") as archivo:
+        return formato_de(archivo)
+
+
+@contextmanager
+def abrir_binario(ruta: Path):
+    """Abre `ruta` para leer bytes, descomprimidos si es un CSV comprimido."""
+    with open(ruta, mode="rb") as crudo:
+        formato = formato_de(crudo)
+        if not isinstance(formato, Compresion):
+            yield crudo
+            return
+        with formato.abrir(crudo, "rb") as flujo:
+            yield flujo
+
+
+# -------- Escritura por bloques --------
+class EscritorCSV:
+    """CSV en bytes por bloques; cada bloque es un miembro comprimido si hay compresión."""
+
+    def __init__(self, compresion: Compresion | None = None):
+        self._comprimir = compresion.comprimir if compresion else None
+
+    def inicio(self) -> bytes:
+        return self.bloque([COLUMNAS_CSV])
+
+    def bloque(self, filas) -> bytes:
+        texto = io.StringIO(newline="")
+        csv.writer(texto).writerows(filas)
+        datos = texto.getvalue().encode("utf-8")
+        return self._comprimir(datos) if self._comprimir else datos
+
+
+class EscritorColumnar:
+    """Formato columnar (ver el docstring del módulo)."""
+
+    def inicio(self) -> bytes:
+        return _CABECERA_COLUMNAR.pack(MAGICO_COLUMNAR, VERSION_COLUMNAR)
+
+    def bloque(self, filas) -> bytes:
+        nombres, emails, telefonos, direcciones, tipos = zip(*filas)
+        # Diccionario del bloque: pocos tipos distintos, un byte por fila.
+        diccionario: dict[str, int] = {}
+        codigos = bytes(diccionario.setdefault(tipo, len(diccionario)) for tipo in tipos)
+        partes = [bytes([len(diccionario)])]
+        for tipo in diccionario:
+            nombre = tipo.encode("utf-8")
+            partes += [bytes([len(nombre)]), nombre]
+        partes.append(codigos)
+        for columna in (nombres, emails, telefonos, direcciones):
+            largos = array("I", map(len, columna))
+            if sys.byteorder != "little":
+                largos.byteswap()
+            textos = "".join(columna).encode("utf-8")
+            partes += [largos.tobytes(), _LARGO.pack(len(textos)), textos]
+        cuerpo = zlib.compress(b"".join(partes), NIVEL_COMPRESION)
+        return _BLOQUE.pack(len(filas), len(cuerpo)) + cuerpo
+
+
+def escritor_para(ruta: Path):
+    """Escritor según la extensión: .gicc columnar, .gz/.bz2/.xz comprimido, si no CSV."""
+    sufijo = ruta.suffix.lower()
+    if sufijo == EXTENSION_COLUMNAR:
+        return EscritorColumnar()
+    return EscritorCSV(_compresiones.get(sufijo))
+
+
+# -------- Lectura columnar --------
+def leer_cabecera_columnar(archivo, ruta: Path) -> bytes:
+    """Lee y verifica la cabecera; retorna sus bytes."""
+    cabecera = archivo.read(_CABECERA_COLUMNAR.size)
+    if len(cabecera) < _CABECERA_COLUMNAR.size:
+        raise ArchivoError(f"Archivo columnar incompleto: {ruta}")
+    magico, version = _CABECERA_COLUMNAR.unpack(cabecera)
+    if magico != MAGICO_COLUMNAR or version != VERSION_COLUMNAR:
+        raise ArchivoError(f"No es un archivo columnar de clientes válido: {ruta}")
+    return cabecera
+
+
+def _decodificar_bloque(filas: int, datos: bytes) -> tuple[list[str], ...]:
+    posicion = 1
+    tipos = []
+    for _ in range(datos[0]):
+        largo = datos[posicion]
+        tipos.append(datos[posicion + 1:posicion + 1 + largo].decode("utf-8"))
+        posicion += 1 + largo
+    columna_tipos = [tipos[codigo] for codigo in datos[posicion:posicion + filas]]
+    posicion += filas
+
+    columnas = []
+    for _ in range(_COLUMNAS_TEXTO):
+        largos = array("I")
+        largos.frombytes(datos[posicion:posicion + largos.itemsize * filas])
+        if sys.byteorder != "little":
+            largos.byteswap()
+        posicion += largos.itemsize * filas
+        (largo_textos,) = _LARGO.unpack_from(datos, posicion)
+        posicion += _LARGO.size
+        textos = datos[posicion:posicion + largo_textos].decode("utf-8")
+        posicion += largo_textos
+        # Un solo decode por columna; cada valor es un corte del texto.
+        fines = list(accumulate(largos))
+        if len(fines) != filas or (fines and fines[-1] != len(textos)):
+            raise ValueError("largos de columna inconsistentes")
+        columnas.append([textos[a:b] for a, b in zip([0] + fines[:-1], fines)])
+    return (*columnas, columna_tipos)
+
+
+def leer_bloques_columnares(archivo, ruta: Path):
+    """Genera (bytes del bloque, columnas) desde la posición actual hasta el final.
+
+    Las columnas vienen como listas (nombres, emails, telefonos, direcciones, tipos).
+    """
+    while True:
+        cabecera = archivo.read(_BLOQUE.size)
+        if not cabecera:
+            return
+        if len(cabecera) < _BLOQUE.size:
+            raise ArchivoError(f"Archivo columnar incompleto: {ruta}")
+        filas, largo = _BLOQUE.unpack(cabecera)
+        cuerpo = archivo.read(largo)
+        if len(cuerpo) < largo:
+            raise ArchivoError(f"Archivo columnar incompleto: {ruta}")
+        try:
+            decodificadas = _decodificar_bloque(filas, zlib.decompress(cuerpo))
+        except (zlib.error, IndexError, ValueError, struct.error) as exc:
+            raise ArchivoError(f"Archivo columnar dañado: {ruta} ({exc})") from None
+        yield cabecera + cuerpo, decodificadas
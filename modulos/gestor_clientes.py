@@ -6,74 +6,476 @@ Cumple con:
 - POO con encapsulación + herencia + polimorfismo.
 - Validaciones + excepciones personalizadas.
 - Registro en log de altas/bajas/errores.
+
+El almacenamiento se delega en un almacén (ver modulos/almacenes.py):
+en memoria por defecto o SQLite para persistir cada cambio.
 """
 
 from __future__ import annotations
 
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from itertools import islice
 from typing import Optional
 
+from modulos.almacenes import AlmacenMemoria
+from modulos.consultas import (
+    DIGITOS_PREFIJO,
+    CursorListado,
+    FiltroClientes,
+    PaginaConsulta,
+    PaginaListado,
+    agrupar_filas,
+    condicion_agrupacion,
+)
 from modulos.excepciones import (
     ClienteExistenteError,
     ClienteNoEncontradoError,
-    TipoClienteInvalidoError,
+    ValidacionError,
 )
-from modulos.logger_config import obtener_logger
-from modulos.validaciones import validar_direccion, validar_email, validar_telefono
+from modulos.logger_config import evento, obtener_logger
+from modulos.metricas import contar, instrumentar_metodo, metricas_activas
+from modulos.tipos_cliente import clase_tipo, crear_cliente, crear_clientes
+from modulos.validaciones import (
+    MENSAJES_ERROR,
+    normalizar_email,
+    validar_direccion,
+    validar_email,
+    validar_lote,
+    validar_telefono,
+)
+
+
+_SIN_CANDADO = nullcontext()
+
+# Resultado por cliente de las operaciones masivas
+AGREGADO = "agregado"
+ACTUALIZADO = "actualizado"
+ELIMINADO = "eliminado"
+SIN_CAMBIOS = "sin_cambios"
+NO_ENCONTRADO = "no_encontrado"
+DUPLICADO = "duplicado"  # el email se repite dentro del mismo lote
+INVALIDO = "invalido"
+
+
+@dataclass
+class ResultadoItem:
+    """Qué pasó con un email dentro de una operación masiva."""
+
+    email: str
+    estado: str
+    motivo: str | None = None
+
+
+@dataclass
+class ResultadoMasivo:
+    """Resultados de una operación masiva, en el mismo orden de la entrada."""
+
+    operacion: str
+    items: list[ResultadoItem] = field(default_factory=list)
+    segundos: float = 0.0
+
+    def conteo(self) -> dict[str, int]:
+        """Cantidad de ítems por estado."""
+        conteo = {}
+        for item in self.items:
+            conteo[item.estado] = conteo.get(item.estado, 0) + 1
+        return conteo
+
+    def con_estado(self, *estados: str) -> list[ResultadoItem]:
+        return [item for item in self.items if item.estado in estados]
 
 
 class GestorClientes:
     """Clase encargada de administrar clientes del sistema."""
 
-    def __init__(self):
-        # Colección interna de clientes.
-        self.clientes = []
+    def __init__(self, almacen=None):
+        # Colección interna de clientes: por defecto en memoria; puede
+        # recibirse un AlmacenSQLite para persistir cada cambio.
+        self._almacen = almacen if almacen is not None else AlmacenMemoria()
         self.logger = obtener_logger()
+        # Cambios aún no exportados: email normalizado -> "U" (alta/edición)
+        # o "D" (baja). Lo consume la exportación incremental.
+        self._pendientes = {}
+        # Generación de la instantánea exportada a la que se refieren los
+        # pendientes; None si no hay una (p. ej. al iniciar la sesión).
+        self._generacion = None
 
-    # -------- Utilidades --------
-    def buscar_por_email(self, email: str) -> Optional[object]:
-        """Retorna el cliente que coincide con el email o None."""
-        e = (email or "").strip().lower()
-        for c in self.clientes:
-            if c.email.lower() == e:
-                return c
-        return None
+    @property
+    def clientes(self):
+        """Colección (solo lectura) de los clientes en orden de alta."""
+        return self._almacen
 
-    def agregar_cliente(self, cliente) -> None:
-        """Agrega un cliente evitando duplicados por email."""
-        if self.buscar_por_email(cliente.email):
-            raise ClienteExistenteError(f"Ya existe un cliente con email: {cliente.email}")
-        self.clientes.append(cliente)
-        self.logger.info("ALTA cliente email=%s tipo=%s", cliente.email, cliente.tipo())
+    @property
+    def almacen(self):
+        return self._almacen
 
-    def _crear_cliente_por_tipo(self, tipo: str, nombre: str, email: str, telefono: str, direccion: str):
-        """Crea un objeto cliente según el tipo indicado."""
-        t = (tipo or "").strip().lower()
+    def __len__(self) -> int:
+        return len(self._almacen)
 
-        if t == "regular":
-            from modulos.cliente_regular import ClienteRegular
+    def cerrar(self) -> None:
+        """Libera el almacén (cierra la base de datos si corresponde)."""
+        self._almacen.cerrar()
 
-            return ClienteRegular(nombre, email, telefono, direccion)
+    # Varias llamadas como una sola lectura/escritura. Sin efecto aquí; el
+    # GestorConcurrente (modulos/concurrencia.py) toma su candado.
+    def lectura(self):
+        return _SIN_CANDADO
 
-        if t == "premium":
-            from modulos.cliente_premium import ClientePremium
+    def escritura(self):
+        return _SIN_CANDADO
 
-            return ClientePremium(nombre, email, telefono, direccion)
-
-        if t == "corporativo":
-            from modulos.cliente_corporativo import ClienteCorporativo
-
-            return ClienteCorporativo(nombre, email, telefono, direccion)
+    # -------- Utilidades --------
+    @instrumentar_metodo("gestor.buscar_por_email")
+    def buscar_por_email(self, email: str) -> Optional[object]:
+        """Retorna el cliente que coincide con el email o None."""
+        return self._almacen.obtener(normalizar_email(email))
+
+    def buscar_varios(self, emails) -> dict:
+        """Retorna {email normalizado: cliente} de los emails registrados."""
+        return self._almacen.obtener_lote({normalizar_email(e) for e in emails})
+
+    def existe_email(self, email: str) -> bool:
+        """Indica si ya hay un cliente registrado con ese email."""
+        clave = normalizar_email(email)
+        return bool(self._almacen.existentes((clave,)))
+
+    def emails_existentes(self, emails) -> set[str]:
+        """Retorna los emails (normalizados) que ya están registrados."""
+        return self._almacen.existentes({normalizar_email(e) for e in emails})
+
+    def hay_cambios(self) -> bool:
+        """Indica si hay cambios sin exportar desde la última exportación."""
+        return bool(self._pendientes)
+
+    def tomar_cambios(self) -> dict[str, str]:
+        """Retorna y limpia los cambios pendientes de exportar."""
+        cambios, self._pendientes = self._pendientes, {}
+        return cambios
+
+    def restaurar_cambios(self, cambios: dict[str, str]) -> None:
+        """Reincorpora cambios tomados que no se pudieron exportar."""
+        for clave, op in cambios.items():
+            self._pendientes.setdefault(clave, op)
+
+    def descartar_cambios(self, generacion: str | None = None) -> None:
+        """Olvida los cambios pendientes (tras una exportación completa).
+
+        `generacion` identifica la instantánea escrita, base de los cambios
+        que se marquen desde ahora.
+        """
+        self._pendientes = {}
+        self._generacion = generacion
+
+    def generacion_exportada(self) -> str | None:
+        """Generación de la instantánea a la que se refieren los cambios pendientes."""
+        return self._generacion
+
+    def _insertar(self, cliente) -> None:
+        """Inserta al final del listado (sin loguear)."""
+        self._almacen.insertar(cliente)
+        self._pendientes[normalizar_email(cliente.email)] = "U"
+
+    def _insertar_lote(self, clientes) -> None:
+        """Inserta un lote completo o ninguno."""
+        self._almacen.insertar_lote(clientes)
+        for cliente in clientes:
+            self._pendientes[normalizar_email(cliente.email)] = "U"
+
+    def _reemplazar(self, cliente) -> None:
+        """Sustituye al cliente con el mismo email manteniendo su posición."""
+        self._almacen.reemplazar(cliente)
+        self._pendientes[normalizar_email(cliente.email)] = "U"
+
+    def _quitar(self, email: str):
+        """Quita y retorna el cliente con ese email (o None si no existe)."""
+        clave = normalizar_email(email)
+        cliente = self._almacen.quitar(clave)
+        if cliente is not None:
+            self._pendientes[clave] = "D"
+        return cliente
+
+    @instrumentar_metodo("gestor.agregar_cliente")
+    def agregar_cliente(self, cliente) -> None:
+        """Agrega un cliente evitando duplicados por email."""
+        if self.existe_email(cliente.email):
+            raise ClienteExistenteError(f"Ya existe un cliente con email: {cliente.email}")
+        self._insertar(cliente)
+        self.logger.info(
+            "ALTA cliente email=%s tipo=%s", cliente.email, cliente.tipo(),
+            extra=evento("ALTA", cliente.email, cliente.tipo()),
+        )
 
-        raise TipoClienteInvalidoError(
-            "Tipo de cliente inválido. Use: regular / premium / corporativo"
+    @instrumentar_metodo("gestor.eliminar_por_email")
+    def eliminar_por_email(self, email: str):
+        """Elimina y retorna el cliente con ese email (sin pedir datos por consola)."""
+        validar_email(email)
+        cliente = self._quitar(email)
+        if not cliente:
+            raise ClienteNoEncontradoError(f"Cliente no encontrado: {email}")
+        self.logger.info(
+            "BAJA cliente email=%s tipo=%s", cliente.email, cliente.tipo(),
+            extra=evento("BAJA", cliente.email, cliente.tipo()),
+        )
+        return cliente
+
+    @instrumentar_metodo("gestor.cambiar_tipo")
+    def cambiar_tipo(self, email: str, tipo: str):
+        """Cambia el tipo de un cliente conservando sus datos y su posición."""
+        actual = self.buscar_por_email(email)
+        if not actual:
+            raise ClienteNoEncontradoError(f"Cliente no encontrado: {email}")
+        cliente = crear_cliente(tipo, actual.nombre, actual.email, actual.telefono, actual.direccion)
+        self._reemplazar(cliente)
+        self.logger.info(
+            "UPDATE cliente email=%s tipo=%s", cliente.email, cliente.tipo(),
+            extra=evento("UPDATE", cliente.email, cliente.tipo()),
+        )
+        return cliente
+
+    @instrumentar_metodo("gestor.actualizar_cliente")
+    def actualizar_cliente(
+        self,
+        email: str,
+        nombre: str | None = None,
+        telefono: str | None = None,
+        direccion: str | None = None,
+        tipo: str | None = None,
+    ):
+        """Modifica los datos indicados de un cliente (los None se mantienen).
+
+        Si cambia el tipo se crea un objeto de la subclase correspondiente;
+        el cliente conserva su posición en el listado.
+        """
+        actual = self.buscar_por_email(email)
+        if not actual:
+            raise ClienteNoEncontradoError(f"Cliente no encontrado: {email}")
+        if telefono is not None:
+            validar_telefono(telefono)
+        if direccion is not None:
+            validar_direccion(direccion)
+        clase = clase_tipo(tipo) if tipo else type(actual)
+        cliente = clase(
+            actual.nombre if nombre is None else nombre,
+            actual.email,
+            actual.telefono if telefono is None else telefono,
+            actual.direccion if direccion is None else direccion,
+        )
+        self._reemplazar(cliente)
+        self.logger.info(
+            "UPDATE cliente email=%s tipo=%s", cliente.email, cliente.tipo(),
+            extra=evento("UPDATE", cliente.email, cliente.tipo()),
+        )
+        return cliente
+
+    # -------- Operaciones masivas --------
+    # Cada una valida y agrupa el lote en una pasada, hace una sola llamada
+    # por lote al almacén (una transacción en SQLite) y deja un único
+    # registro de resumen en el log en lugar de uno por cliente.
+    def _resumir(self, resultado: ResultadoMasivo, inicio: float) -> ResultadoMasivo:
+        resultado.segundos = time.perf_counter() - inicio
+        por_estado = resultado.conteo()
+        if metricas_activas():
+            for estado, cantidad in por_estado.items():
+                contar(f"gestor.{resultado.operacion.lower()}.{estado}", cantidad)
+        conteo = " ".join(f"{estado}={cantidad}" for estado, cantidad in por_estado.items())
+        self.logger.info(
+            "%s LOTE total=%s %s", resultado.operacion, len(resultado.items), conteo,
+            extra=evento(f"{resultado.operacion}_LOTE", duracion=resultado.segundos),
+        )
+        return resultado
+
+    @staticmethod
+    def _claves_del_lote(resultado: ResultadoMasivo, emails) -> dict[str, int]:
+        """Valida los emails y retorna {clave: posición en items} sin repetidos.
+
+        Los inválidos y repetidos quedan ya resueltos en `resultado`.
+        """
+        claves = {}
+        for email in emails:
+            try:
+                validar_email(email)
+            except ValidacionError as exc:
+                resultado.items.append(ResultadoItem(email, INVALIDO, str(exc)))
+                continue
+            clave = normalizar_email(email)
+            if clave in claves:
+                resultado.items.append(ResultadoItem(email, DUPLICADO))
+                continue
+            claves[clave] = len(resultado.items)
+            resultado.items.append(ResultadoItem(email, NO_ENCONTRADO))
+        return claves
+
+    @instrumentar_metodo("gestor.eliminar_varios")
+    def eliminar_varios(self, emails) -> ResultadoMasivo:
+        """Elimina los clientes de una lista de emails."""
+        inicio = time.perf_counter()
+        resultado = ResultadoMasivo("BAJA")
+        claves = self._claves_del_lote(resultado, emails)
+
+        quitados = self._almacen.quitar_lote(claves)
+        for clave in quitados:
+            resultado.items[claves[clave]].estado = ELIMINADO
+            self._pendientes[clave] = "D"
+        return self._resumir(resultado, inicio)
+
+    @instrumentar_metodo("gestor.cambiar_tipo_varios")
+    def cambiar_tipo_varios(self, emails, tipo: str) -> ResultadoMasivo:
+        """Cambia el tipo de varios clientes conservando datos y posición."""
+        clase = clase_tipo(tipo)  # valida el tipo antes de tocar ningún cliente
+        inicio = time.perf_counter()
+        resultado = ResultadoMasivo("CAMBIO_TIPO")
+        claves = self._claves_del_lote(resultado, emails)
+
+        datos = []
+        for clave, actual in self._almacen.obtener_lote(claves).items():
+            item = resultado.items[claves[clave]]
+            if type(actual) is clase:
+                item.estado = SIN_CAMBIOS
+                continue
+            datos.append((actual.nombre, actual.email, actual.telefono, actual.direccion))
+            item.estado = ACTUALIZADO
+
+        cambiados = crear_clientes(datos, tipo)
+        self._almacen.reemplazar_lote(cambiados)
+        for cliente in cambiados:
+            self._pendientes[normalizar_email(cliente.email)] = "U"
+        return self._resumir(resultado, inicio)
+
+    @instrumentar_metodo("gestor.guardar_varios")
+    def guardar_varios(self, clientes) -> ResultadoMasivo:
+        """Agrega los clientes nuevos y reemplaza los ya registrados (upsert).
+
+        Todo el lote se guarda en una sola operación del almacén: si falla,
+        no queda ningún cambio. Como en la importación, si un email se
+        repite en el lote vale la primera aparición y las siguientes quedan
+        como duplicadas. Los nuevos quedan al final del listado en el orden
+        recibido; los existentes conservan su posición.
+        """
+        inicio = time.perf_counter()
+        resultado = ResultadoMasivo("GUARDADO")
+        clientes = list(clientes)
+        revision = validar_lote(
+            [c.tipo() for c in clientes],
+            [c.email for c in clientes],
+            [c.telefono for c in clientes],
+            [c.direccion for c in clientes],
         )
 
+        primeros = {}  # clave -> (posición en items, cliente)
+        for cliente, codigo in zip(clientes, revision.codigos):
+            if codigo is not None:
+                resultado.items.append(ResultadoItem(cliente.email, INVALIDO, MENSAJES_ERROR[codigo]))
+                continue
+            clave = normalizar_email(cliente.email)
+            if clave in primeros:
+                resultado.items.append(ResultadoItem(cliente.email, DUPLICADO))
+                continue
+            primeros[clave] = (len(resultado.items), cliente)
+            resultado.items.append(ResultadoItem(cliente.email, AGREGADO))
+
+        existentes = self._almacen.existentes(primeros)
+        nuevos, actualizados = [], []
+        for clave, (posicion, cliente) in primeros.items():
+            if clave in existentes:
+                resultado.items[posicion].estado = ACTUALIZADO
+                actualizados.append(cliente)
+            else:
+                nuevos.append(cliente)
+
+        self._almacen.guardar_lote(actualizados, nuevos)
+        for clave in primeros:
+            self._pendientes[clave] = "U"
+        return self._resumir(resultado, inicio)
+
+    @instrumentar_metodo("gestor.consultar")
+    def consultar(
+        self,
+        tipo: str | None = None,
+        telefono: str | None = None,
+        texto: str | None = None,
+        prefijo: str | None = None,
+        pagina: int = 1,
+        por_pagina: int = 20,
+    ) -> PaginaConsulta:
+        """Busca clientes combinando filtros (todos deben cumplirse).
+
+        Ejemplo: consultar(tipo="premium", texto="La Cisterna", pagina=2).
+        Los resultados salen en el mismo orden que el listado.
+        """
+        if pagina < 1 or por_pagina < 1:
+            raise ValidacionError("La página y el tamaño de página deben ser mayores que cero.")
+        filtro = FiltroClientes(tipo=tipo, telefono=telefono, texto=texto, prefijo=prefijo)
+        return self._almacen.consultar(filtro, pagina, por_pagina)
+
+    @instrumentar_metodo("gestor.paginar_clientes")
+    def paginar_clientes(
+        self,
+        por_pagina: int = 10,
+        desde: int = 0,
+        cursor: CursorListado | None = None,
+        tipo: str | None = None,
+    ) -> PaginaListado:
+        """Retorna una página del listado, opcionalmente filtrado por tipo.
+
+        Se puede saltar `desde` clientes o continuar desde el `cursor` de la
+        página anterior (pagina.siguiente). Solo se leen los clientes de la
+        página: mostrarla no depende de cuántos clientes haya en total.
+        """
+        if por_pagina < 1 or desde < 0:
+            raise ValidacionError("Tamaño de página o desplazamiento inválido.")
+        tipo = FiltroClientes(tipo=tipo).tipo
+        cursor = cursor or CursorListado()
+
+        recorrido = self._almacen.recorrer(cursor.posicion, tipo)
+        # Se pide uno extra para saber si hay página siguiente.
+        filas = list(islice(recorrido, desde, desde + por_pagina + 1))
+        recorrido.close()
+
+        hay_mas = len(filas) > por_pagina
+        filas = filas[:por_pagina]
+        numero_inicial = cursor.numero + desde + 1
+        siguiente = None
+        if hay_mas:
+            siguiente = CursorListado(filas[-1][0], numero_inicial + len(filas) - 1)
+        return PaginaListado([cliente for _, cliente in filas], numero_inicial, siguiente)
+
+    @instrumentar_metodo("gestor.contar_por_tipo")
     def contar_por_tipo(self):
         """Retorna un dict con la cantidad de clientes por tipo."""
-        resumen = {}
-        for cliente in self.clientes:
-            resumen[cliente.tipo()] = resumen.get(cliente.tipo(), 0) + 1
-        return resumen
+        return self._almacen.contar_por_tipo()
+
+    @instrumentar_metodo("gestor.agrupar")
+    def agrupar(
+        self,
+        campo: str,
+        tipo: str | None = None,
+        comuna: str | None = None,
+        prefijo_telefono: str | None = None,
+        digitos: int = DIGITOS_PREFIJO,
+    ) -> dict[str, int]:
+        """Cantidad de clientes por "tipo", "comuna" o "prefijo_telefono".
+
+        Ejemplo: agrupar("comuna", tipo="premium", prefijo_telefono="9").
+        Con AlmacenColumnar se resuelve sobre sus columnas; con los demás
+        almacenes se recorren sus filas una vez.
+        """
+        agrupar = getattr(self._almacen, "agrupar", None)
+        if agrupar is not None:
+            return agrupar(campo, tipo, comuna, prefijo_telefono, digitos)
+        return agrupar_filas(self._almacen.filas(), campo, tipo, comuna, prefijo_telefono, digitos)
+
+    @instrumentar_metodo("gestor.seleccionar")
+    def seleccionar(
+        self, tipo: str | None = None, comuna: str | None = None, prefijo_telefono: str | None = None
+    ) -> list:
+        """Clientes de un tipo, comuna y/o prefijo telefónico, en orden de alta."""
+        seleccionar = getattr(self._almacen, "seleccionar", None)
+        if seleccionar is not None:
+            return seleccionar(tipo, comuna, prefijo_telefono)
+        cumple = condicion_agrupacion(tipo, comuna, prefijo_telefono)
+        return [c for c in self._almacen if cumple(c.telefono, c.direccion, c.tipo())]
 
     # -------- CRUD (Consola) --------
     def crear_cliente(self) -> None:
@@ -90,7 +492,7 @@ class GestorClientes:
             validar_direccion(direccion)
 
             tipo = input("Tipo de cliente (regular / premium / corporativo): ").strip().lower()
-            cliente = self._crear_cliente_por_tipo(tipo, nombre, email, telefono, direccion)
+            cliente = crear_cliente(tipo, nombre, email, telefono, direccion)
 
             self.agregar_cliente(cliente)
             print("Cliente creado correctamente.")
@@ -99,15 +501,32 @@ class GestorClientes:
             self.logger.error("ERROR al crear cliente: %s", exc)
             print(f"Error: {exc}")
 
-    def listar_clientes(self) -> None:
-        """Muestra todos los clientes registrados."""
-        if not self.clientes:
+    def listar_clientes(self, por_pagina: int = 10) -> None:
+        """Muestra los clientes registrados de a una página por vez."""
+        if not len(self):
             print("No hay clientes registrados.")
             return
 
-        for i, cliente in enumerate(self.clientes, start=1):
-            print(f"\nCliente #{i}")
-            print(cliente.mostrar_info())
+        tipo = input("Filtrar por tipo (Enter para todos): ").strip() or None
+        try:
+            pagina = self.paginar_clientes(por_pagina=por_pagina, tipo=tipo)
+        except ValidacionError as exc:
+            print(f"Error: {exc}")
+            return
+
+        if not pagina.clientes:
+            print("No hay clientes de ese tipo.")
+            return
+
+        while True:
+            for bloque in pagina.lineas():
+                print(bloque)
+
+            if pagina.siguiente is None:
+                break
+            if input("\nEnter para ver más, 'q' para volver al menú: ").strip().lower() == "q":
+                break
+            pagina = self.paginar_clientes(por_pagina=por_pagina, cursor=pagina.siguiente, tipo=tipo)
 
     def editar_cliente(self) -> None:
         """Modifica nombre/teléfono/dirección y, si se desea, el tipo."""
@@ -129,29 +548,14 @@ class GestorClientes:
             print("\nTipos permitidos: regular / premium / corporativo")
             nuevo_tipo = input("Nuevo tipo (Enter para mantener): ").strip().lower()
 
-            # Mantener valores actuales si se omite.
-            nombre = nuevo_nombre if nuevo_nombre else cliente_actual.nombre
-            telefono = cliente_actual.telefono
-            direccion = nueva_direccion if nueva_direccion else cliente_actual.direccion
-            tipo = nuevo_tipo if nuevo_tipo else cliente_actual.tipo().lower()
-
-            if nuevo_telefono:
-                validar_telefono(nuevo_telefono)
-                telefono = nuevo_telefono
-
-            if nueva_direccion:
-                validar_direccion(nueva_direccion)
-
-            # Si cambia el tipo, se crea un nuevo objeto de la subclase correspondiente.
-            cliente_editado = self._crear_cliente_por_tipo(tipo, nombre, cliente_actual.email, telefono, direccion)
-
-            # Reemplazar en la lista
-            for idx, c in enumerate(self.clientes):
-                if c.email.lower() == cliente_actual.email.lower():
-                    self.clientes[idx] = cliente_editado
-                    break
-
-            self.logger.info("UPDATE cliente email=%s tipo=%s", cliente_editado.email, cliente_editado.tipo())
+            # Lo que se deja en blanco mantiene el valor actual.
+            self.actualizar_cliente(
+                cliente_actual.email,
+                nombre=nuevo_nombre or None,
+                telefono=nuevo_telefono or None,
+                direccion=nueva_direccion or None,
+                tipo=nuevo_tipo or None,
+            )
             print("Cliente actualizado correctamente.")
 
         except Exception as exc:
@@ -162,14 +566,7 @@ class GestorClientes:
         """Elimina un cliente según su email."""
         try:
             email = input("Ingrese email del cliente a eliminar: ").strip()
-            validar_email(email)
-
-            cliente = self.buscar_por_email(email)
-            if not cliente:
-                raise ClienteNoEncontradoError("Cliente no encontrado.")
-
-            self.clientes = [c for c in self.clientes if c.email.lower() != email.lower()]
-            self.logger.info("BAJA cliente email=%s tipo=%s", cliente.email, cliente.tipo())
+            self.eliminar_por_email(email)
             print("Cliente eliminado correctamente.")
 
         except Exception as exc:
@@ -0,0 +1,351 @@
+"""modulos/instantanea.py
+
+Instantánea binaria de todos los clientes (datos/clientes.gic), pensada
+para arrancar sin volver a leer y validar el CSV.
+
+Formato (enteros little-endian):
+
+- Cabecera: "GICS", versión (u16), reservado (u16), cantidad de
+  clientes (u64), posición de la tabla de posiciones (u64) y CRC32 de
+  todo lo que sigue a la cabecera (u32).
+- Registros: código de tipo (u8), largo en bytes de nombre, email,
+  teléfono y dirección (4 x u16) y luego los cuatro textos en UTF-8.
+- Tabla de posiciones: u64 por cliente con el inicio de su registro.
+
+AlmacenInstantanea abre el archivo con mmap y crea cada Cliente recién
+cuando se lo pide; contar, exportar (filas) o recorrer una página no
+obliga a cargar el resto.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+import zlib
+from array import array
+from collections import Counter
+from itertools import islice
+from pathlib import Path
+
+from modulos.almacenes import AlmacenMemoria
+from modulos.consultas import FiltroClientes, PaginaConsulta
+from modulos.excepciones import ArchivoError
+from modulos.logger_config import evento, obtener_logger
+from modulos.rutas import dir_datos
+from modulos.tipos_cliente import clase_tipo, codigo_tipo, tipo_por_codigo
+from modulos.validaciones import normalizar_email
+
+
+logger = obtener_logger()
+
+MAGICO = b"GICS"
+VERSION = 1
+_CABECERA = struct.Struct("<4sHHQQI")
+_REGISTRO = struct.Struct("<B4H")
+_POSICION = struct.Struct("<Q")
+
+# Registros que se arman antes de cada escritura al guardar
+REGISTROS_POR_ESCRITURA = 10_000
+LARGO_MAXIMO_CAMPO = 0xFFFF
+
+
+def ruta_instantanea() -> Path:
+    return dir_datos() / "clientes.gic"
+
+
+def _codificar(nombre: str, email: str, telefono: str, direccion: str, tipo: str) -> bytes:
+    texto = nombre + email + telefono + direccion
+    if texto.isascii():
+        # Caso común: un solo encode y los largos en bytes son los de los textos.
+        largos = (len(nombre), len(email), len(telefono), len(direccion))
+        datos = texto.encode("ascii")
+    else:
+        campos = [c.encode("utf-8") for c in (nombre, email, telefono, direccion)]
+        largos = tuple(map(len, campos))
+        datos = b"".join(campos)
+    if max(largos) > LARGO_MAXIMO_CAMPO:
+        raise ArchivoError(f"Campo demasiado largo para la instantánea (email={email}).")
+    # El código de un byte de cada tipo sale del registro (tipos_cliente).
+    return _REGISTRO.pack(codigo_tipo(tipo), *largos) + datos
+
+
+def guardar_instantanea(gestor, ruta: Path | str | None = None) -> Path:
+    """Guarda todos los clientes del gestor en una instantánea binaria.
+
+    Se escribe en un temporal y se reemplaza de forma atómica, igual que
+    la exportación CSV.
+    """
+    ruta = Path(ruta) if ruta else ruta_instantanea()
+    almacen = gestor.almacen
+    if isinstance(almacen, AlmacenInstantanea) and almacen.ruta.resolve() == ruta.resolve():
+        # No se puede reemplazar un archivo que sigue mapeado (en Windows).
+        with gestor.escritura():
+            almacen.cargar_todo()
+
+    inicio = time.perf_counter()
+    temporal = ruta.with_name(f".{ruta.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        posiciones = array("Q")
+        crc = 0
+        with open(temporal, mode="wb") as archivo, gestor.lectura():
+            archivo.write(bytes(_CABECERA.size))
+            posicion = _CABECERA.size
+            filas = almacen.filas()
+            while True:
+                bloque = []
+                for fila in islice(filas, REGISTROS_POR_ESCRITURA):
+                    registro = _codificar(*fila)
+                    posiciones.append(posicion)
+                    posicion += len(registro)
+                    bloque.append(registro)
+                if not bloque:
+                    break
+                datos = b"".join(bloque)
+                crc = zlib.crc32(datos, crc)
+                archivo.write(datos)
+
+            if sys.byteorder != "little":
+                posiciones.byteswap()
+            crc = zlib.crc32(posiciones, crc)
+            archivo.write(posiciones)
+            archivo.seek(0)
+            archivo.write(_CABECERA.pack(MAGICO, VERSION, 0, len(posiciones), posicion, crc))
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        os.replace(temporal, ruta)
+    except ArchivoError:
+        raise
+    except Exception as exc:
+        logger.error("ERROR guardando instantánea: %s", exc)
+        raise ArchivoError(f"No se pudo guardar la instantánea: {exc}")
+    finally:
+        temporal.unlink(missing_ok=True)
+
+    logger.info(
+        "INSTANTANEA -> %s (registros=%s)", ruta, len(posiciones),
+        extra=evento("INSTANTANEA", duracion=time.perf_counter() - inicio),
+    )
+    return ruta
+
+
+class AlmacenInstantanea:
+    """Almacén sobre una instantánea mapeada en memoria.
+
+    Las lecturas (obtener, recorrer, filas, contar_por_tipo...) se
+    resuelven sobre el archivo y cada Cliente se crea una sola vez, al
+    pedirlo. La primera modificación, o una consulta con filtros, carga
+    todo en un AlmacenMemoria y desde ahí se delega en él; el archivo se
+    suelta recién al modificar.
+
+    GestorConcurrente deja leer a varios hilos a la vez, así que lo que se
+    arma en una lectura (índice por email, carga completa) pasa por un
+    candado propio.
+    """
+
+    def __init__(self, ruta: Path | str | None = None, verificar: bool = True):
+        self.ruta = Path(ruta) if ruta else ruta_instantanea()
+        self._memoria = None
+        self._creados = {}  # número de registro -> Cliente
+        self._claves = None  # email normalizado -> número de registro
+        self._conteo = None
+        self._candado = threading.Lock()
+        try:
+            with open(self.ruta, mode="rb") as archivo:
+                self._mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as exc:
+            raise ArchivoError(f"No se pudo abrir la instantánea {self.ruta}: {exc}")
+
+        try:
+            self._abrir(verificar)
+        except Exception:
+            self._liberar()
+            raise
+
+    def _abrir(self, verificar: bool) -> None:
+        if len(self._mapa) < _CABECERA.size:
+            raise ArchivoError(f"Instantánea incompleta: {self.ruta}")
+        magico, version, _, total, inicio_tabla, crc = _CABECERA.unpack_from(self._mapa, 0)
+        if magico != MAGICO or version != VERSION:
+            raise ArchivoError(f"No es una instantánea de clientes válida: {self.ruta}")
+        if inicio_tabla + total * _POSICION.size != len(self._mapa):
+            raise ArchivoError(f"Instantánea incompleta: {self.ruta}")
+
+        self._vista = memoryview(self._mapa)
+        if verificar:
+            with self._vista[_CABECERA.size:] as cuerpo:
+                if zlib.crc32(cuerpo) != crc:
+                    raise ArchivoError(f"La instantánea está dañada (checksum): {self.ruta}")
+
+        self._total = total
+        self._tabla = self._vista[inicio_tabla:]
+        if sys.byteorder == "little":
+            self._posiciones = self._tabla.cast("Q")
+        else:
+            self._posiciones = array("Q", self._tabla)
+            self._posiciones.byteswap()
+
+    def _liberar(self) -> None:
+        # mmap no se puede cerrar mientras queden vistas sobre él.
+        for nombre in ("_posiciones", "_tabla", "_vista"):
+            vista = getattr(self, nombre, None)
+            if isinstance(vista, memoryview):
+                vista.release()
+        self._mapa.close()
+
+    # -------- Lectura de registros --------
+    def _campos(self, numero: int):
+        """Retorna (tipo, nombre, email, telefono, direccion) del registro."""
+        posicion = self._posiciones[numero]
+        codigo, *largos = _REGISTRO.unpack_from(self._mapa, posicion)
+        posicion += _REGISTRO.size
+        campos = [tipo_por_codigo(codigo)]
+        for largo in largos:
+            campos.append(str(self._mapa[posicion:posicion + largo], "utf-8"))
+            posicion += largo
+        return campos
+
+    def _cliente(self, numero: int):
+        cliente = self._creados.get(numero)
+        if cliente is None:
+            tipo, *datos = self._campos(numero)
+            cliente = self._creados[numero] = clase_tipo(tipo)(*datos)
+        return cliente
+
+    def _indice_claves(self) -> dict[str, int]:
+        """Arma (una vez) el índice por email leyendo solo ese campo."""
+        if self._claves is None:
+            with self._candado:
+                if self._claves is None:
+                    mapa, registro = self._mapa, _REGISTRO
+                    claves = {}
+                    for numero, posicion in enumerate(self._posiciones):
+                        _, largo_nombre, largo_email, _, _ = registro.unpack_from(mapa, posicion)
+                        inicio = posicion + registro.size + largo_nombre
+                        claves[normalizar_email(str(mapa[inicio:inicio + largo_email], "utf-8"))] = numero
+                    self._claves = claves
+        return self._claves
+
+    def _materializar(self) -> AlmacenMemoria:
+        """Carga (una vez) todos los clientes en un AlmacenMemoria.
+
+        El archivo queda abierto: otro lector puede estar recorriéndolo.
+        """
+        if self._memoria is None:
+            with self._candado:
+                if self._memoria is None:
+                    memoria = AlmacenMemoria()
+                    memoria.insertar_lote([self._cliente(numero) for numero in range(self._total)])
+                    # Secuencias 1..total, las mismas que da recorrer() sobre el archivo.
+                    memoria.numerar_altas()
+                    self._memoria = memoria
+        return self._memoria
+
+    def cargar_todo(self) -> AlmacenMemoria:
+        """Pasa todos los clientes a un AlmacenMemoria y suelta el archivo.
+
+        Solo desde una modificación: nadie más puede estar leyendo.
+        """
+        memoria = self._materializar()
+        if not self._mapa.closed:
+            self._liberar()
+            self._creados = self._claves = None
+        return memoria
+
+    # -------- Interfaz del almacén --------
+    def __len__(self) -> int:
+        return len(self._memoria) if self._memoria is not None else self._total
+
+    def __iter__(self):
+        if self._memoria is not None:
+            return iter(self._memoria)
+        return map(self._cliente, range(self._total))
+
+    def recorrer(self, posicion: int = 0, tipo: str | None = None):
+        if self._memoria is not None:
+            yield from self._memoria.recorrer(posicion, tipo)
+            return
+        codigo = None
+        if tipo is not None:
+            try:
+                codigo = codigo_tipo(tipo)
+            except KeyError:
+                return  # tipo no registrado: no hay clientes de ese tipo
+        # numero + 1 es la secuencia que tendrá en AlmacenMemoria (ver
+        # cargar_todo): un cursor sigue sirviendo después de cargar todo.
+        for numero in range(posicion, self._total):
+            if codigo is None or self._mapa[self._posiciones[numero]] == codigo:
+                yield numero + 1, self._cliente(numero)
+
+    def obtener(self, clave: str):
+        if self._memoria is not None:
+            return self._memoria.obtener(clave)
+        numero = self._indice_claves().get(clave)
+        return self._cliente(numero) if numero is not None else None
+
+    def obtener_lote(self, claves) -> dict:
+        if self._memoria is not None:
+            return self._memoria.obtener_lote(claves)
+        indice = self._indice_claves()
+        return {clave: self._cliente(indice[clave]) for clave in claves if clave in indice}
+
+    def existentes(self, claves) -> set[str]:
+        if self._memoria is not None:
+            return self._memoria.existentes(claves)
+        indice = self._indice_claves()
+        return {clave for clave in claves if clave in indice}
+
+    def insertar(self, cliente) -> None:
+        self.cargar_todo().insertar(cliente)
+
+    def insertar_lote(self, clientes) -> None:
+        self.cargar_todo().insertar_lote(clientes)
+
+    def reemplazar(self, cliente) -> None:
+        self.cargar_todo().reemplazar(cliente)
+
+    def reemplazar_lote(self, clientes) -> None:
+        self.cargar_todo().reemplazar_lote(clientes)
+
+    def guardar_lote(self, reemplazos, altas) -> None:
+        self.cargar_todo().guardar_lote(reemplazos, altas)
+
+    def quitar(self, clave: str):
+        return self.cargar_todo().quitar(clave)
+
+    def quitar_lote(self, claves) -> dict:
+        return self.cargar_todo().quitar_lote(claves)
+
+    def contar_por_tipo(self) -> dict[str, int]:
+        if self._memoria is not None:
+            return self._memoria.contar_por_tipo()
+        if self._conteo is None:
+            # Counter conserva el orden de aparición, como los demás almacenes.
+            mapa = self._mapa
+            codigos = Counter(mapa[posicion] for posicion in self._posiciones)
+            self._conteo = {tipo_por_codigo(c): cantidad for c, cantidad in codigos.items()}
+        return dict(self._conteo)
+
+    def consultar(self, filtro: FiltroClientes, pagina: int, por_pagina: int) -> PaginaConsulta:
+        if self._memoria is None and filtro.vacio():
+            desde = (pagina - 1) * por_pagina
+            numeros = range(desde, min(desde + por_pagina, self._total))
+            return PaginaConsulta([self._cliente(n) for n in numeros], self._total, pagina, por_pagina)
+        # Los filtros usan los índices secundarios del almacén en memoria.
+        return self._materializar().consultar(filtro, pagina, por_pagina)
+
+    def filas(self):
+        """Genera (nombre, email, telefono, direccion, tipo) sin crear objetos Cliente."""
+        if self._memoria is not None:
+            yield from self._memoria.filas()
+            return
+        for numero in range(self._total):
+            tipo, *datos = self._campos(numero)
+            yield (*datos, tipo)
+
+    def cerrar(self) -> None:
+        if not self._mapa.closed:
+            self._liberar()
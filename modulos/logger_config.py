@@ -3,15 +3,42 @@ logger_config.py
 
 Configuración del logger del proyecto.
 - Guarda INFO y WARNING en archivo log
-- En consola muestra SOLO ERRORES 
+- En consola muestra SOLO ERRORES
+
+Formato JSON (activar_formato_json): cada línea del archivo es un objeto
+JSON con fecha, nivel, evento, email, tipo y duración (los que se pasen
+con extra=evento(...)). Se lee con modulos/auditoria.py.
+
+Modo asíncrono (activar_log_asincrono): los registros para el archivo se
+encolan en una cola acotada y un hilo los escribe por lotes, así las
+altas/bajas/duplicados no esperan al disco. Hay que llamar a
+detener_log_asincrono al salir para vaciar la cola (también se registra
+con atexit).
 """
 
+from __future__ import annotations
+
+import atexit
+import json
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+from logging.handlers import QueueHandler, RotatingFileHandler
 
 from .rutas import ruta_log
 
 
+TAMANO_MAXIMO_LOG = 300_000
+RESPALDOS_LOG = 3
+FORMATO_LOG = "%(asctime)s - %(levelname)s - %(message)s"
+
+# Modo asíncrono: capacidad de la cola y registros por escritura
+CAPACIDAD_COLA_LOG = 10_000
+REGISTROS_POR_LOTE = 500
+# Política cuando la cola está llena: "esperar" (contrapresión) o "descartar"
+POLITICAS_COLA = ("esperar", "descartar")
+
+
 def configurar_logger(nombre: str = "GIC") -> logging.Logger:
     """Crea y retorna un logger configurado."""
     logger = logging.getLogger(nombre)
@@ -24,8 +51,8 @@ def configurar_logger(nombre: str = "GIC") -> logging.Logger:
     # --- Handler a archivo (TODO queda registrado) ---
     file_handler = RotatingFileHandler(
         ruta_log("app.log"),
-        maxBytes=300_000,
-        backupCount=3,
+        maxBytes=TAMANO_MAXIMO_LOG,
+        backupCount=RESPALDOS_LOG,
         encoding="utf-8",
     )
     file_handler.setLevel(logging.INFO)
@@ -35,7 +62,7 @@ def configurar_logger(nombre: str = "GIC") -> logging.Logger:
     console_handler.setLevel(logging.ERROR)
 
     formato = logging.Formatter(
-        "%(asctime)s - %(levelname)s - %(message)s"
+        FORMATO_LOG
     )
 
     file_handler.setFormatter(formato)
@@ -50,3 +77,254 @@ def configurar_logger(nombre: str = "GIC") -> logging.Logger:
 def obtener_logger(nombre: str = "GIC") -> logging.Logger:
     """Devuelve el logger del sistema."""
     return configurar_logger(nombre)
+
+
+# -------- Eventos estructurados (JSON) --------
+def evento(nombre: str, email: str | None = None, tipo: str | None = None,
+           duracion: float | None = None) -> dict:
+    """Datos de un evento para pasar como `extra` al logger.
+
+    Ej: logger.info("ALTA cliente email=%s", email, extra=evento("ALTA", email, "Premium"))
+    El formato de texto los ignora; el JSON los guarda como campos.
+    """
+    return {
+        "evento": nombre,
+        "email": email,
+        "tipo": tipo,
+        "duracion_ms": round(duracion * 1000, 3) if duracion is not None else None,
+    }
+
+
+class FormateadorJSON(logging.Formatter):
+    """Formatea cada registro como una línea JSON."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        mensaje = record.getMessage()
+        datos = {
+            "fecha": f"{self.formatTime(record, '%Y-%m-%dT%H:%M:%S')}.{int(record.msecs):03d}",
+            "nivel": record.levelname,
+            # Sin evento explícito se usa la primera palabra (ALTA, ERROR, ...).
+            "evento": getattr(record, "evento", None) or mensaje.split(" ", 1)[0],
+        }
+        for campo in ("email", "tipo", "duracion_ms"):
+            valor = getattr(record, campo, None)
+            if valor is not None:
+                datos[campo] = valor
+        datos["mensaje"] = mensaje
+        if record.exc_info:
+            datos["excepcion"] = self.formatException(record.exc_info)
+        return json.dumps(datos, ensure_ascii=False)
+
+
+_formatos_json = set()
+
+
+def _formateador_archivo(nombre: str) -> logging.Formatter:
+    return FormateadorJSON() if nombre in _formatos_json else logging.Formatter(FORMATO_LOG)
+
+
+def activar_formato_json(nombre: str = "GIC") -> logging.Logger:
+    """Hace que el archivo de log se escriba como líneas JSON."""
+    logger = configurar_logger(nombre)
+    _formatos_json.add(nombre)
+    for handler in logger.handlers:
+        if isinstance(handler, RotatingFileHandler):
+            handler.setFormatter(FormateadorJSON())
+    estado = _asincronos.get(nombre)
+    if estado is not None:
+        estado[2].setFormatter(FormateadorJSON())
+    return logger
+
+
+# -------- Modo asíncrono --------
+class ArchivoRotativoPorLotes(RotatingFileHandler):
+    """RotatingFileHandler que escribe varios registros con un solo flush.
+
+    En vez de consultar el tamaño del archivo por cada registro (como hace
+    shouldRollover), lo consulta una vez por lote y lo va sumando.
+
+    Como emit(), un error de escritura (disco lleno, archivo que no se
+    puede abrir) se informa con handleError y no se propaga: el hilo
+    escritor tiene que seguir vaciando la cola.
+    """
+
+    def escribir_lote(self, registros) -> None:
+        if not registros:
+            return
+        self.acquire()
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.seek(0, 2)
+            posicion = self.stream.tell()
+            for registro in registros:
+                try:
+                    linea = self.format(registro) + self.terminator
+                    if self.maxBytes > 0 and posicion + len(linea) >= self.maxBytes:
+                        self.doRollover()
+                        posicion = 0
+                    self.stream.write(linea)
+                    posicion += len(linea)
+                except Exception:
+                    self.handleError(registro)
+            self.stream.flush()
+        except Exception:
+            self.handleError(registros[0])
+        finally:
+            self.release()
+
+
+class ColaAcotadaHandler(QueueHandler):
+    """Encola registros en una cola de tamaño fijo.
+
+    Si la cola se llena, con la política "esperar" el que loguea se
+    bloquea hasta que haya lugar; con "descartar" el registro se pierde y
+    se cuenta en `descartados`. Los errores nunca se descartan.
+    """
+
+    def __init__(self, cola: queue.Queue, politica: str = "esperar"):
+        super().__init__(cola)
+        if politica not in POLITICAS_COLA:
+            raise ValueError(f"Política de cola inválida: {politica}")
+        self.politica = politica
+        self.descartados = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # QueueHandler copia y formatea cada registro en el hilo que loguea;
+        # aquí los argumentos son textos/números inmutables, así que el
+        # formateo se deja al hilo escritor (salvo si trae una excepción).
+        if record.exc_info:
+            return super().prepare(record)
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.politica == "esperar" or record.levelno >= logging.ERROR:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.descartados += 1
+
+
+class EscritorLog(threading.Thread):
+    """Hilo que vacía la cola y escribe los registros por lotes."""
+
+    _FIN = None
+
+    def __init__(self, nombre: str, cola: queue.Queue, destino: ArchivoRotativoPorLotes,
+                 encolador: ColaAcotadaHandler):
+        super().__init__(name="gic-log", daemon=True)
+        self.nombre = nombre
+        self.cola = cola
+        self.destino = destino
+        self.encolador = encolador
+        self._descartados_informados = 0
+
+    def run(self) -> None:
+        terminar = False
+        while not terminar:
+            lote = [self.cola.get()]
+            # Tomar lo que ya esté esperando, sin bloquear, hasta el máximo.
+            while len(lote) < REGISTROS_POR_LOTE:
+                try:
+                    lote.append(self.cola.get_nowait())
+                except queue.Empty:
+                    break
+            if self._FIN in lote:
+                terminar = True
+                lote = [r for r in lote if r is not self._FIN]
+
+            lote.extend(self._aviso_descartados())
+            if lote:
+                # Si este hilo muere, los que loguean quedan bloqueados en la cola.
+                try:
+                    self.destino.escribir_lote(lote)
+                except Exception:
+                    self.destino.handleError(lote[0])
+
+    def _aviso_descartados(self) -> list:
+        nuevos = self.encolador.descartados - self._descartados_informados
+        if nuevos <= 0:
+            return []
+        self._descartados_informados += nuevos
+        return [
+            logging.LogRecord(
+                self.nombre, logging.WARNING, __file__, 0,
+                "LOG: %s registros descartados (cola llena)", (nuevos,), None,
+            )
+        ]
+
+    def detener(self) -> None:
+        self.cola.put(self._FIN)
+        self.join()
+
+
+# Modo asíncrono activo por nombre de logger:
+# (encolador, escritor, archivo destino, handlers de archivo originales)
+_asincronos = {}
+
+
+def activar_log_asincrono(
+    nombre: str = "GIC",
+    capacidad: int = CAPACIDAD_COLA_LOG,
+    politica: str = "esperar",
+    ruta=None,
+) -> logging.Logger:
+    """Reemplaza la escritura directa al archivo por una cola + hilo escritor.
+
+    Los errores siguen saliendo por consola de inmediato. `ruta` permite
+    escribir en otro archivo (por defecto logs/app.log).
+    """
+    logger = configurar_logger(nombre)
+    if nombre in _asincronos:
+        return logger
+
+    originales = [h for h in logger.handlers if isinstance(h, RotatingFileHandler)]
+    for handler in originales:
+        logger.removeHandler(handler)
+        # Cerrar el archivo: el escritor puede rotarlo y, al volver al modo
+        # sincrónico, el handler lo reabre (modo "a") apuntando al actual.
+        handler.close()
+
+    destino = ArchivoRotativoPorLotes(
+        ruta or ruta_log("app.log"),
+        maxBytes=TAMANO_MAXIMO_LOG,
+        backupCount=RESPALDOS_LOG,
+        encoding="utf-8",
+    )
+    destino.setLevel(logging.INFO)
+    destino.setFormatter(_formateador_archivo(nombre))
+
+    cola = queue.Queue(maxsize=capacidad)
+    encolador = ColaAcotadaHandler(cola, politica)
+    encolador.setLevel(logging.INFO)
+    escritor = EscritorLog(nombre, cola, destino, encolador)
+    escritor.start()
+
+    logger.addHandler(encolador)
+    _asincronos[nombre] = (encolador, escritor, destino, originales)
+    return logger
+
+
+def detener_log_asincrono(nombre: str = "GIC") -> None:
+    """Escribe lo pendiente en la cola y vuelve al modo sincrónico."""
+    estado = _asincronos.pop(nombre, None)
+    if estado is None:
+        return
+    encolador, escritor, destino, originales = estado
+
+    logger = logging.getLogger(nombre)
+    logger.removeHandler(encolador)
+    escritor.detener()
+    destino.close()
+    for handler in originales:
+        logger.addHandler(handler)
+
+
+def _detener_todos() -> None:
+    for nombre in list(_asincronos):
+        detener_log_asincrono(nombre)
+
+
+atexit.register(_detener_todos)
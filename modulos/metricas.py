@@ -0,0 +1,399 @@
+"""modulos/metricas.py
+
+Instrumentación opcional del sistema: contadores por operación,
+histogramas de tiempos (y filas procesadas) y captura de perfiles con
+cProfile / tracemalloc.
+
+Está desactivada por defecto. Mientras lo esté, los métodos marcados con
+@instrumentar_metodo son los originales (las versiones medidas se
+instalan en la clase al activar) y las funciones con @instrumentar solo
+pagan una consulta a una variable global por llamada (o por lote, en la
+importación), así que todo puede quedar en el código:
+
+    activar_metricas()
+    importar_csv(gestor)
+    generar_reporte(gestor)
+    volcar_metricas()        # reportes/metricas_<fecha>.json y .txt
+
+Perfil de una operación puntual (independiente de las métricas):
+
+    with perfilar("importar", memoria=True) as archivos:
+        importar_csv(gestor)
+    print(archivos)          # reportes/perfil_importar_<fecha>.prof / .txt
+"""
+
+from __future__ import annotations
+
+import cProfile
+import functools
+import io
+import json
+import math
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+
+from modulos.cache_render import estado_cache_render
+from modulos.rutas import dir_reportes
+
+
+# Los histogramas agrupan los tiempos en cubetas logarítmicas de
+# microsegundos, 4 por cada potencia de 2 (de 1 µs a ~1 h): memoria fija y
+# un error de a lo sumo ~19% en los percentiles.
+CUBETAS_POR_OCTAVA = 4
+CUBETAS_HISTOGRAMA = 32 * CUBETAS_POR_OCTAVA
+# Funciones que se listan en el texto de un perfil
+LINEAS_PERFIL = 40
+LINEAS_MEMORIA = 25
+
+_activas = False
+# Métodos instrumentados: (clase, atributo, original, versión medida)
+_metodos = []
+
+
+class Histograma:
+    """Tiempos de una operación agrupados en cubetas logarítmicas."""
+
+    __slots__ = ("cantidad", "total", "minimo", "maximo", "filas", "_cubetas")
+
+    def __init__(self):
+        self.cantidad = 0
+        self.total = 0.0
+        self.minimo = None
+        self.maximo = 0.0
+        self.filas = 0
+        self._cubetas = [0] * CUBETAS_HISTOGRAMA
+
+    def observar(self, segundos: float, filas: int = 0) -> None:
+        self.cantidad += 1
+        self.total += segundos
+        self.filas += filas
+        if self.minimo is None or segundos < self.minimo:
+            self.minimo = segundos
+        if segundos > self.maximo:
+            self.maximo = segundos
+        micros = segundos * 1_000_000
+        cubeta = int(math.log2(micros) * CUBETAS_POR_OCTAVA) + 1 if micros >= 1 else 0
+        self._cubetas[min(CUBETAS_HISTOGRAMA - 1, cubeta)] += 1
+
+    def percentil(self, fraccion: float) -> float:
+        """Cota superior (en segundos) del percentil pedido."""
+        if not self.cantidad:
+            return 0.0
+        objetivo = fraccion * self.cantidad
+        acumulado = 0
+        for cubeta, cantidad in enumerate(self._cubetas):
+            acumulado += cantidad
+            if acumulado >= objetivo:
+                # La cubeta n junta los tiempos menores que 2^(n/4) µs.
+                return min(self.maximo, 2 ** (cubeta / CUBETAS_POR_OCTAVA) / 1_000_000)
+        return self.maximo
+
+    def a_dict(self) -> dict:
+        datos = {
+            "cantidad": self.cantidad,
+            "total_s": round(self.total, 6),
+            "promedio_ms": round(self.total / self.cantidad * 1000, 4) if self.cantidad else 0.0,
+            "min_ms": round((self.minimo or 0.0) * 1000, 4),
+            "p50_ms": round(self.percentil(0.50) * 1000, 4),
+            "p99_ms": round(self.percentil(0.99) * 1000, 4),
+            "max_ms": round(self.maximo * 1000, 4),
+        }
+        if self.filas:
+            datos["filas"] = self.filas
+            datos["filas_por_segundo"] = round(self.filas / self.total, 1) if self.total else None
+        return datos
+
+
+class _Registro:
+    """Contadores e histogramas acumulados desde que se activaron."""
+
+    def __init__(self):
+        self.candado = threading.Lock()
+        self.desde = None
+        self.contadores = {}
+        self.histogramas = {}
+
+    def reiniciar(self) -> None:
+        with self.candado:
+            self.desde = datetime.now()
+            self.contadores = {}
+            self.histogramas = {}
+
+
+_registro = _Registro()
+
+
+# -------- Activación --------
+def activar_metricas(reiniciar: bool = True) -> None:
+    """Empieza a acumular métricas (por defecto desde cero)."""
+    global _activas
+    if reiniciar or _registro.desde is None:
+        _registro.reiniciar()
+    _activas = True
+    for clase, atributo, _, medido in _metodos:
+        setattr(clase, atributo, medido)
+
+
+def desactivar_metricas() -> None:
+    """Deja de acumular; lo ya medido se conserva hasta reiniciar."""
+    global _activas
+    _activas = False
+    for clase, atributo, original, _ in _metodos:
+        setattr(clase, atributo, original)
+
+
+def metricas_activas() -> bool:
+    return _activas
+
+
+# -------- Registro de mediciones --------
+def contar(nombre: str, cantidad: int = 1) -> None:
+    """Suma `cantidad` al contador `nombre` (si las métricas están activas)."""
+    if not _activas:
+        return
+    with _registro.candado:
+        _registro.contadores[nombre] = _registro.contadores.get(nombre, 0) + cantidad
+
+
+def observar(nombre: str, segundos: float, filas: int = 0) -> None:
+    """Agrega un tiempo (y las filas que cubrió) al histograma `nombre`."""
+    if not _activas:
+        return
+    with _registro.candado:
+        histograma = _registro.histogramas.get(nombre)
+        if histograma is None:
+            histograma = _registro.histogramas[nombre] = Histograma()
+        histograma.observar(segundos, filas)
+
+
+def medir_lotes(nombre: str, lotes):
+    """Recorre `lotes` registrando cuánto tarda en producirse cada uno.
+
+    Sirve para medir la lectura/parseo de un generador de lotes sin
+    tocarlo: cada lote se observa en `nombre` con len(lote) filas.
+    """
+    reloj = time.perf_counter
+    iterador = iter(lotes)
+    while True:
+        inicio = reloj()
+        try:
+            lote = next(iterador)
+        except StopIteration:
+            return
+        observar(nombre, reloj() - inicio, len(lote))
+        yield lote
+
+
+def _medida(funcion, nombre: str):
+    """Versión de `funcion` que cuenta llamadas y errores y mide cada una."""
+    llamadas, errores = f"{nombre}.llamadas", f"{nombre}.errores"
+    reloj = time.perf_counter
+
+    @functools.wraps(funcion)
+    def medida(*args, **kwargs):
+        inicio = reloj()
+        fallo = True
+        try:
+            valor = funcion(*args, **kwargs)
+            fallo = False
+            return valor
+        finally:
+            segundos = reloj() - inicio
+            with _registro.candado:  # una sola vez por llamada
+                contadores = _registro.contadores
+                contadores[llamadas] = contadores.get(llamadas, 0) + 1
+                if fallo:
+                    contadores[errores] = contadores.get(errores, 0) + 1
+                histograma = _registro.histogramas.get(nombre)
+                if histograma is None:
+                    histograma = _registro.histogramas[nombre] = Histograma()
+                histograma.observar(segundos)
+
+    return medida
+
+
+def instrumentar(nombre: str):
+    """Decorador de funciones: contadores "<nombre>.llamadas" y
+    "<nombre>.errores" e histograma "<nombre>".
+
+    Desactivado, solo agrega la comprobación de la variable global; para
+    operaciones de microsegundos conviene instrumentar_metodo.
+    """
+    def decorador(funcion):
+        medida = _medida(funcion, nombre)
+
+        @functools.wraps(funcion)
+        def envoltura(*args, **kwargs):
+            if not _activas:
+                return funcion(*args, **kwargs)
+            return medida(*args, **kwargs)
+
+        return envoltura
+
+    return decorador
+
+
+class _MetodoInstrumentado:
+    """Marca de instrumentar_metodo: al crearse la clase deja el original."""
+
+    def __init__(self, funcion, nombre: str):
+        self.funcion = funcion
+        self.nombre = nombre
+
+    def __set_name__(self, clase, atributo: str) -> None:
+        setattr(clase, atributo, self.funcion)
+        medido = _medida(self.funcion, self.nombre)
+        _metodos.append((clase, atributo, self.funcion, medido))
+        if _activas:
+            setattr(clase, atributo, medido)
+
+
+def instrumentar_metodo(nombre: str):
+    """Como instrumentar, para métodos y sin ningún costo desactivado.
+
+    La clase conserva el método original; activar_metricas() lo reemplaza
+    por la versión medida y desactivar_metricas() lo restituye.
+    """
+    def decorador(funcion):
+        return _MetodoInstrumentado(funcion, nombre)
+
+    return decorador
+
+
+# -------- Lectura y volcado --------
+def instantanea_metricas() -> dict:
+    """Copia de las métricas acumuladas, lista para serializar."""
+    with _registro.candado:
+        return {
+            "fecha": datetime.now().isoformat(timespec="seconds"),
+            "desde": _registro.desde.isoformat(timespec="seconds") if _registro.desde else None,
+            "activas": _activas,
+            "contadores": dict(sorted(_registro.contadores.items())),
+            "histogramas": {
+                nombre: histograma.a_dict()
+                for nombre, histograma in sorted(_registro.histogramas.items())
+            },
+            "cache_render": estado_cache_render(),
+        }
+
+
+def texto_metricas(datos: dict) -> str:
+    """Versión legible de instantanea_metricas()."""
+    lineas = [
+        "MÉTRICAS GIC",
+        "============",
+        f"Desde: {datos['desde'] or '-'}   Hasta: {datos['fecha']}",
+        "",
+        "CONTADORES",
+        "----------",
+    ]
+    lineas += [f"{nombre:<40} {valor:>12,}" for nombre, valor in datos["contadores"].items()]
+    lineas += [
+        "",
+        "TIEMPOS (ms)",
+        "------------",
+        f"{'operación':<32} {'n':>8} {'total s':>9} {'p50':>9} {'p99':>9} {'máx':>9} {'filas/s':>11}",
+    ]
+    for nombre, h in datos["histogramas"].items():
+        velocidad = f"{h['filas_por_segundo']:,.0f}" if h.get("filas_por_segundo") else "-"
+        lineas.append(
+            f"{nombre:<32} {h['cantidad']:>8} {h['total_s']:>9.3f} {h['p50_ms']:>9.3f} "
+            f"{h['p99_ms']:>9.3f} {h['max_ms']:>9.3f} {velocidad:>11}"
+        )
+    cache = datos.get("cache_render")
+    if cache:
+        lineas += [
+            "",
+            "CACHÉ DE TEXTOS (mostrar_info / filas CSV)",
+            "------------------------------------------",
+            f"aciertos={cache['aciertos']:,} fallos={cache['fallos']:,} descartes={cache['descartes']:,} "
+            f"clientes={cache['clientes']:,} "
+            f"memoria={cache['bytes'] / 2**20:.1f}/{cache['max_bytes'] / 2**20:.0f} MB",
+        ]
+    return "\n".join(lineas) + "\n"
+
+
+def _marca() -> str:
+    return datetime.now().strftime("%Y%m%d_%H%M%S")
+
+
+def volcar_metricas(nombre: str = "metricas", carpeta: Path | str | None = None) -> tuple[Path, Path]:
+    """Guarda las métricas en reportes/ como JSON y texto; retorna ambas rutas."""
+    carpeta = Path(carpeta) if carpeta else dir_reportes()
+    carpeta.mkdir(parents=True, exist_ok=True)
+    datos = instantanea_metricas()
+    base = carpeta / f"{nombre}_{_marca()}"
+    ruta_json, ruta_txt = base.with_suffix(".json"), base.with_suffix(".txt")
+    ruta_json.write_text(json.dumps(datos, ensure_ascii=False, indent=2), encoding="utf-8")
+    ruta_txt.write_text(texto_metricas(datos), encoding="utf-8")
+    return ruta_json, ruta_txt
+
+
+# -------- Perfiles --------
+@contextmanager
+def perfilar(nombre: str, cpu: bool = True, memoria: bool = False, carpeta: Path | str | None = None):
+    """Perfila el bloque con cProfile y/o tracemalloc y guarda el resultado.
+
+    Entrega una lista que, al salir del bloque, contiene las rutas
+    escritas: perfil_<nombre>_<fecha>.prof (para pstats/snakeviz) y
+    perfil_<nombre>_<fecha>.txt (funciones más costosas y, con `memoria`,
+    las líneas que más memoria asignaron).
+    """
+    archivos = []
+    perfil = cProfile.Profile() if cpu else None
+    trazando = memoria and not tracemalloc.is_tracing()
+    if trazando:
+        tracemalloc.start()
+    inicio = time.perf_counter()
+    if perfil is not None:
+        perfil.enable()
+    try:
+        yield archivos
+    finally:
+        if perfil is not None:
+            perfil.disable()
+        segundos = time.perf_counter() - inicio
+        captura = tracemalloc.take_snapshot() if memoria and tracemalloc.is_tracing() else None
+        pico = tracemalloc.get_traced_memory()[1] if captura is not None else None
+        if trazando:
+            tracemalloc.stop()
+        archivos.extend(_guardar_perfil(nombre, segundos, perfil, captura, pico, carpeta))
+
+
+def perfil_opcional(nombre: str, modo: str | None):
+    """perfilar() según un modo "cpu", "memoria" o "ambos"; sin modo, no hace nada."""
+    if not modo:
+        return nullcontext([])
+    return perfilar(nombre, cpu=modo in ("cpu", "ambos"), memoria=modo in ("memoria", "ambos"))
+
+
+def _guardar_perfil(nombre, segundos, perfil, captura, pico, carpeta) -> list[Path]:
+    carpeta = Path(carpeta) if carpeta else dir_reportes()
+    carpeta.mkdir(parents=True, exist_ok=True)
+    base = carpeta / f"perfil_{nombre}_{_marca()}"
+    texto = io.StringIO()
+    texto.write(f"PERFIL: {nombre}\nDuración: {segundos:.3f} s\n")
+    archivos = []
+
+    if perfil is not None:
+        ruta_prof = base.with_suffix(".prof")
+        perfil.dump_stats(ruta_prof)
+        archivos.append(ruta_prof)
+        texto.write(f"\nCPU (cProfile, {LINEAS_PERFIL} funciones por tiempo acumulado)\n\n")
+        pstats.Stats(perfil, stream=texto).sort_stats("cumulative").print_stats(LINEAS_PERFIL)
+
+    if captura is not None:
+        texto.write(f"\nMEMORIA (tracemalloc) pico: {pico / 1e6:.1f} MB\n")
+        texto.write(f"Líneas con más memoria asignada al terminar ({LINEAS_MEMORIA}):\n\n")
+        for estadistica in captura.statistics("lineno")[:LINEAS_MEMORIA]:
+            texto.write(f"{estadistica}\n")
+
+    ruta_txt = base.with_suffix(".txt")
+    ruta_txt.write_text(texto.getvalue(), encoding="utf-8")
+    archivos.append(ruta_txt)
+    return archivos
@@ -0,0 +1,487 @@
+"""modulos/servidor.py
+
+API HTTP/JSON para consultar y modificar clientes desde otros sistemas,
+hecha solo con la biblioteca estándar (asyncio). Atiende muchas
+conexiones en un único hilo; el gestor (un GestorConcurrente) se usa
+desde hilos auxiliares de lectura, escritura e importación, para que una
+importación grande no frene las consultas.
+
+    GET    /clientes/<email>          cliente o 404
+    GET    /clientes?tipo=&texto=&telefono=&prefijo=&pagina=&por_pagina=
+    POST   /clientes                  {"tipo", "nombre", "email", "telefono", "direccion"} -> 201
+    PUT    /clientes/<email>          campos a cambiar (nombre, telefono, direccion, tipo)
+    DELETE /clientes/<email>
+    POST   /importar                  CSV (text/csv) o lista JSON de clientes
+    GET    /conteo                    clientes por tipo
+    GET    /estado                    estadísticas del servidor
+
+Las búsquedas por email se agrupan: las que llegan mientras otra tanda
+está en curso se resuelven juntas en una sola llamada (buscar_varios) y
+las repetidas de un mismo email se atienden con una única búsqueda. Las
+escrituras se encolan y se aplican en orden, varias por viaje al hilo de
+escritura; las importaciones corren en un hilo propio, lote por lote.
+Una escritura terminada nunca se pierde de vista: una búsqueda que llega
+después no se suma a una tanda anterior a ella.
+
+    python cli.py servir --puerto 8080
+    curl localhost:8080/clientes/ana@correo.cl
+"""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import io
+import json
+import signal
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from http import HTTPStatus
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from modulos.archivos import COLUMNAS_CSV, importar_csv
+from modulos.concurrencia import GestorConcurrente
+from modulos.excepciones import (
+    ClienteExistenteError,
+    ClienteNoEncontradoError,
+    GICError,
+    TipoClienteInvalidoError,
+    ValidacionError,
+)
+from modulos.logger_config import obtener_logger
+from modulos.tipos_cliente import crear_cliente
+from modulos.validaciones import normalizar_email, validar_direccion, validar_email, validar_telefono
+
+
+logger = obtener_logger()
+
+HOST = "127.0.0.1"
+PUERTO = 8080
+# Tamaño máximo del cuerpo de una petición (una importación por /importar)
+MAX_CUERPO = 64 * 1024 * 1024
+MAX_CABECERA = 16 * 1024
+# Rechazos que se detallan en la respuesta de /importar
+MAX_DETALLE = 10
+
+_CODIGOS_ERROR = (
+    (ClienteNoEncontradoError, HTTPStatus.NOT_FOUND),
+    (ClienteExistenteError, HTTPStatus.CONFLICT),
+    (ValidacionError, HTTPStatus.BAD_REQUEST),
+    (TipoClienteInvalidoError, HTTPStatus.BAD_REQUEST),
+)
+
+
+class ErrorHTTP(Exception):
+    """Petición que se responde con un código de error y un mensaje."""
+
+    def __init__(self, estado: HTTPStatus, mensaje: str):
+        super().__init__(mensaje)
+        self.estado = estado
+
+
+@dataclass
+class EstadisticasServidor:
+    peticiones: int = 0
+    errores: int = 0
+    busquedas: int = 0
+    # Búsquedas atendidas con el resultado de otra del mismo email
+    coalescidas: int = 0
+    tandas_busqueda: int = 0
+    escrituras: int = 0
+    tandas_escritura: int = 0
+
+
+def cliente_a_json(cliente) -> dict:
+    return {
+        "tipo": cliente.tipo(),
+        "nombre": cliente.nombre,
+        "email": cliente.email,
+        "telefono": cliente.telefono,
+        "direccion": cliente.direccion,
+    }
+
+
+def _texto(datos: dict, campo: str, obligatorio: bool = True) -> str | None:
+    valor = datos.get(campo)
+    if valor is None and not obligatorio:
+        return None
+    if not isinstance(valor, str):
+        raise ErrorHTTP(HTTPStatus.BAD_REQUEST, f"Falta el campo de texto '{campo}'.")
+    return valor
+
+
+def _cliente_nuevo(datos: dict):
+    """Cliente validado a partir del JSON de un alta."""
+    if not isinstance(datos, dict):
+        raise ErrorHTTP(HTTPStatus.BAD_REQUEST, "Se esperaba un objeto JSON.")
+    nombre, email, telefono, direccion, tipo = (
+        _texto(datos, campo) for campo in ("nombre", "email", "telefono", "direccion", "tipo")
+    )
+    validar_email(email)
+    validar_telefono(telefono)
+    validar_direccion(direccion)
+    return crear_cliente(tipo, nombre, email, telefono, direccion)
+
+
+def _csv_desde_json(clientes) -> io.StringIO:
+    """Lista JSON de clientes como CSV, para importarla con las mismas reglas."""
+    if not isinstance(clientes, list):
+        raise ErrorHTTP(HTTPStatus.BAD_REQUEST, "Se esperaba una lista de clientes.")
+    texto = io.StringIO(newline="")
+    escritor = csv.writer(texto)
+    escritor.writerow(COLUMNAS_CSV)
+    for datos in clientes:
+        if not isinstance(datos, dict):
+            raise ErrorHTTP(HTTPStatus.BAD_REQUEST, "Cada cliente debe ser un objeto JSON.")
+        escritor.writerow([datos.get(campo) or "" for campo in COLUMNAS_CSV])
+    texto.seek(0)
+    return texto
+
+
+class ServidorClientes:
+    """Atiende la API HTTP/JSON sobre un gestor compartido entre hilos."""
+
+    def __init__(self, gestor: GestorConcurrente):
+        if not isinstance(gestor, GestorConcurrente):
+            raise TypeError("El servidor necesita un GestorConcurrente (modulos/concurrencia.py).")
+        self.gestor = gestor
+        self.estadisticas = EstadisticasServidor()
+        self._hilo_lectura = ThreadPoolExecutor(1, thread_name_prefix="gic-lectura")
+        self._hilo_escritura = ThreadPoolExecutor(1, thread_name_prefix="gic-escritura")
+        # Las importaciones van aparte: toman el candado lote por lote y las
+        # altas o cambios sueltos se intercalan en vez de esperar al final.
+        self._hilo_importacion = ThreadPoolExecutor(1, thread_name_prefix="gic-importacion")
+        # Búsquedas: email normalizado -> futuros que esperan ese cliente
+        self._por_buscar: dict[str, list] = {}
+        self._buscando: dict[str, list] = {}
+        self._tarea_busqueda = None
+        # Escrituras encoladas: (función, argumentos, futuro)
+        self._por_escribir: list = []
+        self._tarea_escritura = None
+        self._conexiones: set[asyncio.StreamWriter] = set()
+
+    # -------- Búsquedas agrupadas --------
+    def buscar(self, email: str) -> asyncio.Future:
+        """Futuro con el cliente de ese email (o None)."""
+        clave = normalizar_email(email)
+        futuro = asyncio.get_running_loop().create_future()
+        self.estadisticas.busquedas += 1
+        esperando = self._buscando.get(clave) or self._por_buscar.get(clave)
+        if esperando is not None:
+            esperando.append(futuro)
+            self.estadisticas.coalescidas += 1
+        else:
+            self._por_buscar[clave] = [futuro]
+        if self._tarea_busqueda is None:
+            self._tarea_busqueda = asyncio.create_task(self._resolver_busquedas())
+        return futuro
+
+    async def _resolver_busquedas(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while self._por_buscar:
+                tanda = self._buscando = self._por_buscar
+                self._por_buscar = {}
+                self.estadisticas.tandas_busqueda += 1
+                try:
+                    encontrados = await loop.run_in_executor(
+                        self._hilo_lectura, self.gestor.buscar_varios, list(tanda)
+                    )
+                except Exception as exc:
+                    for futuros in tanda.values():
+                        _fallar(futuros, exc)
+                    continue
+                finally:
+                    self._buscando = {}
+                for clave, futuros in tanda.items():
+                    cliente = encontrados.get(clave)
+                    for futuro in futuros:
+                        if not futuro.done():
+                            futuro.set_result(cliente)
+        finally:
+            self._tarea_busqueda = None
+
+    # -------- Escrituras en cola --------
+    def escribir(self, funcion, *argumentos) -> asyncio.Future:
+        """Encola una operación del gestor para el hilo de escritura."""
+        futuro = asyncio.get_running_loop().create_future()
+        self._por_escribir.append((funcion, argumentos, futuro))
+        if self._tarea_escritura is None:
+            self._tarea_escritura = asyncio.create_task(self._aplicar_escrituras())
+        return futuro
+
+    async def _aplicar_escrituras(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while self._por_escribir:
+                tanda, self._por_escribir = self._por_escribir, []
+                self.estadisticas.tandas_escritura += 1
+                self.estadisticas.escrituras += len(tanda)
+                resultados = await loop.run_in_executor(self._hilo_escritura, _ejecutar_tanda, tanda)
+                # Lo buscado antes de esta escritura ya no sirve a quien pregunte después.
+                self._buscando = {}
+                for (_, _, futuro), (error, valor) in zip(tanda, resultados):
+                    if futuro.done():
+                        continue
+                    if error:
+                        futuro.set_exception(valor)
+                    else:
+                        futuro.set_result(valor)
+        finally:
+            self._tarea_escritura = None
+
+    def leer(self, funcion, *argumentos) -> asyncio.Future:
+        """Ejecuta una consulta del gestor en el hilo de lectura."""
+        return asyncio.get_running_loop().run_in_executor(self._hilo_lectura, funcion, *argumentos)
+
+    # -------- Rutas --------
+    async def despachar(self, metodo: str, ruta: str, parametros: dict, cuerpo: bytes, tipo_contenido: str):
+        """Retorna (estado, datos JSON) de una petición."""
+        partes = [unquote(parte) for parte in ruta.strip("/").split("/")]
+        recurso = partes[0]
+        if recurso == "clientes" and len(partes) == 2:
+            return await self._cliente(metodo, partes[1], cuerpo)
+        if recurso == "clientes" and len(partes) == 1:
+            if metodo == "GET":
+                return HTTPStatus.OK, await self._listar(parametros)
+            if metodo == "POST":
+                cliente = _cliente_nuevo(_json(cuerpo))
+                await self.escribir(self.gestor.agregar_cliente, cliente)
+                return HTTPStatus.CREATED, cliente_a_json(cliente)
+            raise _metodo_no_permitido(metodo)
+        if recurso == "importar" and len(partes) == 1:
+            if metodo != "POST":
+                raise _metodo_no_permitido(metodo)
+            return HTTPStatus.OK, await self._importar(cuerpo, tipo_contenido)
+        if recurso == "conteo" and len(partes) == 1 and metodo == "GET":
+            return HTTPStatus.OK, await self.leer(self.gestor.contar_por_tipo)
+        if recurso == "estado" and len(partes) == 1 and metodo == "GET":
+            datos = asdict(self.estadisticas)
+            # len() toma el candado de lectura: durante una escritura esperaría.
+            datos["clientes"] = await self.leer(len, self.gestor)
+            return HTTPStatus.OK, datos
+        raise ErrorHTTP(HTTPStatus.NOT_FOUND, f"Ruta desconocida: {ruta}")
+
+    async def _cliente(self, metodo: str, email: str, cuerpo: bytes):
+        if metodo == "GET":
+            cliente = await self.buscar(email)
+            if cliente is None:
+                raise ClienteNoEncontradoError(f"Cliente no encontrado: {email}")
+            return HTTPStatus.OK, cliente_a_json(cliente)
+        if metodo == "PUT":
+            datos = _json(cuerpo)
+            if not isinstance(datos, dict):
+                raise ErrorHTTP(HTTPStatus.BAD_REQUEST, "Se esperaba un objeto JSON.")
+            if "email" in datos and normalizar_email(str(datos["email"])) != normalizar_email(email):
+                raise ErrorHTTP(HTTPStatus.BAD_REQUEST, "El email no se puede modificar.")
+            campos = {
+                campo: _texto(datos, campo, obligatorio=False)
+                for campo in ("nombre", "telefono", "direccion", "tipo")
+            }
+            cliente = await self.escribir(self.gestor.actualizar_cliente, email, *campos.values())
+            return HTTPStatus.OK, cliente_a_json(cliente)
+        if metodo == "DELETE":
+            cliente = await self.escribir(self.gestor.eliminar_por_email, email)
+            return HTTPStatus.OK, cliente_a_json(cliente)
+        raise _metodo_no_permitido(metodo)
+
+    async def _listar(self, parametros: dict) -> dict:
+        try:
+            pagina = int(parametros.get("pagina", 1))
+            por_pagina = min(int(parametros.get("por_pagina", 20)), 1_000)
+        except ValueError:
+            raise ErrorHTTP(HTTPStatus.BAD_REQUEST, "pagina y por_pagina deben ser números.") from None
+        filtros = {campo: parametros.get(campo) for campo in ("tipo", "telefono", "texto", "prefijo")}
+        resultado = await self.leer(
+            lambda: self.gestor.consultar(pagina=pagina, por_pagina=por_pagina, **filtros)
+        )
+        return {
+            "clientes": [cliente_a_json(cliente) for cliente in resultado.clientes],
+            "total": resultado.total,
+            "pagina": resultado.pagina,
+            "por_pagina": resultado.por_pagina,
+            "total_paginas": resultado.total_paginas,
+        }
+
+    async def _importar(self, cuerpo: bytes, tipo_contenido: str) -> dict:
+        if tipo_contenido.startswith("application/json"):
+            entrada = _csv_desde_json(_json(cuerpo))
+        else:
+            entrada = io.StringIO(_decodificar(cuerpo), newline="")
+        loop = asyncio.get_running_loop()
+        self.estadisticas.escrituras += 1
+        resultado = await loop.run_in_executor(self._hilo_importacion, importar_csv, self.gestor, entrada)
+        self._buscando = {}
+        return {
+            "filas_leidas": resultado.filas_leidas,
+            "agregados": resultado.agregados,
+            "duplicados": resultado.duplicados,
+            "rechazados": resultado.total_rechazados,
+            "segundos": round(resultado.segundos, 3),
+            "detalle_rechazados": [
+                {"linea": r.linea, "motivo": r.motivo} for r in resultado.rechazados[:MAX_DETALLE]
+            ],
+        }
+
+    # -------- HTTP --------
+    async def atender(self, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter) -> None:
+        """Atiende las peticiones de una conexión (HTTP/1.1 con keep-alive)."""
+        self._conexiones.add(escritor)
+        try:
+            while True:
+                try:
+                    cabecera = await lector.readuntil(b"\r\n\r\n")
+                except asyncio.IncompleteReadError:
+                    break
+                except asyncio.LimitOverrunError:
+                    escritor.write(_error(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Cabecera muy grande."))
+                    break
+                mantener = await self._peticion(lector, escritor, cabecera)
+                await escritor.drain()
+                if not mantener:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass  # el cliente cortó a mitad de una petición
+        finally:
+            self._conexiones.discard(escritor)
+            escritor.close()
+
+    async def _peticion(self, lector, escritor, cabecera: bytes) -> bool:
+        """Lee el cuerpo, responde y retorna si la conexión sigue abierta."""
+        self.estadisticas.peticiones += 1
+        try:
+            linea, *lineas = cabecera.decode("latin-1").split("\r\n")
+            metodo, objetivo, version = linea.split(" ")
+            cabeceras = {}
+            for texto in lineas:
+                if texto:
+                    nombre, _, valor = texto.partition(":")
+                    cabeceras[nombre.strip().lower()] = valor.strip()
+            largo = cabeceras.get("content-length", "0")
+            if not largo.isdecimal():  # int() aceptaría "-1", "+1" o "1_0"
+                raise ValueError(largo)
+            largo = int(largo)
+        except ValueError:
+            self.estadisticas.errores += 1
+            escritor.write(_error(HTTPStatus.BAD_REQUEST, "Petición HTTP inválida."))
+            return False
+        if "transfer-encoding" in cabeceras:
+            # Solo se lee el cuerpo por Content-Length: uno por partes (chunked)
+            # se tomaría como la petición siguiente de la conexión.
+            self.estadisticas.errores += 1
+            escritor.write(_error(HTTPStatus.LENGTH_REQUIRED, "Envíe el cuerpo con Content-Length."))
+            return False
+        if largo > MAX_CUERPO:
+            self.estadisticas.errores += 1
+            escritor.write(_error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Cuerpo muy grande."))
+            return False
+        cuerpo = await lector.readexactly(largo) if largo else b""
+        mantener = version == "HTTP/1.1" and cabeceras.get("connection", "").lower() != "close"
+
+        url = urlsplit(objetivo)
+        try:
+            estado, datos = await self.despachar(
+                metodo, url.path, dict(parse_qsl(url.query)), cuerpo, cabeceras.get("content-type", "")
+            )
+        except ErrorHTTP as exc:
+            estado, datos = exc.estado, {"error": str(exc)}
+        except GICError as exc:
+            estado = next(
+                (codigo for tipo, codigo in _CODIGOS_ERROR if isinstance(exc, tipo)), HTTPStatus.BAD_REQUEST
+            )
+            datos = {"error": str(exc)}
+        except Exception as exc:
+            logger.error("ERROR servidor %s %s: %s", metodo, objetivo, exc)
+            estado, datos = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Error interno del servidor."}
+        if estado >= 400:
+            self.estadisticas.errores += 1
+        escritor.write(_respuesta(estado, datos, mantener))
+        return mantener
+
+    async def iniciar(self, host: str = HOST, puerto: int = PUERTO) -> asyncio.AbstractServer:
+        servidor = await asyncio.start_server(self.atender, host, puerto, limit=MAX_CABECERA)
+        logger.info("SERVIDOR escuchando en http://%s:%s", host, puerto)
+        return servidor
+
+    def cerrar(self) -> None:
+        """Corta las conexiones abiertas y espera la escritura en curso."""
+        for escritor in list(self._conexiones):
+            escritor.close()
+        self._hilo_lectura.shutdown()
+        self._hilo_escritura.shutdown()
+        self._hilo_importacion.shutdown()
+
+
+def _ejecutar_tanda(tanda) -> list[tuple[bool, object]]:
+    """Aplica en orden las escrituras de una tanda: (hubo error, resultado)."""
+    resultados = []
+    for funcion, argumentos, _ in tanda:
+        try:
+            resultados.append((False, funcion(*argumentos)))
+        except Exception as exc:
+            resultados.append((True, exc))
+    return resultados
+
+
+def _fallar(futuros, exc: Exception) -> None:
+    for futuro in futuros:
+        if not futuro.done():
+            futuro.set_exception(exc)
+
+
+def _metodo_no_permitido(metodo: str) -> ErrorHTTP:
+    return ErrorHTTP(HTTPStatus.METHOD_NOT_ALLOWED, f"Método no permitido: {metodo}")
+
+
+def _decodificar(cuerpo: bytes) -> str:
+    try:
+        return cuerpo.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise ErrorHTTP(HTTPStatus.BAD_REQUEST, "El cuerpo debe estar en UTF-8.") from None
+
+
+def _json(cuerpo: bytes):
+    try:
+        return json.loads(_decodificar(cuerpo))
+    except json.JSONDecodeError as exc:
+        raise ErrorHTTP(HTTPStatus.BAD_REQUEST, f"JSON inválido: {exc.msg}") from None
+
+
+def _error(estado: HTTPStatus, mensaje: str) -> bytes:
+    """Respuesta de error que además cierra la conexión."""
+    return _respuesta(estado, {"error": mensaje}, mantener=False)
+
+
+def _respuesta(estado: HTTPStatus, datos, mantener: bool) -> bytes:
+    cuerpo = json.dumps(datos, ensure_ascii=False).encode("utf-8")
+    cabecera = (
+        f"HTTP/1.1 {estado.value} {estado.phrase}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(cuerpo)}\r\n"
+        + ("" if mantener else "Connection: close\r\n")
+        + "\r\n"
+    )
+    return cabecera.encode("latin-1") + cuerpo
+
+
+async def servir(gestor, host: str = HOST, puerto: int = PUERTO) -> None:
+    """Atiende la API hasta Ctrl+C o SIGTERM."""
+    servidor_clientes = ServidorClientes(gestor)
+    servidor = await servidor_clientes.iniciar(host, puerto)
+    inicio = time.perf_counter()
+    parada = asyncio.Event()
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, parada.set)
+    except (NotImplementedError, AttributeError):
+        pass  # Windows: solo Ctrl+C
+    try:
+        await parada.wait()
+    finally:
+        servidor.close()
+        servidor_clientes.cerrar()
+        estadisticas = servidor_clientes.estadisticas
+        logger.info(
+            "SERVIDOR detenido: peticiones=%s escrituras=%s (%.0f s)",
+            estadisticas.peticiones, estadisticas.escrituras, time.perf_counter() - inicio,
+        )
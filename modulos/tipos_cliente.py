@@ -0,0 +1,155 @@
+"""modulos/tipos_cliente.py
+
+Registro de tipos de cliente: qué subclase de Cliente corresponde a
+cada tipo y con qué nombres se lo acepta ("premium", "ClientePremium",
+alias extra...).
+
+Para agregar un nivel nuevo basta con definir la subclase y registrarla
+al importar su módulo, sin tocar GestorClientes:
+
+    class ClienteOro(Cliente):
+        __slots__ = ()
+
+        def tipo(self) -> str:
+            return "Oro"
+
+    registrar_tipo(ClienteOro, "Oro", alias=("gold",))
+
+El registro es por proceso: el módulo que registra el tipo debe
+importarse también en los procesos de la importación en paralelo.
+"""
+
+from __future__ import annotations
+
+from itertools import starmap
+
+from modulos.cliente import Cliente
+from modulos.cliente_corporativo import ClienteCorporativo
+from modulos.cliente_premium import ClientePremium
+from modulos.cliente_regular import ClienteRegular
+from modulos.excepciones import TipoClienteInvalidoError
+
+
+# Tipo (nombre en minúsculas) -> subclase de Cliente
+_clases = {}
+# Alias aceptado (en minúsculas) -> tipo. Se expone (solo para leer) para
+# la validación por lotes; ambos reflejan los tipos registrados después.
+ALIAS_TIPO = {}
+TIPOS_VALIDOS = _clases.keys()
+# Tipo -> nombre que devuelve cliente.tipo() ("Premium")
+_nombres = {}
+# Tipo -> código de un byte usado en la instantánea binaria
+_codigos = {}
+_tipos_por_codigo = {}
+
+
+def registrar_tipo(clase: type, nombre: str, alias=(), codigo: int | None = None) -> type:
+    """Registra `clase` como el tipo `nombre` (el mismo que retorna tipo()).
+
+    Además de `nombre` se aceptan el nombre de la clase y los `alias`, sin
+    importar mayúsculas. `codigo` identifica el tipo en la instantánea
+    binaria; si se omite se usa el siguiente libre, así que conviene
+    fijarlo para tipos que se guardan en archivos.
+    """
+    if not (isinstance(clase, type) and issubclass(clase, Cliente)):
+        raise TypeError(f"{clase!r} no es una subclase de Cliente")
+    tipo = nombre.strip().lower()
+    if codigo is None:
+        codigo = _codigos.get(tipo) or max(_tipos_por_codigo, default=0) + 1
+    if not 0 < codigo < 256:
+        raise ValueError("El código de tipo debe estar entre 1 y 255.")
+    if _tipos_por_codigo.get(codigo, tipo) != tipo:
+        raise ValueError(f"El código {codigo} ya está asignado al tipo {_tipos_por_codigo[codigo]}.")
+
+    anterior = _codigos.get(tipo)
+    if anterior is not None and anterior != codigo:
+        del _tipos_por_codigo[anterior]
+    _clases[tipo] = clase
+    _nombres[tipo] = nombre.strip()
+    _codigos[tipo] = codigo
+    _tipos_por_codigo[codigo] = tipo
+    for texto in (tipo, clase.__name__, *alias):
+        ALIAS_TIPO[texto.strip().lower()] = tipo
+    return clase
+
+
+def tipos_registrados() -> tuple[str, ...]:
+    """Tipos aceptados, en minúsculas y en orden de registro."""
+    return tuple(_clases)
+
+
+def _invalido() -> TipoClienteInvalidoError:
+    return TipoClienteInvalidoError(
+        f"Tipo de cliente inválido. Use: {' / '.join(_clases)}"
+    )
+
+
+def normalizar_tipo(tipo: str) -> str:
+    """Lleva cualquier alias a su tipo ("ClientePremium" -> "premium").
+
+    Un texto desconocido se devuelve en minúsculas (no es un tipo válido).
+    """
+    tipo = (tipo or "").strip().lower()
+    return ALIAS_TIPO.get(tipo, tipo)
+
+
+def nombre_tipo(tipo: str) -> str:
+    """Nombre que muestra cliente.tipo() para un tipo o alias ("premium" -> "Premium")."""
+    tipo = normalizar_tipo(tipo)
+    return _nombres.get(tipo) or tipo.capitalize()
+
+
+def clase_tipo(tipo: str) -> type:
+    """Subclase de Cliente para un tipo o alias; TipoClienteInvalidoError si no existe."""
+    # Camino rápido: el tipo ya viene normalizado (importación, validar_lote).
+    clase = _clases.get(tipo)
+    if clase is None:
+        clase = _clases.get(normalizar_tipo(tipo))
+        if clase is None:
+            raise _invalido()
+    return clase
+
+
+def crear_cliente(tipo: str, nombre: str, email: str, telefono: str, direccion: str) -> Cliente:
+    """Crea un cliente de la subclase que corresponde al tipo indicado."""
+    return clase_tipo(tipo)(nombre, email, telefono, direccion)
+
+
+def crear_clientes(filas, tipo: str | None = None) -> list[Cliente]:
+    """Crea muchos clientes de una vez.
+
+    Con `tipo`, cada fila es (nombre, email, telefono, direccion) y la
+    clase se resuelve una sola vez. Sin `tipo`, cada fila trae el tipo
+    primero: (tipo, nombre, email, telefono, direccion).
+    """
+    if tipo is not None:
+        return list(starmap(clase_tipo(tipo), filas))
+
+    clases = {}  # tipo tal como viene -> clase, para no repetir la búsqueda
+    clientes = []
+    for tipo_fila, nombre, email, telefono, direccion in filas:
+        clase = clases.get(tipo_fila)
+        if clase is None:
+            clase = clases[tipo_fila] = clase_tipo(tipo_fila)
+        clientes.append(clase(nombre, email, telefono, direccion))
+    return clientes
+
+
+def codigo_tipo(tipo: str) -> int:
+    """Código de un byte del tipo (para la instantánea binaria)."""
+    return _codigos[normalizar_tipo(tipo)]
+
+
+def tipo_por_codigo(codigo: int) -> str:
+    """Nombre para mostrar del tipo guardado con ese código."""
+    try:
+        return _nombres[_tipos_por_codigo[codigo]]
+    except KeyError:
+        raise TipoClienteInvalidoError(f"Código de tipo desconocido: {codigo}") from None
+
+
+# Tipos incluidos en el sistema (los códigos quedan fijos por compatibilidad
+# con las instantáneas ya guardadas).
+registrar_tipo(ClienteRegular, "Regular", codigo=1)
+registrar_tipo(ClientePremium, "Premium", codigo=2)
+registrar_tipo(ClienteCorporativo, "Corporativo", codigo=3)
@@ -1,18 +1,36 @@
 """validaciones.py
 
 Funciones de validación y normalización de datos de clientes.
+
+Las funciones validar_* revisan un valor y levantan ValidacionError;
+validar_lote revisa columnas completas y retorna máscaras y códigos de
+error, pensado para importaciones y ediciones masivas.
 """
 
+from __future__ import annotations
+
 import re
+from dataclasses import dataclass
 
 from .excepciones import ValidacionError
+from .tipos_cliente import ALIAS_TIPO, TIPOS_VALIDOS, normalizar_tipo
+
+
+# Tipos aceptados (TIPOS_VALIDOS) y sus variantes ("ClientePremium" ->
+# "premium"): vienen del registro de tipos_cliente.py y reflejan también
+# los tipos que se registren después.
+EQUIVALENCIAS_TIPO = ALIAS_TIPO
+
+# Patrones compilados una sola vez (no pasan por la caché de re en cada llamada)
+PATRON_EMAIL = re.compile(r"^[\w\.-]+@[\w\.-]+\.[a-zA-Z]{2,}$")
+PATRON_TELEFONO = re.compile(r"^[0-9\s\-\+]{6,}$")
+LARGO_MINIMO_DIRECCION = 5
 
 
 # Valida que el texto tenga el formato de correo usuario@dominio
 def validar_email(email: str) -> str:
     email = email.strip()
-    patron = r"^[\w\.-]+@[\w\.-]+\.[a-zA-Z]{2,}$"
-    if not re.match(patron, email):
+    if not PATRON_EMAIL.match(email):
         raise ValidacionError("Email inválido.")
     return email
 
@@ -20,8 +38,7 @@ def validar_email(email: str) -> str:
 # Acepta números y símbolos comunes en teléfonos (+, espacios, guiones)
 def validar_telefono(telefono: str) -> str:
     telefono = telefono.strip()
-    patron = r"^[0-9\s\-\+]{6,}$"
-    if not re.match(patron, telefono):
+    if not PATRON_TELEFONO.match(telefono):
         raise ValidacionError("Teléfono inválido.")
     return telefono
 
@@ -29,20 +46,88 @@ def validar_telefono(telefono: str) -> str:
 # Dirección mínima para evitar registros vacíos
 def validar_direccion(direccion: str) -> str:
     direccion = direccion.strip()
-    if len(direccion) < 5:
+    if len(direccion) < LARGO_MINIMO_DIRECCION:
         raise ValidacionError("Dirección inválida.")
     return direccion
 
 
 # Normaliza el nombre del tipo de cliente para mapearlo a la clase correcta
 def normalizar_tipo_cliente(tipo: str) -> str:
-    tipo = tipo.strip().lower()
-    equivalencias = {
-        "regular": "regular",
-        "clienteregular": "regular",
-        "premium": "premium",
-        "clientepremium": "premium",
-        "corporativo": "corporativo",
-        "clientecorporativo": "corporativo",
-    }
-    return equivalencias.get(tipo, tipo)
+    return normalizar_tipo(tipo)
+
+
+# -------- Validación por lotes --------
+# Códigos de error por fila (en el orden en que se revisan)
+ERROR_TIPO = "TIPO"
+ERROR_EMAIL = "EMAIL"
+ERROR_TELEFONO = "TELEFONO"
+ERROR_DIRECCION = "DIRECCION"
+
+MENSAJES_ERROR = {
+    ERROR_TIPO: "Tipo de cliente inválido.",
+    ERROR_EMAIL: "Email inválido.",
+    ERROR_TELEFONO: "Teléfono inválido.",
+    ERROR_DIRECCION: "Dirección inválida.",
+}
+
+
+@dataclass
+class ResultadoLote:
+    """Resultado de validar un lote por columnas.
+
+    - mascara[i]: True si la fila i pasó todas las validaciones.
+    - codigos[i]: primer código de error de la fila i (o None).
+    - tipos[i]: tipo normalizado ("regular", "premium", ...).
+    """
+
+    mascara: list[bool]
+    codigos: list[str | None]
+    tipos: list[str]
+
+    @property
+    def validas(self) -> int:
+        return sum(self.mascara)
+
+
+def validar_lote(tipos, emails, telefonos, direcciones) -> ResultadoLote:
+    """Valida columnas completas de una vez (mismas reglas que las funciones
+    individuales, sin excepciones por fila).
+
+    Cada argumento es una secuencia con un valor por fila, ya sin espacios
+    al inicio/fin. Se revisa columna por columna con los patrones
+    compilados, y por fila se informa el primer error en el orden tipo,
+    email, teléfono, dirección.
+    """
+    equivalencias = EQUIVALENCIAS_TIPO
+    tipos_norm = [equivalencias.get(t.lower(), t.lower()) for t in tipos]
+
+    coincide_email = PATRON_EMAIL.match
+    coincide_telefono = PATRON_TELEFONO.match
+    tipo_ok = [t in TIPOS_VALIDOS for t in tipos_norm]
+    email_ok = [coincide_email(e) is not None for e in emails]
+    telefono_ok = [coincide_telefono(t) is not None for t in telefonos]
+    direccion_ok = [len(d) >= LARGO_MINIMO_DIRECCION for d in direcciones]
+
+    mascara = [all(fila) for fila in zip(tipo_ok, email_ok, telefono_ok, direccion_ok)]
+    codigos = [
+        None if ok
+        else ERROR_TIPO if not t
+        else ERROR_EMAIL if not e
+        else ERROR_TELEFONO if not f
+        else ERROR_DIRECCION
+        for ok, t, e, f in zip(mascara, tipo_ok, email_ok, telefono_ok)
+    ]
+    return ResultadoLote(mascara, codigos, tipos_norm)
+
+
+_NO_DIGITOS = re.compile(r"[^0-9]+")
+
+
+# Deja solo los dígitos del teléfono para compararlo sin formato
+def normalizar_telefono(telefono: str) -> str:
+    return _NO_DIGITOS.sub("", telefono or "")
+
+
+# Normaliza el email para usarlo como clave única (búsquedas y duplicados)
+def normalizar_email(email: str) -> str:
+    return (email or "").strip().lower()